@@ -0,0 +1,19 @@
+"""
+NumPy Opcional
+Carga NumPy la primera vez que se necesita, para que importar los módulos
+del proyecto no lo importe y para que todo funcione sin él.
+"""
+
+_numpy = None
+
+
+def cargar_numpy():
+    """Importa NumPy bajo demanda. Retorna el módulo o None si no está instalado."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
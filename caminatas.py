@@ -0,0 +1,295 @@
+"""
+Caminatas Aleatorias y Muestreo de Vecinos
+Avanza muchas caminatas a la vez sobre la exportación CSR de un
+GrafoListaAdyacencia: en cada paso todas las caminatas eligen vecino
+con aritmética de índices (vectorizada con NumPy si está instalado).
+Admite transiciones ponderadas (tablas alias), probabilidad de
+reinicio y el sesgo p/q de node2vec.
+"""
+
+import random
+
+from _numpy_opcional import cargar_numpy
+
+
+def _tablas_alias(indptr, pesos):
+    """
+    Tablas alias (método de Vose) de cada nodo: elegir la arista k del
+    nodo cuesta O(1): se acepta k con probabilidad prob[k] y si no se
+    toma alias[k] (posición relativa dentro del nodo).
+    
+    Returns:
+        Tupla (prob, alias) de listas de longitud E
+    """
+    prob = [1.0] * len(pesos)
+    alias = [0] * len(pesos)
+    for u in range(len(indptr) - 1):
+        inicio, fin = indptr[u], indptr[u + 1]
+        grado = fin - inicio
+        total = sum(pesos[inicio:fin])
+        if grado == 0 or total <= 0:
+            # Sin pesos útiles: vecino uniforme
+            for k in range(grado):
+                alias[inicio + k] = k
+            continue
+        
+        escalados = [pesos[inicio + k] * grado / total for k in range(grado)]
+        pequeños = [k for k, x in enumerate(escalados) if x < 1]
+        grandes = [k for k, x in enumerate(escalados) if x >= 1]
+        while pequeños and grandes:
+            k, j = pequeños.pop(), grandes[-1]
+            prob[inicio + k] = escalados[k]
+            alias[inicio + k] = j
+            escalados[j] -= 1 - escalados[k]
+            if escalados[j] < 1:
+                pequeños.append(grandes.pop())
+        # Lo que queda vale 1 salvo por redondeo
+        for k in pequeños + grandes:
+            prob[inicio + k] = 1.0
+            alias[inicio + k] = k
+    return prob, alias
+
+
+class CaminatasAleatorias:
+    """
+    Generador de caminatas aleatorias por lotes.
+    
+    Las tablas (CSR, alias, índice de aristas para node2vec) se preparan
+    una vez al crear el objeto; cada llamada a generar reutiliza las
+    mismas y avanza todas las caminatas juntas.
+    
+    Con la misma semilla los resultados son reproducibles, pero difieren
+    entre la versión con NumPy y la de Python puro.
+    
+    Uso:
+        caminatas = CaminatasAleatorias(grafo, ponderado=True, semilla=42)
+        caminatas.generar(['A', 'A', 'B'], longitud=10)
+    """
+    
+    def __init__(self, grafo, ponderado=False, reinicio=0.0, p=1.0, q=1.0, semilla=None):
+        """
+        Args:
+            grafo: GrafoListaAdyacencia
+            ponderado: True para elegir vecino en proporción al peso
+            reinicio: Probabilidad de volver al nodo inicial en cada paso
+                (también se vuelve al llegar a un nodo sin salida)
+            p: node2vec, parámetro de retorno (p alto: volver es raro)
+            q: node2vec, parámetro de entrada-salida (q bajo: alejarse,
+                como un DFS; q alto: quedarse cerca, como un BFS)
+            semilla: Semilla del generador aleatorio
+        """
+        if p <= 0 or q <= 0:
+            raise ValueError("p y q deben ser positivos")
+        if not 0 <= reinicio < 1:
+            raise ValueError("La probabilidad de reinicio debe estar en [0, 1)")
+        
+        self.nodos, indptr, indices, pesos = grafo.exportar_csr()
+        self.posicion = {nodo: i for i, nodo in enumerate(self.nodos)}
+        self.reinicio = reinicio
+        self.p = p
+        self.q = q
+        self.node2vec = p != 1 or q != 1
+        self._np = np = cargar_numpy()
+        
+        prob = alias = None
+        if ponderado:
+            prob, alias = _tablas_alias(indptr, pesos)
+        
+        if np is not None:
+            self._rng = np.random.default_rng(semilla)
+            self._indptr = np.frombuffer(indptr, dtype=np.int64)
+            self._indices = np.frombuffer(indices, dtype=np.int64)
+            self._prob = None if prob is None else np.array(prob)
+            self._alias = None if alias is None else np.array(alias, dtype=np.int64)
+            if self.node2vec:
+                # Aristas codificadas como u * V + v y ordenadas: ¿existe
+                # u -> v? con una búsqueda binaria vectorizada
+                n = len(self.nodos)
+                origenes = np.repeat(np.arange(n, dtype=np.int64), np.diff(self._indptr))
+                self._claves = np.unique(origenes * n + self._indices)
+        else:
+            self._rng = random.Random(semilla)
+            self._indptr = indptr.tolist()
+            self._indices = indices.tolist()
+            self._prob = prob
+            self._alias = alias
+            if self.node2vec:
+                self._vecinos = [set(self._indices[self._indptr[u]:self._indptr[u + 1]])
+                                 for u in range(len(self.nodos))]
+    
+    def generar(self, inicios, longitud):
+        """
+        Genera una caminata desde cada nodo de inicios
+        
+        Una caminata sin reinicio termina antes si llega a un nodo sin
+        vecinos de salida.
+        
+        Args:
+            inicios: Nodos de partida (se repiten para varias caminatas)
+            longitud: Número de pasos de cada caminata
+        
+        Returns:
+            Lista de caminatas; cada una es la lista de nodos visitados
+            (como mucho longitud + 1)
+        """
+        nodos = self.nodos
+        filas = self.generar_indices(inicios, longitud)
+        if self._np is not None:
+            filas = filas.tolist()
+        return [[nodos[i] for i in fila if i >= 0] for fila in filas]
+    
+    def generar_indices(self, inicios, longitud):
+        """
+        Como generar, pero con posiciones en self.nodos en lugar de nodos
+        
+        Returns:
+            Matriz de caminatas × (longitud + 1) (array de NumPy o lista de
+            listas) con -1 tras el final de las caminatas que se detienen
+        """
+        origen = [self.posicion[nodo] for nodo in inicios]
+        if self._np is not None:
+            return self._generar_numpy(origen, longitud)
+        return [self._caminar(s, longitud) for s in origen]
+    
+    def muestrear_vecinos(self, nodos, k):
+        """
+        Muestrea k vecinos de cada nodo (con reemplazo; por peso si el
+        generador es ponderado). Útil para construir minilotes de GNN.
+        
+        Returns:
+            Lista con una lista de k vecinos por nodo (vacía si no tiene)
+        """
+        repetidos = [nodo for nodo in nodos for _ in range(k)]
+        origen = [self.posicion[nodo] for nodo in repetidos]
+        if self._np is not None:
+            np = self._np
+            actual = np.array(origen, dtype=np.int64)
+            destinos = self._paso_numpy(actual, np.full(len(actual), -1)).tolist()
+        else:
+            destinos = [self._elegir(s, -1) for s in origen]
+        
+        muestras = []
+        for i in range(len(nodos)):
+            grupo = destinos[i * k:(i + 1) * k]
+            muestras.append([self.nodos[v] for v in grupo if v >= 0])
+        return muestras
+    
+    # ---------- Versión vectorizada ----------
+    
+    def _generar_numpy(self, origen, longitud):
+        np = self._np
+        origen = np.array(origen, dtype=np.int64)
+        caminatas = np.full((len(origen), longitud + 1), -1, dtype=np.int64)
+        caminatas[:, 0] = origen
+        actual = origen.copy()
+        previo = np.full(len(origen), -1, dtype=np.int64)
+        
+        for paso in range(1, longitud + 1):
+            siguiente = self._paso_numpy(actual, previo)
+            previo = actual
+            if self.reinicio > 0:
+                vivos = actual >= 0
+                salta = vivos & ((self._rng.random(len(actual)) < self.reinicio)
+                                 | (siguiente < 0))
+                siguiente[salta] = origen[salta]
+                # Tras reiniciar no hay nodo anterior para node2vec
+                previo = np.where(salta, -1, actual)
+            actual = siguiente
+            caminatas[:, paso] = actual
+            if not (actual >= 0).any():
+                break
+        return caminatas
+    
+    def _paso_numpy(self, actual, previo):
+        """Siguiente nodo de cada caminata (-1 si está detenida o sin salida)"""
+        np = self._np
+        rng = self._rng
+        indptr, indices = self._indptr, self._indices
+        siguiente = np.full(len(actual), -1, dtype=np.int64)
+        pendientes = np.flatnonzero(actual >= 0)
+        
+        # Con node2vec se repite el sorteo para las propuestas rechazadas
+        while len(pendientes):
+            u = actual[pendientes]
+            inicio = indptr[u]
+            grado = indptr[u + 1] - inicio
+            con_salida = grado > 0
+            pendientes, inicio, grado = pendientes[con_salida], inicio[con_salida], grado[con_salida]
+            
+            arista = inicio + (rng.random(len(pendientes)) * grado).astype(np.int64)
+            if self._prob is not None:
+                usar_alias = rng.random(len(arista)) >= self._prob[arista]
+                arista[usar_alias] = inicio[usar_alias] + self._alias[arista[usar_alias]]
+            candidato = indices[arista]
+            
+            if not self.node2vec:
+                siguiente[pendientes] = candidato
+                break
+            
+            anterior = previo[pendientes]
+            maximo = max(1 / self.p, 1.0, 1 / self.q)
+            umbral = rng.random(len(candidato)) * maximo
+            # Solo se busca la arista anterior -> candidato si el sorteo no
+            # decide ya por sí solo (umbral por debajo del menor peso)
+            dudosos = (umbral >= min(1 / self.p, 1.0, 1 / self.q)) & (anterior >= 0)
+            peso = np.full(len(candidato), maximo)
+            peso[dudosos] = np.where(
+                candidato[dudosos] == anterior[dudosos], 1 / self.p,
+                np.where(self._es_arista(anterior[dudosos], candidato[dudosos]), 1.0, 1 / self.q))
+            # El primer paso (sin anterior) es de primer orden
+            acepta = umbral < peso
+            siguiente[pendientes[acepta]] = candidato[acepta]
+            pendientes = pendientes[~acepta]
+        return siguiente
+    
+    def _es_arista(self, u, v):
+        """Para cada par, True si existe la arista u[i] -> v[i]"""
+        np = self._np
+        claves = u * len(self.nodos) + v
+        # Buscar las claves en orden es varias veces más rápido (la
+        # búsqueda binaria recorre la tabla sin saltos aleatorios)
+        orden = np.argsort(claves)
+        posiciones = np.empty_like(orden)
+        posiciones[orden] = np.searchsorted(self._claves, claves[orden])
+        posiciones = np.minimum(posiciones, len(self._claves) - 1)
+        return (self._claves[posiciones] == claves) & (u >= 0)
+    
+    # ---------- Versión en Python puro ----------
+    
+    def _caminar(self, origen, longitud):
+        caminata = [origen] + [-1] * longitud
+        actual, previo = origen, -1
+        for paso in range(1, longitud + 1):
+            siguiente = self._elegir(actual, previo)
+            previo = actual
+            if self.reinicio > 0 and (siguiente < 0 or self._rng.random() < self.reinicio):
+                siguiente, previo = origen, -1
+            if siguiente < 0:
+                break
+            caminata[paso] = actual = siguiente
+        return caminata
+    
+    def _elegir(self, u, previo):
+        """Vecino aleatorio de u según pesos y sesgo node2vec (-1 si no hay)"""
+        rng = self._rng
+        inicio, fin = self._indptr[u], self._indptr[u + 1]
+        if inicio == fin:
+            return -1
+        
+        maximo = max(1 / self.p, 1.0, 1 / self.q)
+        while True:
+            arista = inicio + int(rng.random() * (fin - inicio))
+            if self._prob is not None and rng.random() >= self._prob[arista]:
+                arista = inicio + self._alias[arista]
+            candidato = self._indices[arista]
+            if not self.node2vec or previo < 0:
+                return candidato
+            
+            if candidato == previo:
+                peso = 1 / self.p
+            elif candidato in self._vecinos[previo]:
+                peso = 1.0
+            else:
+                peso = 1 / self.q
+            if rng.random() * maximo < peso:
+                return candidato
@@ -0,0 +1,234 @@
+"""
+Métricas de Centralidad sobre Grafos
+Incluye: PageRank, centralidad de grado e intermediación aproximada (Brandes)
+Trabajan sobre la exportación CSR de GrafoListaAdyacencia y usan NumPy
+si está instalado.
+"""
+
+import random
+from collections import deque
+
+from _numpy_opcional import cargar_numpy
+
+
+# ==================== PAGERANK ====================
+
+def pagerank(grafo, amortiguacion=0.85, tolerancia=1e-6, max_iter=100, ponderado=False):
+    """
+    PageRank por iteración de potencias
+    
+    Cada iteración es un producto matriz dispersa-vector: O(V + E).
+    La masa de los nodos sin salida se reparte uniformemente.
+    
+    Args:
+        grafo: GrafoListaAdyacencia
+        amortiguacion: Probabilidad de seguir una arista (factor d)
+        tolerancia: Se detiene cuando el cambio (norma L1) es menor
+        max_iter: Máximo de iteraciones
+        ponderado: True para repartir según el peso de las aristas
+    
+    Returns:
+        Diccionario {nodo: puntuación}; las puntuaciones suman 1
+    """
+    nodos, indptr, indices, pesos = grafo.exportar_csr()
+    n = len(nodos)
+    if n == 0:
+        return {}
+    
+    np = cargar_numpy()
+    if np is not None:
+        rangos = _pagerank_numpy(np, n, indptr, indices, pesos, amortiguacion,
+                                 tolerancia, max_iter, ponderado)
+    else:
+        rangos = _pagerank_python(n, indptr, indices, pesos, amortiguacion,
+                                  tolerancia, max_iter, ponderado)
+    return dict(zip(nodos, rangos))
+
+
+def _pagerank_numpy(np, n, indptr, indices, pesos, d, tolerancia, max_iter, ponderado):
+    indptr = np.frombuffer(indptr, dtype=np.int64)
+    indices = np.frombuffer(indices, dtype=np.int64)
+    grados = np.diff(indptr)
+    origenes = np.repeat(np.arange(n), grados)
+    
+    if ponderado:
+        pesos = np.frombuffer(pesos, dtype=np.float64)
+        salida = np.bincount(origenes, weights=pesos, minlength=n)
+        factor = pesos / salida[origenes]
+    else:
+        salida = grados.astype(np.float64)
+        factor = 1 / salida[origenes]
+    colgantes = salida == 0
+    
+    x = np.full(n, 1 / n)
+    for _ in range(max_iter):
+        y = np.bincount(indices, weights=x[origenes] * factor, minlength=n)
+        y = d * (y + x[colgantes].sum() / n) + (1 - d) / n
+        cambio = np.abs(y - x).sum()
+        x = y
+        if cambio < tolerancia:
+            break
+    return x.tolist()
+
+
+def _pagerank_python(n, indptr, indices, pesos, d, tolerancia, max_iter, ponderado):
+    salida = [0.0] * n
+    for i in range(n):
+        if ponderado:
+            salida[i] = sum(pesos[indptr[i]:indptr[i + 1]])
+        else:
+            salida[i] = indptr[i + 1] - indptr[i]
+    
+    x = [1 / n] * n
+    for _ in range(max_iter):
+        y = [0.0] * n
+        colgante = 0.0
+        for i in range(n):
+            if salida[i] == 0:
+                colgante += x[i]
+                continue
+            base = x[i] / salida[i]
+            for e in range(indptr[i], indptr[i + 1]):
+                y[indices[e]] += base * pesos[e] if ponderado else base
+        
+        extra = d * colgante / n + (1 - d) / n
+        y = [d * valor + extra for valor in y]
+        cambio = sum(abs(a - b) for a, b in zip(x, y))
+        x = y
+        if cambio < tolerancia:
+            break
+    return x
+
+
+# ==================== CENTRALIDAD DE GRADO ====================
+
+def centralidad_grado(grafo, tipo="total"):
+    """
+    Centralidad de grado normalizada: grado / (V - 1)
+    
+    Args:
+        grafo: GrafoListaAdyacencia
+        tipo: En grafos dirigidos, "salida", "entrada" o "total"
+    
+    Returns:
+        Diccionario {nodo: centralidad}
+    """
+    if tipo not in ("total", "salida", "entrada"):
+        raise ValueError(f"Tipo de grado desconocido: {tipo}")
+    
+    nodos, indptr, indices, _ = grafo.exportar_csr()
+    n = len(nodos)
+    if n <= 1:
+        return {nodo: 1.0 for nodo in nodos}
+    
+    salida = [indptr[i + 1] - indptr[i] for i in range(n)]
+    if not grafo.dirigido or tipo == "salida":
+        grados = salida
+    else:
+        entrada = [0] * n
+        for j in indices:
+            entrada[j] += 1
+        grados = entrada if tipo == "entrada" else [a + b for a, b in zip(salida, entrada)]
+    
+    return {nodo: grado / (n - 1) for nodo, grado in zip(nodos, grados)}
+
+
+# ==================== INTERMEDIACIÓN (BRANDES) ====================
+
+def intermediacion_aproximada(grafo, muestras=None, semilla=None, procesos=None,
+                              normalizada=True):
+    """
+    Centralidad de intermediación por muestreo de orígenes (Brandes)
+    
+    Cada origen cuesta un BFS más la acumulación de dependencias: O(V + E).
+    Con muestras = k se estima el valor exacto escalando por V / k.
+    Las aristas se consideran sin peso.
+    
+    Args:
+        grafo: GrafoListaAdyacencia
+        muestras: Número de orígenes aleatorios (None: todos, valor exacto)
+        semilla: Semilla del muestreo (reproducible)
+        procesos: Número de procesos (None o 1: secuencial)
+        normalizada: Dividir entre el número de pares (V - 1)(V - 2)
+    
+    Returns:
+        Diccionario {nodo: intermediación}
+    """
+    nodos, indptr, indices, _ = grafo.exportar_csr()
+    n = len(nodos)
+    csr = (indptr.tolist(), indices.tolist())
+    
+    if muestras is None or muestras >= n:
+        origenes = list(range(n))
+    else:
+        origenes = random.Random(semilla).sample(range(n), muestras)
+    
+    if procesos is None or procesos <= 1 or len(origenes) < 2:
+        total = _dependencias(csr, origenes)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        
+        trozos = [origenes[i::procesos] for i in range(procesos)]
+        total = [0.0] * n
+        with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_trabajador,
+                                 initargs=(csr,)) as pool:
+            for parcial in pool.map(_dependencias_trabajador, trozos):
+                for i, valor in enumerate(parcial):
+                    total[i] += valor
+    
+    escala = n / len(origenes) if origenes else 0.0
+    if normalizada:
+        escala *= 1 / ((n - 1) * (n - 2)) if n > 2 else 0.0
+    elif not grafo.dirigido:
+        # Cada par no dirigido se cuenta dos veces (s→t y t→s)
+        escala /= 2
+    
+    return {nodo: valor * escala for nodo, valor in zip(nodos, total)}
+
+
+def _dependencias(csr, origenes):
+    """Suma de las dependencias de Brandes desde cada origen"""
+    indptr, indices = csr
+    n = len(indptr) - 1
+    total = [0.0] * n
+    
+    for s in origenes:
+        sigma = [0] * n
+        distancia = [-1] * n
+        predecesores = [[] for _ in range(n)]
+        orden = []
+        
+        sigma[s] = 1
+        distancia[s] = 0
+        cola = deque([s])
+        while cola:
+            v = cola.popleft()
+            orden.append(v)
+            for w in indices[indptr[v]:indptr[v + 1]]:
+                if distancia[w] < 0:
+                    distancia[w] = distancia[v] + 1
+                    cola.append(w)
+                if distancia[w] == distancia[v] + 1:
+                    sigma[w] += sigma[v]
+                    predecesores[w].append(v)
+        
+        delta = [0.0] * n
+        for w in reversed(orden):
+            for v in predecesores[w]:
+                delta[v] += sigma[v] / sigma[w] * (1 + delta[w])
+            if w != s:
+                total[w] += delta[w]
+    
+    return total
+
+
+_csr_trabajador = None
+
+
+def _iniciar_trabajador(csr):
+    global _csr_trabajador
+    _csr_trabajador = csr
+
+
+def _dependencias_trabajador(origenes):
+    return _dependencias(_csr_trabajador, origenes)
@@ -3,15 +3,27 @@ Ejercicio: Estructura de Datos Cola (Queue)
 Implementación de una cola FIFO (First In, First Out)
 """
 
+import heapq
+from collections import deque
+
 class Cola:
     """
     Clase que implementa una Cola (Queue) con estructura FIFO.
     El primer elemento en entrar es el primero en salir.
     """
     
-    def __init__(self):
-        """Inicializa una cola vacía."""
-        self.elementos = []
+    # Métricas de instrumentación (ver metricas.instrumentar)
+    _metricas = None
+    
+    def __init__(self, verboso=True):
+        """
+        Inicializa una cola vacía.
+        
+        Args:
+            verboso: False para no imprimir cada operación (simulaciones)
+        """
+        self.elementos = deque()
+        self.verboso = verboso
     
     def enqueue(self, elemento):
         """
@@ -21,7 +33,11 @@ class Cola:
             elemento: El elemento a añadir
         """
         self.elementos.append(elemento)
-        print(f"✓ {elemento} añadido a la cola")
+        if self._metricas is not None:
+            self._metricas.sumar("cola_encolados")
+            self._metricas.maximo("cola_max", len(self.elementos))
+        if self.verboso:
+            print(f"✓ {elemento} añadido a la cola")
     
     def dequeue(self):
         """
@@ -34,11 +50,15 @@ class Cola:
             IndexError: Si la cola está vacía
         """
         if self.esta_vacia():
-            print("❌ Error: La cola está vacía")
+            if self.verboso:
+                print("❌ Error: La cola está vacía")
             return None
         
-        elemento = self.elementos.pop(0)
-        print(f"✓ {elemento} removido de la cola")
+        elemento = self.elementos.popleft()
+        if self._metricas is not None:
+            self._metricas.sumar("cola_desencolados")
+        if self.verboso:
+            print(f"✓ {elemento} removido de la cola")
         return elemento
     
     def esta_vacia(self):
@@ -75,23 +95,38 @@ class Cola:
         if self.esta_vacia():
             print("Cola vacía: []")
         else:
-            print(f"Cola: {self.elementos}")
+            print(f"Cola: {list(self.elementos)}")
     
     def limpiar(self):
         """Vacía la cola completamente."""
         self.elementos.clear()
-        print("✓ Cola limpiada")
+        if self.verboso:
+            print("✓ Cola limpiada")
 
 
 class ColaConPrioridad:
     """
     Extensión de Cola: Cola con Prioridad.
     Los elementos se ordenan por prioridad (menor número = mayor prioridad).
+    Con la misma prioridad se respeta el orden de llegada.
+    
+    Se guarda como un montículo (heapq): enqueue y dequeue son O(log n).
     """
     
-    def __init__(self):
-        """Inicializa una cola con prioridad vacía."""
+    # Métricas de instrumentación (ver metricas.instrumentar)
+    _metricas = None
+    
+    def __init__(self, verboso=True):
+        """
+        Inicializa una cola con prioridad vacía.
+        
+        Args:
+            verboso: False para no imprimir cada operación (simulaciones)
+        """
+        # Montículo de tuplas (prioridad, orden de llegada, elemento)
         self.elementos = []
+        self.verboso = verboso
+        self._llegadas = 0
     
     def enqueue(self, elemento, prioridad=0):
         """
@@ -101,9 +136,13 @@ class ColaConPrioridad:
             elemento: El elemento a añadir
             prioridad: Nivel de prioridad (0 = máxima prioridad)
         """
-        self.elementos.append((elemento, prioridad))
-        self.elementos.sort(key=lambda x: x[1])  # Ordenar por prioridad
-        print(f"✓ {elemento} (prioridad: {prioridad}) añadido")
+        heapq.heappush(self.elementos, (prioridad, self._llegadas, elemento))
+        self._llegadas += 1
+        if self._metricas is not None:
+            self._metricas.sumar("cola_encolados")
+            self._metricas.maximo("cola_max", len(self.elementos))
+        if self.verboso:
+            print(f"✓ {elemento} (prioridad: {prioridad}) añadido")
     
     def dequeue(self):
         """
@@ -113,191 +152,36 @@ class ColaConPrioridad:
             Tupla (elemento, prioridad)
         """
         if self.esta_vacia():
-            print("❌ Error: La cola está vacía")
+            if self.verboso:
+                print("❌ Error: La cola está vacía")
             return None
         
-        elemento, prioridad = self.elementos.pop(0)
-        print(f"✓ {elemento} (prioridad: {prioridad}) removido")
+        prioridad, _, elemento = heapq.heappop(self.elementos)
+        if self._metricas is not None:
+            self._metricas.sumar("cola_desencolados")
+        if self.verboso:
+            print(f"✓ {elemento} (prioridad: {prioridad}) removido")
         return elemento, prioridad
     
     def esta_vacia(self):
         """Verifica si la cola está vacía."""
         return len(self.elementos) == 0
     
+    def tamaño(self):
+        """Devuelve el número de elementos en la cola."""
+        return len(self.elementos)
+    
     def mostrar(self):
         """Muestra todos los elementos con sus prioridades."""
         if self.esta_vacia():
             print("Cola vacía: []")
         else:
             print("Cola con Prioridad:")
-            for elemento, prioridad in self.elementos:
+            for prioridad, _, elemento in sorted(self.elementos):
                 print(f"  - {elemento} (prioridad: {prioridad})")
 
 
-# ==================== EJEMPLOS DE USO ====================
-
-def ejemplo_cola_basica():
-    """Ejemplo 1: Operaciones básicas de una cola."""
-    print("=" * 50)
-    print("EJEMPLO 1: Cola Básica FIFO")
-    print("=" * 50)
-    
-    cola = Cola()
-    
-    # Enqueue (insertar elementos)
-    cola.enqueue("Cliente 1")
-    cola.enqueue("Cliente 2")
-    cola.enqueue("Cliente 3")
-    cola.enqueue("Cliente 4")
-    
-    cola.mostrar()
-    print(f"\nTamaño de la cola: {cola.tamaño()}")
-    
-    # Dequeue (extraer elementos)
-    print("\nAtendiendo clientes:")
-    cola.dequeue()
-    cola.dequeue()
-    
-    cola.mostrar()
-    print()
-
-
-def ejemplo_banco():
-    """Ejemplo 2: Simulación de un banco."""
-    print("=" * 50)
-    print("EJEMPLO 2: Cola en un Banco")
-    print("=" * 50)
-    
-    banco = Cola()
-    
-    # Clientes llegando
-    clientes = ["Juan", "María", "Pedro", "Ana", "Carlos"]
-    
-    print("Clientes llegando al banco:")
-    for cliente in clientes:
-        banco.enqueue(cliente)
-    
-    banco.mostrar()
-    
-    print("\nAtendimiento en cajas (FIFO):")
-    while not banco.esta_vacia():
-        cliente = banco.dequeue()
-        print(f"  Caja 1 atendiendo a {cliente}")
-    
-    print()
-
-
-def ejemplo_impresora():
-    """Ejemplo 3: Cola de impresión."""
-    print("=" * 50)
-    print("EJEMPLO 3: Cola de Impresora")
-    print("=" * 50)
-    
-    cola_impresion = Cola()
-    
-    documentos = ["documento1.pdf", "documento2.pdf", "documento3.pdf", "documento4.pdf"]
-    
-    print("Documentos enviados a imprimir:")
-    for doc in documentos:
-        cola_impresion.enqueue(doc)
-    
-    cola_impresion.mostrar()
-    
-    print("\nImprimiendo documentos:")
-    contador = 1
-    while not cola_impresion.esta_vacia():
-        doc = cola_impresion.dequeue()
-        print(f"  Impresora procesando: {doc}")
-    
-    print()
-
-
-def ejemplo_cola_prioridad():
-    """Ejemplo 4: Cola con prioridad (Urgencias en un hospital)."""
-    print("=" * 50)
-    print("EJEMPLO 4: Cola con Prioridad (Hospital)")
-    print("=" * 50)
-    
-    urgencias = ColaConPrioridad()
-    
-    # Pacientes con sus niveles de urgencia (0=crítico, 1=grave, 2=moderado, 3=leve)
-    pacientes = [
-        ("Juan Pérez", 2),      # Moderado
-        ("María García", 1),    # Grave
-        ("Carlos López", 0),    # Crítico
-        ("Ana Martínez", 3),    # Leve
-        ("Pedro Sánchez", 1),   # Grave
-    ]
-    
-    print("Pacientes llegando a urgencias:")
-    for paciente, urgencia in pacientes:
-        urgencias.enqueue(paciente, urgencia)
-    
-    urgencias.mostrar()
-    
-    print("\nAtendimiento por prioridad:")
-    while not urgencias.esta_vacia():
-        paciente, prioridad = urgencias.dequeue()
-    
-    print()
-
-
-def ejercicio_interactivo():
-    """Ejercicio interactivo: Crea tu propia cola."""
-    print("=" * 50)
-    print("EJERCICIO INTERACTIVO: Tu Cola")
-    print("=" * 50)
-    
-    mi_cola = Cola()
-    
-    # Menú interactivo
-    while True:
-        print("\nOpciones:")
-        print("1. Enqueue (insertar)")
-        print("2. Dequeue (extraer)")
-        print("3. Ver cola")
-        print("4. Tamaño")
-        print("5. Frente")
-        print("6. Limpiar")
-        print("7. Salir")
-        
-        opcion = input("\nElige una opción (1-7): ").strip()
-        
-        if opcion == "1":
-            elemento = input("¿Qué elemento deseas insertar? ")
-            mi_cola.enqueue(elemento)
-        
-        elif opcion == "2":
-            mi_cola.dequeue()
-        
-        elif opcion == "3":
-            mi_cola.mostrar()
-        
-        elif opcion == "4":
-            print(f"Tamaño de la cola: {mi_cola.tamaño()}")
-        
-        elif opcion == "5":
-            frente = mi_cola.frente()
-            if frente:
-                print(f"Elemento al frente: {frente}")
-        
-        elif opcion == "6":
-            mi_cola.limpiar()
-        
-        elif opcion == "7":
-            print("¡Hasta luego!")
-            break
-        
-        else:
-            print("❌ Opción inválida")
-
-
 if __name__ == "__main__":
-    # Ejecutar ejemplos
-    ejemplo_cola_basica()
-    ejemplo_banco()
-    ejemplo_impresora()
-    ejemplo_cola_prioridad()
+    from ejemplos_cola import main
     
-    # Descomenta la siguiente línea para el ejercicio interactivo
-    # ejercicio_interactivo()
+    main()
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Construcción del Sitio Estático
+Genera index.html y posts/*.html a partir de las plantillas y fuentes de
+sitio/. Las fuentes pueden incluir fragmentos vivos del código:
+
+    {{ codigo cola.py Cola.enqueue }}       código fuente (clase, función o método)
+    {{ salida ejemplos_grafos.ejemplo_x }}  lo que imprime una función de ejemplo
+
+La cabecera de cada fuente da los textos de la página y, opcionalmente,
+"plantilla: archivo.html" (por defecto post.html) y "saltos: crlf" para
+generar la página con finales de línea de Windows.
+
+Solo se reconstruyen las páginas cuyas dependencias (plantilla, fuente,
+módulos citados y los módulos locales que estos importan) cambiaron de
+contenido; las huellas se guardan en .construir_sitio_cache.json.
+
+Uso:
+    python construir_sitio.py              # incremental
+    python construir_sitio.py --todo       # todas las páginas
+    python construir_sitio.py --comprobar  # falla si algo está desactualizado
+"""
+
+import argparse
+import ast
+import hashlib
+import html
+import json
+import re
+import sys
+import textwrap
+from pathlib import Path
+
+
+RAIZ = Path(__file__).resolve().parent
+
+# Marcas {{ nombre argumentos... }} de plantillas y fuentes
+_MARCA = re.compile(r"\{\{\s*(\w+)((?:\s+[^\s}]+)*)\s*\}\}")
+
+# Cabecera de metadatos de cada fuente: <!-- clave: valor ... -->
+_CABECERA = re.compile(r"\A<!--\n(.*?)\n-->\n", re.S)
+
+
+def leer_fuente(ruta):
+    """
+    Lee la fuente de un post
+    
+    Returns:
+        Tupla (metadatos, cuerpo): diccionario de la cabecera y HTML del post
+    
+    Raises:
+        ValueError: Si la fuente no empieza por la cabecera de metadatos
+    """
+    texto = ruta.read_text(encoding="utf-8")
+    cabecera = _CABECERA.match(texto)
+    if cabecera is None:
+        raise ValueError(f"{ruta}: falta la cabecera <!-- clave: valor -->")
+    
+    metadatos = {}
+    for linea in cabecera.group(1).splitlines():
+        clave, _, valor = linea.partition(":")
+        metadatos[clave.strip()] = valor.strip()
+    return metadatos, texto[cabecera.end():]
+
+
+def rellenar(plantilla, valores, origen="plantilla"):
+    """
+    Sustituye las marcas {{ clave }} por valores[clave]
+    
+    Raises:
+        ValueError: Si una marca no tiene valor
+    """
+    def sustituir(marca):
+        clave = marca.group(1)
+        if clave not in valores:
+            raise ValueError(f"{origen}: marca sin valor {marca.group(0)}")
+        return str(valores[clave])
+    
+    return _MARCA.sub(sustituir, plantilla)
+
+
+def _ultima_linea(nodo, lineas):
+    """
+    Última línea (desde 1) de una definición. ast solo da end_lineno
+    desde Python 3.8; antes se busca la última línea con más sangría que
+    la cabecera de la definición.
+    """
+    fin = getattr(nodo, "end_lineno", None)
+    if fin is not None:
+        return fin
+    
+    sangria = len(lineas[nodo.lineno - 1]) - len(lineas[nodo.lineno - 1].lstrip())
+    fin = nodo.body[0].lineno
+    for numero in range(fin, len(lineas)):
+        linea = lineas[numero]
+        if linea.strip():
+            if len(linea) - len(linea.lstrip()) <= sangria:
+                break
+            fin = numero + 1
+    return fin
+
+
+class Construccion:
+    """
+    Una construcción del sitio.
+    
+    Las huellas de los archivos, los árboles sintácticos y las salidas de
+    los ejemplos se calculan como mucho una vez por construcción; las
+    salidas se reutilizan entre construcciones mientras no cambien los
+    módulos de los que dependen.
+    
+    Uso:
+        Construccion().construir()
+    """
+    
+    def __init__(self, raiz=RAIZ):
+        """
+        Args:
+            raiz: Directorio del proyecto (con sitio/, posts/ y los módulos)
+        """
+        self.raiz = Path(raiz)
+        self.sitio = self.raiz / "sitio"
+        self.archivo_cache = self.raiz / ".construir_sitio_cache.json"
+        self.cache = self._cargar_cache()
+        self._huellas = {}
+        self._arboles = {}
+        self._importados = {}
+    
+    def _cargar_cache(self):
+        try:
+            cache = json.loads(self.archivo_cache.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cache = {}
+        cache.setdefault("paginas", {})
+        cache.setdefault("salidas", {})
+        return cache
+    
+    def _guardar_cache(self):
+        self.archivo_cache.write_text(json.dumps(self.cache, indent=1, ensure_ascii=False),
+                                      encoding="utf-8")
+    
+    # ---------- Dependencias ----------
+    
+    def huella(self, ruta):
+        """Hash del contenido de un archivo (None si no existe)"""
+        if ruta not in self._huellas:
+            try:
+                self._huellas[ruta] = hashlib.blake2b(ruta.read_bytes(), digest_size=16).hexdigest()
+            except OSError:
+                self._huellas[ruta] = None
+        return self._huellas[ruta]
+    
+    def _arbol(self, ruta):
+        if ruta not in self._arboles:
+            self._arboles[ruta] = ast.parse(ruta.read_text(encoding="utf-8"), str(ruta))
+        return self._arboles[ruta]
+    
+    def modulos_locales(self, modulo):
+        """
+        Archivos del proyecto de los que depende un módulo: el suyo y los
+        de los módulos locales que importa, directa o indirectamente
+        """
+        pendientes = [modulo]
+        archivos = set()
+        while pendientes:
+            ruta = self.raiz / f"{pendientes.pop()}.py"
+            if ruta in archivos or not ruta.exists():
+                continue
+            archivos.add(ruta)
+            if ruta not in self._importados:
+                nombres = set()
+                for nodo in ast.walk(self._arbol(ruta)):
+                    if isinstance(nodo, ast.Import):
+                        nombres.update(alias.name.split(".")[0] for alias in nodo.names)
+                    elif isinstance(nodo, ast.ImportFrom) and nodo.module and not nodo.level:
+                        nombres.add(nodo.module.split(".")[0])
+                self._importados[ruta] = nombres
+            pendientes.extend(self._importados[ruta])
+        return archivos
+    
+    def dependencias(self, texto):
+        """Archivos de los que dependen las marcas codigo y salida de un texto"""
+        archivos = set()
+        for marca in _MARCA.finditer(texto):
+            argumentos = marca.group(2).split()
+            if marca.group(1) == "codigo" and argumentos:
+                archivos.add(self.raiz / argumentos[0])
+            elif marca.group(1) == "salida" and argumentos:
+                archivos |= self.modulos_locales(argumentos[0].rpartition(".")[0])
+        return archivos
+    
+    def _huella_conjunta(self, archivos):
+        resumen = hashlib.blake2b(digest_size=16)
+        for ruta in sorted(archivos):
+            resumen.update(f"{ruta.relative_to(self.raiz)}:{self.huella(ruta)}\n".encode())
+        return resumen.hexdigest()
+    
+    # ---------- Fragmentos vivos ----------
+    
+    def codigo(self, archivo, nombre):
+        """
+        Código fuente de una clase, función o método (Clase.metodo) de un
+        archivo, con sus decoradores y sin la sangría de la clase
+        
+        Raises:
+            ValueError: Si el nombre no existe en el archivo
+        """
+        ruta = self.raiz / archivo
+        cuerpo = self._arbol(ruta).body
+        nodo = None
+        for parte in nombre.split("."):
+            nodo = next((n for n in cuerpo
+                         if isinstance(n, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef))
+                         and n.name == parte), None)
+            if nodo is None:
+                raise ValueError(f"{archivo}: no se encuentra {nombre}")
+            cuerpo = nodo.body
+        
+        inicio = min([nodo.lineno] + [d.lineno for d in nodo.decorator_list])
+        lineas = ruta.read_text(encoding="utf-8").splitlines()
+        return textwrap.dedent("\n".join(lineas[inicio - 1:_ultima_linea(nodo, lineas)]))
+    
+    def salida(self, referencia):
+        """
+        Lo que imprime la función modulo.funcion, guardado en la caché
+        mientras no cambie ningún módulo local del que dependa
+        """
+        import importlib
+        import io
+        from contextlib import redirect_stdout
+        
+        modulo, _, funcion = referencia.rpartition(".")
+        huella = self._huella_conjunta(self.modulos_locales(modulo))
+        guardada = self.cache["salidas"].get(referencia)
+        if guardada is not None and guardada["huella"] == huella:
+            return guardada["texto"]
+        
+        if str(self.raiz) not in sys.path:
+            sys.path.insert(0, str(self.raiz))
+        capturada = io.StringIO()
+        with redirect_stdout(capturada):
+            getattr(importlib.import_module(modulo), funcion)()
+        texto = capturada.getvalue().strip("\n")
+        self.cache["salidas"][referencia] = {"huella": huella, "texto": texto}
+        return texto
+    
+    def expandir(self, cuerpo, origen):
+        """Sustituye las marcas codigo y salida de un post por bloques <pre>"""
+        def sustituir(marca):
+            directiva, argumentos = marca.group(1), marca.group(2).split()
+            if directiva == "codigo" and len(argumentos) == 2:
+                texto = self.codigo(*argumentos)
+                fuente = f"{argumentos[0]} · {argumentos[1]}"
+            elif directiva == "salida" and len(argumentos) == 1:
+                texto = self.salida(argumentos[0])
+                fuente = f"salida de {argumentos[0]}()"
+            else:
+                raise ValueError(f"{origen}: marca desconocida {marca.group(0)}")
+            return f'<pre title="{html.escape(fuente)}">\n{html.escape(texto, quote=False)}\n</pre>'
+        
+        return _MARCA.sub(sustituir, cuerpo)
+    
+    # ---------- Páginas ----------
+    
+    def construir(self, todo=False, comprobar=False):
+        """
+        Genera las páginas cuyas dependencias cambiaron
+        
+        Args:
+            todo: True para regenerar todas las páginas (las salidas de
+                los ejemplos se siguen tomando de la caché si son vigentes)
+            comprobar: True para no escribir nada y solo informar de las
+                páginas que cambiarían
+        
+        Returns:
+            Lista de rutas (relativas a la raíz) generadas o desactualizadas
+        """
+        plantillas = self.sitio / "plantillas"
+        plantilla_tarjeta = (plantillas / "tarjeta.html").read_text(encoding="utf-8")
+        comunes = {self.raiz / "construir_sitio.py"}
+        leidas = {}
+        
+        cambiadas = []
+        tarjetas = []
+        for fuente in sorted((self.sitio / "posts").glob("*.html")):
+            metadatos, cuerpo = leer_fuente(fuente)
+            slug = fuente.stem
+            tarjetas.append((float(metadatos.get("orden", "inf")), slug, metadatos))
+            
+            destino = f"posts/{slug}.html"
+            plantilla = plantillas / metadatos.get("plantilla", "post.html")
+            huella = self._huella_conjunta(comunes | {plantilla, fuente} | self.dependencias(cuerpo))
+            if not todo and not self._desactualizada(destino, huella):
+                continue
+            
+            if plantilla not in leidas:
+                leidas[plantilla] = plantilla.read_text(encoding="utf-8")
+            valores = dict(metadatos, contenido=self.expandir(cuerpo, fuente).rstrip("\n") + "\n")
+            pagina = rellenar(leidas[plantilla], valores, fuente)
+            if metadatos.get("saltos") == "crlf":
+                pagina = pagina.replace("\n", "\r\n")
+            if self._escribir(destino, pagina, huella, comprobar):
+                cambiadas.append(destino)
+        
+        # La portada depende de la cabecera de todos los posts
+        tarjetas.sort(key=lambda t: (t[0], t[1]))
+        texto = "\n".join(
+            rellenar(plantilla_tarjeta, dict(metadatos, slug=slug), "tarjeta.html")
+            for _, slug, metadatos in tarjetas
+        )
+        plantilla_indice = (plantillas / "index.html").read_text(encoding="utf-8")
+        indice = rellenar(plantilla_indice, {"tarjetas": texto.rstrip("\n")}, "index.html")
+        huella = hashlib.blake2b(indice.encode(), digest_size=16).hexdigest()
+        if (todo or self._desactualizada("index.html", huella)) and \
+                self._escribir("index.html", indice, huella, comprobar):
+            cambiadas.append("index.html")
+        
+        if not comprobar:
+            self._guardar_cache()
+        return cambiadas
+    
+    def _desactualizada(self, destino, huella):
+        """True si cambiaron las dependencias o el archivo generado"""
+        registro = self.cache["paginas"].get(destino)
+        return (registro is None or registro["entrada"] != huella
+                or registro["salida"] != self.huella(self.raiz / destino))
+    
+    def _escribir(self, destino, texto, huella, comprobar):
+        """
+        Escribe la página si su contenido cambió y anota sus huellas
+        
+        Returns:
+            True si el archivo cambió (o cambiaría, con comprobar)
+        """
+        ruta = self.raiz / destino
+        datos = texto.encode("utf-8")
+        cambia = self.huella(ruta) != hashlib.blake2b(datos, digest_size=16).hexdigest()
+        if comprobar:
+            return cambia
+        
+        if cambia:
+            ruta.parent.mkdir(parents=True, exist_ok=True)
+            ruta.write_bytes(datos)
+            self._huellas.pop(ruta, None)
+        self.cache["paginas"][destino] = {"entrada": huella, "salida": self.huella(ruta)}
+        return cambia
+
+
+def main(argumentos=None):
+    """Punto de entrada de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Construye el sitio estático del blog")
+    parser.add_argument("--todo", action="store_true",
+                        help="regenerar todas las páginas aunque no hayan cambiado")
+    parser.add_argument("--comprobar", action="store_true",
+                        help="no escribir; salir con error si alguna página está desactualizada")
+    opciones = parser.parse_args(argumentos)
+    
+    cambiadas = Construccion().construir(todo=opciones.todo, comprobar=opciones.comprobar)
+    for destino in cambiadas:
+        print(f"{'✗ desactualizada' if opciones.comprobar else '✓ generada'}: {destino}")
+    if not cambiadas:
+        print("✓ El sitio está al día")
+    return 1 if opciones.comprobar and cambiadas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
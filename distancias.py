@@ -0,0 +1,105 @@
+"""
+Distancias BFS Incrementales
+Mantiene las distancias en saltos desde un origen mientras el grafo cambia:
+una inserción solo recorre la zona cuyas distancias mejoran y una
+eliminación que rompe el árbol BFS provoca un recálculo completo.
+"""
+
+from collections import deque
+
+
+class DistanciasBFS:
+    """
+    Distancias (número de saltos) desde un origen fijo de un GrafoListaAdyacencia.
+    
+    Se registra en el grafo y se repara con cada agregar_arista, así que
+    consultar una distancia es O(1) aunque el grafo siga creciendo.
+    
+    Uso:
+        desde_madrid = DistanciasBFS(mapa, "Madrid")
+        mapa.agregar_arista("Madrid", "Zaragoza")
+        desde_madrid.distancia("Huesca")
+    """
+    
+    def __init__(self, grafo, origen):
+        """
+        Args:
+            grafo: GrafoListaAdyacencia a seguir
+            origen: Nodo desde el que se miden las distancias
+        """
+        self.grafo = grafo
+        self.origen = origen
+        self.distancias = {}
+        self.recalculos = 0
+        self._recalcular()
+        grafo._agregar_observador(self)
+    
+    def distancia(self, nodo):
+        """
+        Saltos desde el origen hasta nodo - O(1)
+        
+        Returns:
+            Número de saltos, o float('inf') si nodo no es alcanzable
+        """
+        self._sincronizar()
+        return self.distancias.get(nodo, float('inf'))
+    
+    def alcanzables(self):
+        """Retorna un diccionario {nodo: distancia} de los nodos alcanzables"""
+        self._sincronizar()
+        return dict(self.distancias)
+    
+    def desconectar(self):
+        """Deja de seguir los cambios del grafo"""
+        self.grafo._quitar_observador(self)
+    
+    def _sincronizar(self):
+        # Cambios que no pasaron por agregar/eliminar_arista (invalidar_cache)
+        # o eliminaciones pendientes: se recalcula desde cero
+        if self._version != self.grafo.version:
+            self._recalcular()
+    
+    def _recalcular(self):
+        self.recalculos += 1
+        self.distancias = {self.origen: 0}
+        self._propagar(deque([self.origen]))
+        self._version = self.grafo.version
+    
+    def _propagar(self, cola):
+        """BFS que solo avanza por nodos cuya distancia mejora"""
+        distancias = self.distancias
+        adyacencia = self.grafo.grafo
+        while cola:
+            nodo = cola.popleft()
+            siguiente = distancias[nodo] + 1
+            for vecino in adyacencia.get(nodo, ()):
+                if siguiente < distancias.get(vecino, siguiente + 1):
+                    distancias[vecino] = siguiente
+                    cola.append(vecino)
+    
+    def _arista_agregada(self, u, v):
+        if self._version != self.grafo.version - 1:
+            # Había cambios sin procesar: mejor recalcular al consultar
+            return
+        
+        cola = deque()
+        for a, b in ((u, v), (v, u)) if not self.grafo.dirigido else ((u, v),):
+            if a in self.distancias:
+                nueva = self.distancias[a] + 1
+                if nueva < self.distancias.get(b, nueva + 1):
+                    self.distancias[b] = nueva
+                    cola.append(b)
+        self._propagar(cola)
+        self._version = self.grafo.version
+    
+    def _arista_eliminada(self, u, v):
+        if self._version != self.grafo.version - 1:
+            return
+        
+        # Solo importa si la arista podía ser parte de un camino mínimo
+        distancias = self.distancias
+        pares = ((u, v), (v, u)) if not self.grafo.dirigido else ((u, v),)
+        for a, b in pares:
+            if a in distancias and distancias.get(b) == distancias[a] + 1:
+                return
+        self._version = self.grafo.version
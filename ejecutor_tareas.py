@@ -0,0 +1,171 @@
+"""
+Ejecución de Tareas con Dependencias
+Recorre un grafo dirigido acíclico (DAG) de tareas como en el algoritmo
+de Kahn: cada tarea lleva un contador de dependencias pendientes y pasa
+a la cola de listas cuando llega a cero. Las tareas listas se lanzan en
+un pool de hilos o de procesos, empezando por las de camino crítico
+más largo.
+"""
+
+import time
+
+from cola import ColaConPrioridad
+
+
+def orden_topologico(grafo):
+    """
+    Orden topológico de un grafo dirigido (algoritmo de Kahn)
+    
+    Complejidad: O(V + E)
+    
+    Returns:
+        Lista de nodos; cada nodo aparece después de todos sus predecesores
+    
+    Raises:
+        ValueError: Si el grafo no es dirigido o tiene un ciclo
+    """
+    if not grafo.dirigido:
+        raise ValueError("El orden topológico necesita un grafo dirigido")
+    
+    pendientes = {nodo: 0 for nodo in grafo.grafo}
+    for vecinos in grafo.grafo.values():
+        for v in vecinos:
+            pendientes[v] += 1
+    
+    orden = [nodo for nodo, grado in pendientes.items() if grado == 0]
+    for nodo in orden:
+        for v in grafo.grafo[nodo]:
+            pendientes[v] -= 1
+            if pendientes[v] == 0:
+                orden.append(v)
+    
+    if len(orden) < len(pendientes):
+        en_ciclo = [nodo for nodo, grado in pendientes.items() if grado > 0]
+        raise ValueError(f"Las dependencias tienen un ciclo entre: {en_ciclo}")
+    return orden
+
+
+def caminos_criticos(grafo, duraciones=None):
+    """
+    Duración del camino más largo desde cada tarea hasta el final
+    
+    Args:
+        grafo: GrafoListaAdyacencia dirigido y acíclico
+        duraciones: Diccionario {tarea: duración estimada} (por defecto 1)
+    
+    Returns:
+        Diccionario {tarea: duración de la tarea más la de su sucesor crítico}
+    """
+    duraciones = duraciones or {}
+    criticos = {}
+    for nodo in reversed(orden_topologico(grafo)):
+        siguiente = max((criticos[v] for v in grafo.grafo[nodo]), default=0)
+        criticos[nodo] = duraciones.get(nodo, 1) + siguiente
+    return criticos
+
+
+def _cronometrar(funcion):
+    """Ejecuta funcion en el trabajador y mide cuánto tarda"""
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, time.perf_counter() - inicio
+
+
+def ejecutar_tareas(grafo, tareas, trabajadores=4, procesos=False, duraciones=None):
+    """
+    Ejecuta las tareas de un DAG respetando sus dependencias
+    
+    Una arista u -> v significa que v necesita que u haya terminado. Se
+    mantienen como mucho trabajadores tareas en marcha; entre las listas
+    se elige la de camino crítico más largo, que es la que más retrasa
+    el final del proyecto.
+    
+    Args:
+        grafo: GrafoListaAdyacencia dirigido con una tarea por nodo
+        tareas: Diccionario {tarea: función sin argumentos}; con
+            procesos=True las funciones deben poder serializarse
+        trabajadores: Número de hilos o procesos
+        procesos: True para usar un pool de procesos en lugar de hilos
+        duraciones: Estimación {tarea: duración} para el camino crítico
+            (por defecto todas duran 1)
+    
+    Returns:
+        Diccionario {"makespan": segundos totales,
+                     "tareas": {tarea: {"inicio", "fin", "segundos"}},
+                     "resultados": {tarea: valor devuelto},
+                     "ruta_critica": tareas del camino crítico estimado}
+    
+    Raises:
+        ValueError: Si hay un ciclo o nodos sin función asociada
+    """
+    from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor,
+                                    ThreadPoolExecutor, wait)
+    
+    faltan = [nodo for nodo in grafo.grafo if nodo not in tareas]
+    if faltan:
+        raise ValueError(f"Tareas sin función asociada: {faltan}")
+    
+    criticos = caminos_criticos(grafo, duraciones)
+    pendientes = {nodo: 0 for nodo in grafo.grafo}
+    for vecinos in grafo.grafo.values():
+        for v in vecinos:
+            pendientes[v] += 1
+    
+    listas = ColaConPrioridad(verboso=False)
+    for nodo, grado in pendientes.items():
+        if grado == 0:
+            listas.enqueue(nodo, -criticos[nodo])
+    
+    tiempos = {}
+    resultados = {}
+    en_marcha = {}
+    error = None
+    Pool = ProcessPoolExecutor if procesos else ThreadPoolExecutor
+    inicio = time.perf_counter()
+    
+    with Pool(max_workers=trabajadores) as pool:
+        while en_marcha or (not listas.esta_vacia() and error is None):
+            # Lanzar tareas listas mientras haya trabajadores libres
+            while error is None and len(en_marcha) < trabajadores and not listas.esta_vacia():
+                tarea, _ = listas.dequeue()
+                futuro = pool.submit(_cronometrar, tareas[tarea])
+                en_marcha[futuro] = (tarea, time.perf_counter() - inicio)
+            
+            terminados, _ = wait(en_marcha, return_when=FIRST_COMPLETED)
+            for futuro in terminados:
+                tarea, lanzada = en_marcha.pop(futuro)
+                try:
+                    resultados[tarea], segundos = futuro.result()
+                except Exception as e:
+                    # Se dejan terminar las tareas en marcha y no se lanzan más
+                    error = error or e
+                    continue
+                tiempos[tarea] = {
+                    "inicio": lanzada,
+                    "fin": time.perf_counter() - inicio,
+                    "segundos": segundos,
+                }
+                for v in grafo.grafo[tarea]:
+                    pendientes[v] -= 1
+                    if pendientes[v] == 0:
+                        listas.enqueue(v, -criticos[v])
+    
+    if error is not None:
+        raise error
+    
+    return {
+        "makespan": time.perf_counter() - inicio,
+        "tareas": tiempos,
+        "resultados": resultados,
+        "ruta_critica": _ruta_critica(grafo, criticos),
+    }
+
+
+def _ruta_critica(grafo, criticos):
+    """Sigue desde la tarea más crítica al sucesor de mayor camino crítico"""
+    if not criticos:
+        return []
+    ruta = [max(criticos, key=criticos.get)]
+    while grafo.grafo[ruta[-1]]:
+        ruta.append(max(grafo.grafo[ruta[-1]], key=criticos.get))
+    return ruta
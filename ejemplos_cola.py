@@ -0,0 +1,205 @@
+"""
+Ejemplos de Uso: Cola
+Demostraciones de Cola y ColaConPrioridad, incluido el ejercicio
+interactivo. Están separadas de cola.py para que importar las
+estructuras no cargue el código de los ejemplos.
+"""
+
+from cola import Cola, ColaConPrioridad
+from simulacion import Simulacion, exponencial
+
+
+# ==================== EJEMPLOS DE USO ====================
+
+def ejemplo_cola_basica():
+    """Ejemplo 1: Operaciones básicas de una cola."""
+    print("=" * 50)
+    print("EJEMPLO 1: Cola Básica FIFO")
+    print("=" * 50)
+    
+    cola = Cola()
+    
+    # Enqueue (insertar elementos)
+    cola.enqueue("Cliente 1")
+    cola.enqueue("Cliente 2")
+    cola.enqueue("Cliente 3")
+    cola.enqueue("Cliente 4")
+    
+    cola.mostrar()
+    print(f"\nTamaño de la cola: {cola.tamaño()}")
+    
+    # Dequeue (extraer elementos)
+    print("\nAtendiendo clientes:")
+    cola.dequeue()
+    cola.dequeue()
+    
+    cola.mostrar()
+    print()
+
+
+def ejemplo_banco():
+    """Ejemplo 2: Simulación de un banco."""
+    print("=" * 50)
+    print("EJEMPLO 2: Cola en un Banco")
+    print("=" * 50)
+    
+    banco = Cola()
+    
+    # Clientes llegando
+    clientes = ["Juan", "María", "Pedro", "Ana", "Carlos"]
+    
+    print("Clientes llegando al banco:")
+    for cliente in clientes:
+        banco.enqueue(cliente)
+    
+    banco.mostrar()
+    
+    print("\nAtendimiento en cajas (FIFO):")
+    while not banco.esta_vacia():
+        cliente = banco.dequeue()
+        print(f"  Caja 1 atendiendo a {cliente}")
+    
+    print()
+
+
+def ejemplo_impresora():
+    """Ejemplo 3: Cola de impresión."""
+    print("=" * 50)
+    print("EJEMPLO 3: Cola de Impresora")
+    print("=" * 50)
+    
+    cola_impresion = Cola()
+    
+    documentos = ["documento1.pdf", "documento2.pdf", "documento3.pdf", "documento4.pdf"]
+    
+    print("Documentos enviados a imprimir:")
+    for doc in documentos:
+        cola_impresion.enqueue(doc)
+    
+    cola_impresion.mostrar()
+    
+    print("\nImprimiendo documentos:")
+    contador = 1
+    while not cola_impresion.esta_vacia():
+        doc = cola_impresion.dequeue()
+        print(f"  Impresora procesando: {doc}")
+    
+    print()
+
+
+def ejemplo_cola_prioridad():
+    """Ejemplo 4: Cola con prioridad (Urgencias en un hospital)."""
+    print("=" * 50)
+    print("EJEMPLO 4: Cola con Prioridad (Hospital)")
+    print("=" * 50)
+    
+    urgencias = ColaConPrioridad()
+    
+    # Pacientes con sus niveles de urgencia (0=crítico, 1=grave, 2=moderado, 3=leve)
+    pacientes = [
+        ("Juan Pérez", 2),      # Moderado
+        ("María García", 1),    # Grave
+        ("Carlos López", 0),    # Crítico
+        ("Ana Martínez", 3),    # Leve
+        ("Pedro Sánchez", 1),   # Grave
+    ]
+    
+    print("Pacientes llegando a urgencias:")
+    for paciente, urgencia in pacientes:
+        urgencias.enqueue(paciente, urgencia)
+    
+    urgencias.mostrar()
+    
+    print("\nAtendimiento por prioridad:")
+    while not urgencias.esta_vacia():
+        paciente, prioridad = urgencias.dequeue()
+    
+    print()
+
+
+def ejemplo_simulacion_banco():
+    """Ejemplo 5: ¿Cuántas cajas necesita el banco? (simulación con tiempos)"""
+    print("=" * 50)
+    print("EJEMPLO 5: Simulación del Banco con Varias Cajas")
+    print("=" * 50)
+    
+    # Llega un cliente cada 2 minutos de media y cada caja tarda 3 minutos
+    for cajas in (2, 3, 4):
+        banco = Simulacion(exponencial(1 / 2), exponencial(1 / 3), servidores=cajas, semilla=1)
+        informe = banco.ejecutar(10000)
+        espera = informe.percentiles((50, 90))
+        print(f"  {cajas} cajas: espera mediana {espera[50]:.1f} min, "
+              f"p90 {espera[90]:.1f} min, ocupación {informe.utilizacion:.0%}")
+    
+    print()
+
+
+def ejercicio_interactivo():
+    """Ejercicio interactivo: Crea tu propia cola."""
+    print("=" * 50)
+    print("EJERCICIO INTERACTIVO: Tu Cola")
+    print("=" * 50)
+    
+    mi_cola = Cola()
+    
+    # Menú interactivo
+    while True:
+        print("\nOpciones:")
+        print("1. Enqueue (insertar)")
+        print("2. Dequeue (extraer)")
+        print("3. Ver cola")
+        print("4. Tamaño")
+        print("5. Frente")
+        print("6. Limpiar")
+        print("7. Salir")
+        
+        opcion = input("\nElige una opción (1-7): ").strip()
+        
+        if opcion == "1":
+            elemento = input("¿Qué elemento deseas insertar? ")
+            mi_cola.enqueue(elemento)
+        
+        elif opcion == "2":
+            mi_cola.dequeue()
+        
+        elif opcion == "3":
+            mi_cola.mostrar()
+        
+        elif opcion == "4":
+            print(f"Tamaño de la cola: {mi_cola.tamaño()}")
+        
+        elif opcion == "5":
+            frente = mi_cola.frente()
+            if frente:
+                print(f"Elemento al frente: {frente}")
+        
+        elif opcion == "6":
+            mi_cola.limpiar()
+        
+        elif opcion == "7":
+            print("¡Hasta luego!")
+            break
+        
+        else:
+            print("❌ Opción inválida")
+
+
+def main(interactivo=False):
+    """
+    Ejecuta todos los ejemplos
+    
+    Args:
+        interactivo: True para terminar con el ejercicio interactivo
+    """
+    ejemplo_cola_basica()
+    ejemplo_banco()
+    ejemplo_impresora()
+    ejemplo_cola_prioridad()
+    ejemplo_simulacion_banco()
+    
+    if interactivo:
+        ejercicio_interactivo()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Ejemplos de Uso: Grafos
+Demostraciones de GrafoListaAdyacencia y GrafoMatrizAdyacencia. Están
+separadas de grafos.py para que importar las estructuras no cargue
+el código de los ejemplos.
+"""
+
+from grafos import GrafoListaAdyacencia, GrafoMatrizAdyacencia, reconstruir_camino
+
+
+# ==================== EJEMPLOS DE USO ====================
+
+def ejemplo_lista_adyacencia():
+    """Ejemplo de uso: Lista de Adyacencia"""
+    print("=" * 60)
+    print("EJEMPLO 1: Lista de Adyacencia")
+    print("=" * 60)
+    
+    # Crear grafo no dirigido
+    g = GrafoListaAdyacencia(dirigido=False)
+    
+    # Agregar aristas
+    g.agregar_arista('A', 'B')
+    g.agregar_arista('A', 'D')
+    g.agregar_arista('B', 'C')
+    g.agregar_arista('B', 'D')
+    g.agregar_arista('C', 'D')
+    g.agregar_arista('C', 'E')
+    
+    # Mostrar
+    g.mostrar()
+    
+    # BFS
+    print("\nBFS desde A:", g.bfs('A'))
+    
+    # DFS
+    print("DFS desde A (iterativo):", g.dfs_iterativo('A'))
+    print("DFS desde A (recursivo):", g.dfs_recursivo('A'))
+    
+    # Detectar ciclo
+    print(f"¿Tiene ciclo?: {g.tiene_ciclo()}")
+    
+    # Componentes conexas
+    print("Componentes conexas:", g.componentes_conexas())
+    print()
+
+
+def ejemplo_matriz_adyacencia():
+    """Ejemplo de uso: Matriz de Adyacencia"""
+    print("=" * 60)
+    print("EJEMPLO 2: Matriz de Adyacencia")
+    print("=" * 60)
+    
+    # Crear grafo no dirigido
+    g = GrafoMatrizAdyacencia(5, dirigido=False)
+    
+    # Agregar aristas (usando índices 0-4)
+    g.agregar_arista(0, 1)  # A-B
+    g.agregar_arista(0, 3)  # A-D
+    g.agregar_arista(1, 2)  # B-C
+    g.agregar_arista(1, 3)  # B-D
+    g.agregar_arista(2, 3)  # C-D
+    g.agregar_arista(2, 4)  # C-E
+    
+    # Mostrar
+    g.mostrar()
+    
+    # Verificar aristas
+    print(f"\n¿Existe arista 0-1? {g.existe_arista(0, 1)}")
+    print(f"¿Existe arista 0-4? {g.existe_arista(0, 4)}")
+    
+    # BFS
+    print("\nBFS desde 0:", g.bfs(0))
+    
+    # DFS
+    print("DFS desde 0:", g.dfs(0))
+    print()
+
+
+def ejemplo_grafo_ponderado():
+    """Ejemplo de uso: Grafo Ponderado"""
+    print("=" * 60)
+    print("EJEMPLO 3: Grafo Ponderado (Matriz)")
+    print("=" * 60)
+    
+    # Crear grafo ponderado
+    g = GrafoMatrizAdyacencia(5, dirigido=False, ponderado=True)
+    
+    # Agregar aristas con pesos
+    g.agregar_arista(0, 1, 5)   # A-B: 5
+    g.agregar_arista(0, 3, 3)   # A-D: 3
+    g.agregar_arista(1, 2, 8)   # B-C: 8
+    g.agregar_arista(1, 3, 2)   # B-D: 2
+    g.agregar_arista(2, 3, 1)   # C-D: 1
+    g.agregar_arista(2, 4, 4)   # C-E: 4
+    
+    # Mostrar
+    g.mostrar()
+    
+    # Obtener pesos
+    print(f"\nPeso de arista 0-1: {g.obtener_peso(0, 1)}")
+    print(f"Peso de arista 0-2: {g.obtener_peso(0, 2)}")
+    
+    # Caminos mínimos entre todos los pares
+    distancias, predecesores = g.floyd_warshall(con_predecesores=True)
+    print(f"Distancia mínima 0-2: {distancias[0][2]}")
+    print(f"Camino mínimo 0-2: {reconstruir_camino(predecesores, 0, 2)}")
+    print()
+
+
+def ejemplo_grafo_dirigido():
+    """Ejemplo de uso: Grafo Dirigido"""
+    print("=" * 60)
+    print("EJEMPLO 4: Grafo Dirigido (Lista Adyacencia)")
+    print("=" * 60)
+    
+    # Crear grafo dirigido
+    g = GrafoListaAdyacencia(dirigido=True)
+    
+    # Agregar aristas dirigidas
+    g.agregar_arista('A', 'B')
+    g.agregar_arista('A', 'C')
+    g.agregar_arista('B', 'C')
+    g.agregar_arista('B', 'D')
+    g.agregar_arista('C', 'D')
+    g.agregar_arista('D', 'E')
+    
+    # Mostrar
+    g.mostrar()
+    
+    # BFS
+    print("\nBFS desde A:", g.bfs('A'))
+    
+    # DFS
+    print("DFS desde A:", g.dfs_iterativo('A'))
+    print()
+
+
+def main():
+    """Ejecuta todos los ejemplos"""
+    ejemplo_lista_adyacencia()
+    ejemplo_matriz_adyacencia()
+    ejemplo_grafo_ponderado()
+    ejemplo_grafo_dirigido()
+    
+    print("=" * 60)
+    print("Ejemplos completados exitosamente")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,14 @@ Ejemplos Prácticos Adicionales: Grafos y Colas en Aplicaciones Reales
 Estos son ejemplos que complementan el blog técnico
 """
 
-from collections import deque
+import time
+from functools import partial
+
 from grafos import GrafoListaAdyacencia
-from cola import Cola
+from distancias import DistanciasBFS
+from ejecutor_tareas import ejecutar_tareas, orden_topologico
+from flujo import flujo_maximo
+from triangulos import coeficientes_agrupamiento, contar_triangulos
 
 
 # ==================== EJEMPLO 1: REDES SOCIALES ====================
@@ -31,6 +36,7 @@ def ejemplo_red_social():
         ("Pedro", "Carlos"),
         ("Pedro", "Luis"),
         ("Ana", "Sofia"),
+        ("Ana", "Luis"),
     ]
     
     for persona1, persona2 in amistades:
@@ -42,20 +48,21 @@ def ejemplo_red_social():
     # Buscar amigos de un usuario
     usuario = "Juan"
     print(f"\n✓ Amigos de {usuario}:")
-    for amigo, _ in red_social.grafo[usuario]:
+    for amigo, _ in red_social.obtener_vecinos(usuario):
         print(f"  - {amigo}")
     
-    # Buscar amigos de amigos (BFS)
-    sugerencias = set()
-    for amigo, _ in red_social.grafo[usuario]:
-        for amigo_de_amigo, _ in red_social.grafo[amigo]:
-            if amigo_de_amigo != usuario and amigo_de_amigo not in \
-               [a for a, _ in red_social.grafo[usuario]]:
-                sugerencias.add(amigo_de_amigo)
+    # Buscar amigos de amigos, ordenados por amigos en común
+    sugerencias = red_social.sugerencias(usuario, k=5)
     
     print(f"\n✓ Sugerencias de amistad para {usuario}:")
-    for sugerencia in sugerencias:
-        print(f"  - {sugerencia} (amigo de amigos)")
+    for sugerencia, comunes in sugerencias:
+        print(f"  - {sugerencia} ({comunes} amigo(s) en común)")
+    
+    # Coeficiente de agrupamiento: ¿cuántos de mis amigos son amigos entre sí?
+    print(f"\n✓ Triángulos de amistad: {contar_triangulos(red_social)}")
+    print("✓ Coeficiente de agrupamiento:")
+    for persona, coeficiente in coeficientes_agrupamiento(red_social).items():
+        print(f"  - {persona}: {coeficiente:.2f}")
 
 
 # ==================== EJEMPLO 2: CIUDADES Y CARRETERAS ====================
@@ -89,31 +96,23 @@ def ejemplo_mapa_ciudades():
     print("\nMapa de conexiones:")
     mapa.mostrar()
     
-    # BFS para encontrar ruta más corta
+    # BFS bidireccional para encontrar la ruta más corta
     inicio = "Madrid"
     fin = "Huesca"
     
-    visitados = set()
-    cola = deque([(inicio, [inicio])])
-    visitados.add(inicio)
-    
-    ruta = None
-    while cola and not ruta:
-        ciudad_actual, camino = cola.popleft()
-        
-        if ciudad_actual == fin:
-            ruta = camino
-            break
-        
-        for vecino, _ in mapa.grafo[ciudad_actual]:
-            if vecino not in visitados:
-                visitados.add(vecino)
-                cola.append((vecino, camino + [vecino]))
+    ruta, saltos = mapa.camino_mas_corto(inicio, fin)
     
     if ruta:
         print(f"\n✓ Ruta más corta de {inicio} a {fin}:")
         print(f"  {' → '.join(ruta)}")
-        print(f"  Distancia: {len(ruta) - 1} saltos")
+        print(f"  Distancia: {saltos} saltos")
+    
+    # Distancias desde Madrid mantenidas mientras el mapa crece
+    desde_madrid = DistanciasBFS(mapa, inicio)
+    print(f"\n✓ Saltos de {inicio} a Zaragoza: {desde_madrid.distancia('Zaragoza')}")
+    mapa.agregar_arista("Valencia", "Zaragoza")
+    print(f"  Tras abrir Valencia-Zaragoza: {desde_madrid.distancia('Zaragoza')} "
+          f"(reparado sin repetir el BFS)")
 
 
 # ==================== EJEMPLO 3: SISTEMA DE ATENCIÓN AL CLIENTE ====================
@@ -235,19 +234,20 @@ def ejemplo_trafico_ciudades():
     # Grafo dirigido de tráfico
     trafico = GrafoListaAdyacencia(dirigido=True)
     
-    # Rutas con sentidos únicos (avenidas de una sola dirección)
+    # Rutas con sentidos únicos (avenidas de una sola dirección) y su
+    # capacidad en coches por hora
     rutas = [
-        ("Av. Norte", "Centro"),
-        ("Centro", "Av. Este"),
-        ("Centro", "Av. Oeste"),
-        ("Av. Este", "Zona Industrial"),
-        ("Av. Oeste", "Zona Residencial"),
-        ("Zona Industrial", "Autopista"),
-        ("Zona Residencial", "Autopista"),
+        ("Av. Norte", "Centro", 1200),
+        ("Centro", "Av. Este", 500),
+        ("Centro", "Av. Oeste", 800),
+        ("Av. Este", "Zona Industrial", 600),
+        ("Av. Oeste", "Zona Residencial", 400),
+        ("Zona Industrial", "Autopista", 700),
+        ("Zona Residencial", "Autopista", 900),
     ]
     
-    for origen, destino in rutas:
-        trafico.agregar_arista(origen, destino)
+    for origen, destino, capacidad in rutas:
+        trafico.agregar_arista(origen, destino, capacidad)
     
     print("\nRed de tráfico (direccional):")
     trafico.mostrar()
@@ -258,6 +258,29 @@ def ejemplo_trafico_ciudades():
     accesibles = trafico.dfs_iterativo(entrada)
     for lugar in accesibles:
         print(f"  - {lugar}")
+    
+    # Alcanzabilidad inversa: ¿qué calles llevan a la autopista?
+    salida = "Autopista"
+    print(f"\n✓ Calles que llegan directamente a {salida}: {trafico.predecesores(salida)}")
+    print(f"✓ Lugares desde los que se llega a {salida}:")
+    for lugar in trafico.bfs_inverso(salida)[1:]:
+        print(f"  - {lugar}")
+    
+    # Zonas mutuamente alcanzables (componentes fuertemente conexas)
+    componentes = trafico.componentes_fuertemente_conexas()
+    ciclicas = [c for c in componentes if len(c) > 1]
+    print(f"\n✓ Componentes fuertemente conexas: {len(componentes)}")
+    if not ciclicas:
+        print("  Ninguna zona permite volver al punto de partida (red acíclica)")
+    for componente in ciclicas:
+        print(f"  - {', '.join(componente)}")
+    
+    # Capacidad de la red: flujo máximo y calles que hacen de cuello de botella
+    capacidad, flujos, corte = flujo_maximo(trafico, entrada, salida)
+    print(f"\n✓ Coches por hora de {entrada} a {salida}: {capacidad:g}")
+    for (origen, destino), coches in flujos.items():
+        print(f"  {origen} → {destino}: {coches:g}")
+    print(f"✓ Cuellos de botella (corte mínimo): {corte}")
 
 
 # ==================== EJEMPLO 6: TAREAS CON DEPENDENCIAS ====================
@@ -289,32 +312,45 @@ def ejemplo_tareas_dependencias():
     print("\nDependencias del proyecto:")
     proyecto.mostrar()
     
-    # Orden correcto (DFS inverso simularía ordenamiento topológico)
+    # Orden topológico: cada tarea después de sus dependencias
     print("\n✓ Orden sugerido de ejecución:")
-    tareas_ordenadas = proyecto.dfs_iterativo("Diseño")
+    tareas_ordenadas = orden_topologico(proyecto)
     for i, tarea in enumerate(tareas_ordenadas, 1):
         print(f"  {i}. {tarea}")
+    
+    # Ejecución en paralelo con 2 trabajadores (días simulados con sleep)
+    dias = {"Diseño": 2, "Desarrollo": 5, "Testing": 3, "Documentación": 2, "Deploy": 1}
+    trabajos = {tarea: partial(time.sleep, d / 100) for tarea, d in dias.items()}
+    informe = ejecutar_tareas(proyecto, trabajos, trabajadores=2, duraciones=dias)
+    print(f"\n✓ Ruta crítica: {' → '.join(informe['ruta_critica'])}")
+    for tarea, datos in sorted(informe["tareas"].items(), key=lambda t: t[1]["inicio"]):
+        print(f"  {tarea}: {datos['inicio'] * 100:.0f} → {datos['fin'] * 100:.0f} días")
+    print(f"  Duración total: {informe['makespan'] * 100:.0f} días")
 
 
 # ==================== MAIN ====================
 
-if __name__ == "__main__":
+def main():
+    """Ejecuta todos los ejemplos prácticos"""
     print("\n" + "█"*60)
     print("█ EJEMPLOS PRÁCTICOS: GRAFOS Y COLAS EN APLICACIONES REALES")
     print("█"*60)
     
+    ejemplo_red_social()
+    ejemplo_mapa_ciudades()
+    ejemplo_cola_atencion()
+    ejemplo_componentes_conectados()
+    ejemplo_trafico_ciudades()
+    ejemplo_tareas_dependencias()
+    
+    print("\n" + "█"*60)
+    print("█ TODOS LOS EJEMPLOS COMPLETADOS EXITOSAMENTE")
+    print("█"*60)
+
+
+if __name__ == "__main__":
     try:
-        ejemplo_red_social()
-        ejemplo_mapa_ciudades()
-        ejemplo_cola_atencion()
-        ejemplo_componentes_conectados()
-        ejemplo_trafico_ciudades()
-        ejemplo_tareas_dependencias()
-        
-        print("\n" + "█"*60)
-        print("█ TODOS LOS EJEMPLOS COMPLETADOS EXITOSAMENTE")
-        print("█"*60)
-        
+        main()
     except Exception as e:
         print(f"\n❌ Error: {e}")
         import traceback
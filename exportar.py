@@ -0,0 +1,344 @@
+"""
+Salida y Exportación de Grafos
+Escribe grafos en cualquier objeto tipo archivo a través de un único
+escritor con buffer: una escritura por bloque de texto en lugar de un
+print por nodo o por celda. Permite paginar y mostrar solo el principio
+y el final, y exporta a DOT, GraphML y JSON arista a arista, sin
+construir el documento completo en memoria.
+"""
+
+import heapq
+import json
+import sys
+
+from grafos import GrafoMatrizAdyacencia
+
+
+# Caracteres acumulados antes de escribir en la salida
+_TAM_BUFFER = 1 << 16
+
+
+class Escritor:
+    """
+    Acumula texto y lo escribe en la salida en bloques grandes.
+    
+    Uso:
+        with Escritor(archivo) as escritor:
+            escritor.linea("hola")
+    """
+    
+    def __init__(self, salida=None, tam_buffer=_TAM_BUFFER):
+        """
+        Args:
+            salida: Objeto con write (por defecto sys.stdout) o ruta de
+                un archivo, que se abre y se cierra con el escritor
+            tam_buffer: Caracteres acumulados antes de cada escritura
+        """
+        self._propia = isinstance(salida, str)
+        if self._propia:
+            salida = open(salida, "w", encoding="utf-8")
+        elif salida is None:
+            salida = sys.stdout
+        self.salida = salida
+        self.tam_buffer = tam_buffer
+        self._partes = []
+        self._pendiente = 0
+    
+    def escribir(self, texto):
+        """Añade texto al buffer"""
+        self._partes.append(texto)
+        self._pendiente += len(texto)
+        if self._pendiente >= self.tam_buffer:
+            self.vaciar()
+    
+    def linea(self, texto=""):
+        """Añade texto y un salto de línea"""
+        self.escribir(texto + "\n")
+    
+    def vaciar(self):
+        """Escribe en la salida todo lo acumulado"""
+        if self._partes:
+            self.salida.write("".join(self._partes))
+            self._partes.clear()
+            self._pendiente = 0
+    
+    def cerrar(self):
+        """Vacía el buffer (y cierra la salida si la abrió el escritor)"""
+        self.vaciar()
+        if self._propia:
+            self.salida.close()
+        elif hasattr(self.salida, "flush"):
+            self.salida.flush()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+# ==================== PAGINACIÓN ====================
+
+def ventana(total, limite=None, desde=0, final=0):
+    """
+    Posiciones a mostrar de una secuencia de total elementos
+    
+    Args:
+        total: Número de elementos
+        limite: Máximo de elementos desde la posición desde (None: todos)
+        desde: Primera posición mostrada (para paginar)
+        final: Elementos del final que se muestran además, tras un salto
+    
+    Returns:
+        Tupla (cabeza, cola) de rangos de posiciones; cola está vacía si
+        no hay salto entre los dos tramos
+    """
+    desde = min(max(desde, 0), total)
+    fin = total if limite is None else min(total, desde + limite)
+    if final <= 0 or fin >= total:
+        return range(desde, fin), range(0)
+    inicio_cola = max(fin, total - final)
+    if inicio_cola == fin:
+        # Los dos tramos se tocan: no hay nada que omitir entre ellos
+        return range(desde, total), range(0)
+    return range(desde, fin), range(inicio_cola, total)
+
+
+def _omitidos(escritor, cantidad, que):
+    if cantidad > 0:
+        escritor.linea(f"  ... ({cantidad} {que} omitidos)")
+
+
+# ==================== MOSTRAR ====================
+
+def mostrar_lista(grafo, salida=None, limite=None, desde=0, final=0):
+    """
+    Escribe la lista de adyacencia de un GrafoListaAdyacencia, un nodo por
+    línea y en orden de nodo
+    
+    Con limite solo se ordenan los nodos que se muestran (heapq), en
+    lugar de todos.
+    
+    Args:
+        grafo: GrafoListaAdyacencia
+        salida: Objeto tipo archivo o ruta (por defecto sys.stdout)
+        limite, desde, final: Nodos mostrados (ver ventana)
+    """
+    claves = grafo.grafo.keys()
+    cabeza, cola = ventana(len(claves), limite, desde, final)
+    if limite is None and not cola:
+        nodos_cabeza = sorted(claves)[cabeza.start:]
+    else:
+        nodos_cabeza = heapq.nsmallest(cabeza.stop, claves)[cabeza.start:]
+    nodos_cola = heapq.nlargest(len(cola), claves)[::-1] if cola else []
+    
+    with Escritor(salida) as escritor:
+        escritor.linea("\nLista de Adyacencia:")
+        _omitidos(escritor, cabeza.start, "nodos")
+        for nodo in nodos_cabeza:
+            escritor.linea(_fila_lista(grafo, nodo))
+        if cola:
+            _omitidos(escritor, cola.start - cabeza.stop, "nodos")
+        for nodo in nodos_cola:
+            escritor.linea(_fila_lista(grafo, nodo))
+        if not cola:
+            _omitidos(escritor, len(claves) - cabeza.stop, "nodos")
+
+
+def _peso(peso):
+    """Texto exacto de un peso: repr, sin el .0 de los float enteros (3.0 -> 3)"""
+    if isinstance(peso, float):
+        return str(int(peso)) if peso.is_integer() else repr(float(peso))
+    return repr(peso)
+
+
+def _fila_lista(grafo, nodo):
+    vecinos = grafo.grafo[nodo]
+    if grafo.pesos is None:
+        texto = ", ".join(map(str, vecinos))
+    else:
+        texto = ", ".join([f"{v}({_peso(p)})" for v, p in zip(vecinos, grafo.pesos.get(nodo, ()))])
+    return f"  {nodo}: [{texto}]"
+
+
+class _Celdas(dict):
+    """Texto de cada valor de celda, calculado una vez por valor distinto"""
+    
+    def __init__(self, ponderado):
+        super().__init__()
+        self.ponderado = ponderado
+    
+    def __missing__(self, valor):
+        if self.ponderado and valor == float('inf'):
+            texto = "  ∞ "
+        else:
+            texto = f"{_peso(valor):>4}"
+        self[valor] = texto
+        return texto
+
+
+def mostrar_matriz(grafo, salida=None, limite=None, desde=0, final=0):
+    """
+    Escribe la matriz de un GrafoMatrizAdyacencia, una línea por fila
+    
+    La ventana se aplica a filas y columnas: con limite=20 y final=5 se
+    ven las esquinas de la matriz sin recorrer el resto. No reserva la
+    matriz completa si el grafo aún es disperso.
+    
+    Args:
+        grafo: GrafoMatrizAdyacencia
+        salida: Objeto tipo archivo o ruta (por defecto sys.stdout)
+        limite, desde, final: Filas y columnas mostradas (ver ventana)
+    """
+    tramos = [tramo for tramo in ventana(grafo.V, limite, desde, final) if tramo]
+    celdas = _Celdas(grafo.ponderado)
+    salto = "  … " if len(tramos) > 1 else ""
+    
+    with Escritor(salida) as escritor:
+        escritor.linea("\nMatriz de Adyacencia:")
+        escritor.linea("   " + salto.join("".join(f"{j:4}" for j in tramo) for tramo in tramos))
+        for k, filas in enumerate(tramos):
+            if k:
+                escritor.linea("  ⋮")
+            for i in filas:
+                texto = salto.join(
+                    "".join(map(celdas.__getitem__, _valores_fila(grafo, i, tramo)))
+                    for tramo in tramos
+                )
+                escritor.linea(f"{i}  {texto}")
+
+
+def _valores_fila(grafo, i, columnas):
+    """Valores de la fila i en el rango de columnas, densa o dispersa"""
+    if grafo.es_densa():
+        return grafo.grafo[i][columnas.start:columnas.stop]
+    
+    valores = [grafo._vacio] * len(columnas)
+    if grafo.ponderado and i in columnas:
+        valores[i - columnas.start] = 0
+    for j, peso in grafo._filas.get(i, {}).items():
+        if j in columnas:
+            valores[j - columnas.start] = peso
+    return valores
+
+
+# ==================== EXPORTACIÓN ====================
+
+def _nodos_y_aristas(grafo):
+    """
+    Returns:
+        Tupla (nodos, aristas): lista de nodos y generador de (u, v, peso)
+        con cada arista una vez (en no dirigidos, no se repite la inversa)
+    """
+    if isinstance(grafo, GrafoMatrizAdyacencia):
+        return list(range(grafo.V)), _aristas_matriz(grafo)
+    return list(grafo.grafo), _aristas_lista(grafo)
+
+
+def _aristas_lista(grafo):
+    posicion = {nodo: i for i, nodo in enumerate(grafo.grafo)}
+    for nodo, vecinos in list(grafo.grafo.items()):
+        pesos = grafo.pesos.get(nodo, ()) if grafo.pesos is not None else [1] * len(vecinos)
+        propio = posicion[nodo]
+        lazos = 0
+        for v, peso in zip(vecinos, pesos):
+            if grafo.dirigido or propio < posicion[v]:
+                yield nodo, v, peso
+            elif v == nodo:
+                # Un lazo no dirigido se guarda dos veces en la lista del nodo
+                lazos += 1
+                if lazos % 2:
+                    yield nodo, v, peso
+
+
+def _aristas_matriz(grafo):
+    for u in range(grafo.V):
+        for v in grafo._vecinos(u):
+            if grafo.dirigido or u <= v:
+                yield u, v, grafo.obtener_peso(u, v)
+
+
+def _dot(texto):
+    texto = str(texto).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{texto}"'
+
+
+def exportar_dot(grafo, salida=None, nombre="G"):
+    """
+    Escribe el grafo en formato DOT (Graphviz)
+    
+    Args:
+        grafo: GrafoListaAdyacencia o GrafoMatrizAdyacencia
+        salida: Objeto tipo archivo o ruta (por defecto sys.stdout)
+        nombre: Nombre del grafo en el documento
+    """
+    nodos, aristas = _nodos_y_aristas(grafo)
+    flecha = " -> " if grafo.dirigido else " -- "
+    
+    with Escritor(salida) as escritor:
+        escritor.linea(f"{'digraph' if grafo.dirigido else 'graph'} {_dot(nombre)} {{")
+        for nodo in nodos:
+            escritor.linea(f"  {_dot(nodo)};")
+        for u, v, peso in aristas:
+            atributos = f" [weight={_peso(peso)}]" if grafo.ponderado else ""
+            escritor.linea(f"  {_dot(u)}{flecha}{_dot(v)}{atributos};")
+        escritor.linea("}")
+
+
+def _xml(texto):
+    return (str(texto).replace("&", "&amp;").replace("<", "&lt;")
+            .replace(">", "&gt;").replace('"', "&quot;"))
+
+
+def exportar_graphml(grafo, salida=None):
+    """
+    Escribe el grafo en formato GraphML; el peso va en el atributo "peso"
+    
+    Args:
+        grafo: GrafoListaAdyacencia o GrafoMatrizAdyacencia
+        salida: Objeto tipo archivo o ruta (por defecto sys.stdout)
+    """
+    nodos, aristas = _nodos_y_aristas(grafo)
+    
+    with Escritor(salida) as escritor:
+        escritor.linea('<?xml version="1.0" encoding="UTF-8"?>')
+        escritor.linea('<graphml xmlns="http://graphml.graphdrawing.org/xmlns">')
+        if grafo.ponderado:
+            escritor.linea('  <key id="peso" for="edge" attr.name="peso" attr.type="double"/>')
+        sentido = "directed" if grafo.dirigido else "undirected"
+        escritor.linea(f'  <graph id="G" edgedefault="{sentido}">')
+        for nodo in nodos:
+            escritor.linea(f'    <node id="{_xml(nodo)}"/>')
+        for u, v, peso in aristas:
+            extremos = f'source="{_xml(u)}" target="{_xml(v)}"'
+            if grafo.ponderado:
+                escritor.linea(f'    <edge {extremos}><data key="peso">{peso!r}</data></edge>')
+            else:
+                escritor.linea(f'    <edge {extremos}/>')
+        escritor.linea("  </graph>")
+        escritor.linea("</graphml>")
+
+
+def exportar_json(grafo, salida=None):
+    """
+    Escribe el grafo como JSON:
+    {"dirigido", "ponderado", "nodos": [...], "aristas": [[u, v, peso], ...]}
+    
+    Los nodos que no son tipos de JSON se escriben como texto.
+    
+    Args:
+        grafo: GrafoListaAdyacencia o GrafoMatrizAdyacencia
+        salida: Objeto tipo archivo o ruta (por defecto sys.stdout)
+    """
+    nodos, aristas = _nodos_y_aristas(grafo)
+    codificar = json.JSONEncoder(ensure_ascii=False, default=str).encode
+    
+    with Escritor(salida) as escritor:
+        escritor.escribir(f'{{"dirigido": {codificar(grafo.dirigido)}, '
+                          f'"ponderado": {codificar(grafo.ponderado)},\n "nodos": [')
+        for k, nodo in enumerate(nodos):
+            escritor.escribir(("" if k == 0 else ", ") + codificar(nodo))
+        escritor.escribir('],\n "aristas": [')
+        for k, arista in enumerate(aristas):
+            escritor.escribir(("\n  " if k == 0 else ",\n  ") + codificar(arista))
+        escritor.linea("\n ]}")
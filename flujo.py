@@ -0,0 +1,191 @@
+"""
+Flujo Máximo y Corte Mínimo (algoritmo de Dinic)
+Los pesos de las aristas de un GrafoListaAdyacencia se usan como
+capacidades. El grafo residual se guarda en arrays planos: cada arista
+original i da el arco 2i (ida) y el arco 2i + 1 (vuelta), de modo que
+el arco inverso de a es a ^ 1.
+"""
+
+from array import array
+from collections import deque
+
+
+def flujo_maximo(grafo, origen, destino):
+    """
+    Flujo máximo de origen a destino (Dinic)
+    
+    Cada fase calcula niveles con BFS sobre el grafo residual y satura
+    un flujo bloqueante con DFS iterativo (sin recursión).
+    
+    Complejidad: O(V² · E); O(E · √V) con capacidades unitarias
+    
+    Args:
+        grafo: GrafoListaAdyacencia; los pesos son las capacidades (en un
+            grafo no dirigido cada arista admite flujo en ambos sentidos)
+        origen: Nodo fuente
+        destino: Nodo sumidero
+    
+    Returns:
+        Tupla (valor, flujos, corte):
+        - valor: flujo máximo
+        - flujos: {(u, v): flujo} de las aristas con flujo positivo
+        - corte: aristas (u, v) del corte mínimo; sus capacidades suman valor
+    
+    Raises:
+        ValueError: Si origen y destino coinciden o hay capacidades negativas
+    """
+    if origen == destino:
+        raise ValueError("El origen y el destino deben ser distintos")
+    
+    nodos, indptr, indices, capacidades = grafo.exportar_csr()
+    posicion = {nodo: i for i, nodo in enumerate(nodos)}
+    if origen not in posicion or destino not in posicion:
+        return 0, {}, []
+    if any(c < 0 for c in capacidades):
+        raise ValueError("Las capacidades no pueden ser negativas")
+    
+    residual = _Residual(len(nodos), indptr, indices, capacidades)
+    s, t = posicion[origen], posicion[destino]
+    valor = 0
+    while residual.niveles_bfs(s, t):
+        valor += residual.flujo_bloqueante(s, t)
+    
+    # Flujo neto por par de nodos (suma aristas repetidas y, en grafos no
+    # dirigidos, cancela el flujo en sentidos opuestos)
+    netos = {}
+    cap = residual.cap
+    for i in range(len(indices)):
+        enviado = capacidades[i] - cap[2 * i]
+        if enviado > 0:
+            u, v = residual.cola(2 * i), indices[i]
+            netos[u, v] = netos.get((u, v), 0) + enviado
+            if not grafo.dirigido:
+                netos[v, u] = netos.get((v, u), 0) - enviado
+    flujos = {(nodos[u], nodos[v]): f for (u, v), f in netos.items() if f > 0}
+    
+    # Corte mínimo: aristas de los alcanzables desde s en el residual final
+    # (el último BFS) hacia los no alcanzables
+    alcanzable = residual.nivel
+    corte = []
+    for u in range(len(nodos)):
+        if alcanzable[u] < 0:
+            continue
+        for i in range(indptr[u], indptr[u + 1]):
+            if alcanzable[indices[i]] < 0 and capacidades[i] > 0:
+                corte.append((nodos[u], nodos[indices[i]]))
+    
+    return valor, flujos, corte
+
+
+class _Residual:
+    """Grafo residual en arrays: arcos agrupados por nodo de salida (CSR)"""
+    
+    def __init__(self, n, indptr, indices, capacidades):
+        m = len(indices)
+        # cabeza[a]: nodo al que llega el arco a; cap[a]: capacidad residual
+        self.cabeza = array('q', bytes(16 * m))
+        self.cap = array('d', bytes(16 * m))
+        
+        grado = array('q', bytes(8 * (n + 1)))
+        for u in range(n):
+            inicio, fin = indptr[u], indptr[u + 1]
+            grado[u + 1] += fin - inicio
+            for i in range(inicio, fin):
+                v = indices[i]
+                grado[v + 1] += 1
+                self.cabeza[2 * i] = v
+                self.cabeza[2 * i + 1] = u
+                self.cap[2 * i] = capacidades[i]
+        
+        # arcos[ptr[u]:ptr[u + 1]] son los arcos que salen de u
+        for u in range(n):
+            grado[u + 1] += grado[u]
+        self.ptr = grado
+        self.arcos = array('q', bytes(16 * m))
+        siguiente = array('q', grado)
+        cabeza = self.cabeza
+        for a in range(2 * m):
+            u = cabeza[a ^ 1]
+            self.arcos[siguiente[u]] = a
+            siguiente[u] += 1
+        
+        self.n = n
+        self.nivel = array('q', bytes(8 * n))
+    
+    def cola(self, a):
+        """Nodo del que sale el arco a"""
+        return self.cabeza[a ^ 1]
+    
+    def niveles_bfs(self, s, t):
+        """
+        Calcula la distancia en arcos desde s; True si t es alcanzable.
+        
+        Se detiene al completar el nivel de t: los nodos más lejanos no
+        pueden estar en un camino más corto hacia t.
+        """
+        nivel = self.nivel
+        for u in range(self.n):
+            nivel[u] = -1
+        nivel[s] = 0
+        cabeza, cap, arcos, ptr = self.cabeza, self.cap, self.arcos, self.ptr
+        cola = deque([s])
+        while cola:
+            u = cola.popleft()
+            if nivel[t] >= 0 and nivel[u] >= nivel[t]:
+                break
+            for k in range(ptr[u], ptr[u + 1]):
+                a = arcos[k]
+                v = cabeza[a]
+                if nivel[v] < 0 and cap[a] > 0:
+                    nivel[v] = nivel[u] + 1
+                    cola.append(v)
+        return nivel[t] >= 0
+    
+    def flujo_bloqueante(self, s, t):
+        """
+        Satura todos los caminos s → t del grafo de niveles
+        
+        Cada nodo guarda el siguiente arco por probar; un arco descartado
+        no se vuelve a mirar en la fase.
+        """
+        cabeza, cap, arcos, nivel = self.cabeza, self.cap, self.arcos, self.nivel
+        actual = array('q', self.ptr)
+        fin = self.ptr
+        total = 0
+        camino = []
+        u = s
+        
+        while True:
+            if u == t:
+                enviado = min(cap[a] for a in camino)
+                total += enviado
+                corte = None
+                for k, a in enumerate(camino):
+                    cap[a] -= enviado
+                    cap[a ^ 1] += enviado
+                    if corte is None and cap[a] <= 0:
+                        corte = k
+                # Retroceder hasta antes del primer arco saturado
+                del camino[corte:]
+                u = cabeza[camino[-1]] if camino else s
+                continue
+            
+            avanzado = False
+            while actual[u] < fin[u + 1]:
+                a = arcos[actual[u]]
+                v = cabeza[a]
+                if cap[a] > 0 and nivel[v] == nivel[u] + 1:
+                    camino.append(a)
+                    u = v
+                    avanzado = True
+                    break
+                actual[u] += 1
+            
+            if not avanzado:
+                if not camino:
+                    return total
+                # Callejón sin salida: se descarta el arco que llevó aquí
+                nivel[u] = -1
+                a = camino.pop()
+                u = self.cola(a)
+                actual[u] += 1
@@ -0,0 +1,384 @@
+"""
+Grafo Particionado entre Varios Procesos
+Cada partición es un proceso que guarda la lista de adyacencia de sus nodos.
+BFS y componentes conexas avanzan por rondas: en cada ronda las particiones
+expanden su frontera local y se envían los nodos descubiertos unas a otras
+por una malla de pipes entre procesos. El coordinador solo marca las
+rondas y recibe cuántos mensajes llegaron a cada partición.
+"""
+
+import multiprocessing
+import threading
+import zlib
+from collections import defaultdict
+
+
+# Tipos de registro en los lotes enviados a las particiones
+_SALIDA = "salida"      # arista u -> v guardada en el dueño de u
+_ENTRADA = "entrada"    # arista entrante, guardada en el dueño de v (dirigidos)
+_NODO = "nodo"          # nodo aislado
+
+
+def particion_de(nodo, particiones):
+    """
+    Partición dueña de un nodo (hash estable entre procesos).
+    
+    Se usa crc32 en lugar de hash() porque el hash de los str cambia
+    entre intérpretes.
+    """
+    return zlib.crc32(repr(nodo).encode()) % particiones
+
+
+# ==================== PROCESO DE CADA PARTICIÓN ====================
+
+class _Particion:
+    """Estado de una partición. Vive dentro de su propio proceso."""
+    
+    def __init__(self, indice, particiones, particionador, pares):
+        self.indice = indice
+        self.particiones = particiones
+        self.particionador = particionador
+        self.pares = pares                 # partición -> pipe directo con ella
+        self.salida = defaultdict(list)    # nodo -> [(vecino, peso), ...]
+        self.entrada = defaultdict(list)   # nodo -> [origen, ...] (solo dirigidos)
+        self.distancias = {}
+        self.etiquetas = {}
+        self.entrantes = []                # mensajes recibidos en la última ronda
+    
+    def _repartir(self, pares):
+        """Agrupa pares (nodo, dato) por partición dueña del nodo"""
+        destinos = defaultdict(dict)
+        for nodo, dato in pares:
+            destinos[self.particionador(nodo, self.particiones)][nodo] = dato
+        return {p: list(mensajes.items()) for p, mensajes in destinos.items()}
+    
+    def _intercambiar(self, salientes):
+        """
+        Envía a cada partición sus mensajes y recibe los de todas
+        
+        Todas las particiones intercambian en la misma ronda. Cada envío va
+        en su propio hilo para que dos particiones que se mandan lotes
+        grandes a la vez no se bloqueen con el buffer del pipe lleno.
+        
+        Returns:
+            Número de mensajes recibidos (quedan en self.entrantes)
+        """
+        entrantes = list(salientes.get(self.indice, ()))
+        hilos = [threading.Thread(target=conexion.send, args=(salientes.get(p, []),))
+                 for p, conexion in self.pares.items()]
+        for hilo in hilos:
+            hilo.start()
+        for conexion in self.pares.values():
+            entrantes.extend(conexion.recv())
+        for hilo in hilos:
+            hilo.join()
+        self.entrantes = entrantes
+        return len(entrantes)
+    
+    def aristas(self, lote):
+        for u, v, peso, tipo in lote:
+            if tipo == _SALIDA:
+                self.salida[u].append((v, peso))
+            else:
+                self.salida.setdefault(u, [])
+                if tipo == _ENTRADA:
+                    self.entrada[u].append(v)
+    
+    def num_nodos(self):
+        return len(self.salida)
+    
+    def num_aristas(self):
+        return sum(len(vecinos) for vecinos in self.salida.values())
+    
+    def vecinos(self, nodo):
+        return list(self.salida.get(nodo, ()))
+    
+    def bfs_inicio(self, inicio):
+        self.distancias = {}
+        self.entrantes = []
+        if self.particionador(inicio, self.particiones) == self.indice:
+            self.entrantes.append((inicio, None))
+        return len(self.entrantes)
+    
+    def bfs_expandir(self, nivel):
+        """Marca los candidatos nuevos e intercambia la siguiente frontera"""
+        frontera = []
+        for nodo, _ in self.entrantes:
+            if nodo not in self.distancias:
+                self.distancias[nodo] = nivel
+                frontera.append(nodo)
+        
+        descubiertos = []
+        for nodo in frontera:
+            for vecino, _ in self.salida.get(nodo, ()):
+                if vecino not in self.distancias:
+                    descubiertos.append((vecino, None))
+        return self._intercambiar(self._repartir(descubiertos))
+    
+    def bfs_resultado(self):
+        return self.distancias
+    
+    def cc_inicio(self):
+        # Etiquetas únicas y comparables sin coordinación global
+        self.etiquetas = {nodo: (self.indice, i) for i, nodo in enumerate(self.salida)}
+        return self._difundir(self.etiquetas)
+    
+    def cc_ronda(self):
+        """Aplica las etiquetas recibidas y difunde las que bajaron"""
+        cambiados = {}
+        for nodo, etiqueta in self.entrantes:
+            if etiqueta < self.etiquetas[nodo]:
+                self.etiquetas[nodo] = etiqueta
+                cambiados[nodo] = etiqueta
+        return self._difundir(cambiados)
+    
+    def _difundir(self, cambiados):
+        minimos = {}
+        for nodo, etiqueta in cambiados.items():
+            vecinos = [v for v, _ in self.salida[nodo]] + self.entrada.get(nodo, [])
+            for vecino in vecinos:
+                actual = minimos.get(vecino)
+                if actual is None or etiqueta < actual:
+                    minimos[vecino] = etiqueta
+        return self._intercambiar(self._repartir(minimos.items()))
+    
+    def cc_resultado(self):
+        return self.etiquetas
+
+
+def _trabajador(conexion, indice, particiones, particionador, pares):
+    """Bucle de un proceso partición: ejecuta órdenes hasta recibir 'fin'"""
+    particion = _Particion(indice, particiones, particionador, pares)
+    while True:
+        orden, args = conexion.recv()
+        if orden == "fin":
+            break
+        try:
+            conexion.send(("ok", getattr(particion, orden)(*args)))
+        except Exception as e:
+            conexion.send(("error", f"{type(e).__name__}: {e}"))
+    for par in pares.values():
+        par.close()
+    conexion.close()
+
+
+# ==================== COORDINADOR ====================
+
+class GrafoParticionado:
+    """
+    Grafo cuya lista de adyacencia se reparte entre varios procesos.
+    
+    El coordinador no guarda nodos ni aristas: solo encamina lotes de
+    aristas y marca las rondas; las fronteras viajan directamente entre
+    particiones. Así el tamaño máximo del grafo crece con el número de
+    particiones y el coordinador no es un cuello de botella.
+    
+    Uso:
+        with GrafoParticionado(particiones=4) as g:
+            g.agregar_arista('A', 'B')
+            g.bfs('A')
+    """
+    
+    def __init__(self, particiones=4, dirigido=False, particionador=particion_de,
+                 tam_lote=10000):
+        """
+        Args:
+            particiones: Número de procesos
+            dirigido: True si es grafo dirigido
+            particionador: Función (nodo, particiones) -> índice de partición;
+                debe poder serializarse (función de nivel de módulo)
+            tam_lote: Aristas acumuladas por partición antes de enviarlas
+        """
+        self.particiones = particiones
+        self.dirigido = dirigido
+        self.particionador = particionador
+        self.tam_lote = tam_lote
+        self._pendientes = [[] for _ in range(particiones)]
+        self._conexiones = []
+        self._procesos = []
+        
+        contexto = multiprocessing.get_context()
+        # Malla de pipes: mallas[i][j] es el extremo de i hacia j
+        mallas = [{} for _ in range(particiones)]
+        for i in range(particiones):
+            for j in range(i + 1, particiones):
+                mallas[i][j], mallas[j][i] = contexto.Pipe()
+        
+        for i in range(particiones):
+            local, remota = contexto.Pipe()
+            proceso = contexto.Process(target=_trabajador,
+                                       args=(remota, i, particiones, particionador, mallas[i]),
+                                       daemon=True)
+            proceso.start()
+            remota.close()
+            self._conexiones.append(local)
+            self._procesos.append(proceso)
+        # Los extremos de la malla solo los usan las particiones
+        for pares in mallas:
+            for conexion in pares.values():
+                conexion.close()
+    
+    @classmethod
+    def desde_grafo(cls, grafo, particiones=4, **kwargs):
+        """Reparte un GrafoListaAdyacencia existente entre particiones"""
+        particionado = cls(particiones, dirigido=grafo.dirigido, **kwargs)
+        for u in grafo.grafo:
+            particionado._registrar(u)
+            for v, peso in grafo.aristas_de(u):
+                particionado._encolar(u, v, peso, _SALIDA)
+                if grafo.dirigido:
+                    particionado._encolar(v, u, peso, _ENTRADA)
+        particionado._vaciar()
+        return particionado
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.cerrar()
+    
+    def cerrar(self):
+        """Detiene los procesos de las particiones"""
+        for conexion, proceso in zip(self._conexiones, self._procesos):
+            if proceso.is_alive():
+                conexion.send(("fin", ()))
+            proceso.join()
+            conexion.close()
+        self._conexiones = []
+        self._procesos = []
+    
+    # ---------- Comunicación ----------
+    
+    def _dueño(self, nodo):
+        return self.particionador(nodo, self.particiones)
+    
+    def _pedir(self, peticiones):
+        """
+        Envía una orden a cada partición y espera todas las respuestas.
+        
+        Args:
+            peticiones: Lista (una por partición) de tuplas (orden, args)
+        """
+        for conexion, peticion in zip(self._conexiones, peticiones):
+            conexion.send(peticion)
+        
+        respuestas = []
+        for conexion in self._conexiones:
+            estado, valor = conexion.recv()
+            if estado == "error":
+                raise RuntimeError(f"Error en una partición: {valor}")
+            respuestas.append(valor)
+        return respuestas
+    
+    def _todas(self, orden, *args):
+        return self._pedir([(orden, args)] * self.particiones)
+    
+    def _encolar(self, u, v, peso, tipo):
+        p = self._dueño(u)
+        self._pendientes[p].append((u, v, peso, tipo))
+        if len(self._pendientes[p]) >= self.tam_lote:
+            self._vaciar()
+    
+    def _registrar(self, nodo):
+        self._encolar(nodo, None, None, _NODO)
+    
+    def _vaciar(self):
+        """Envía las aristas acumuladas a sus particiones"""
+        if not any(self._pendientes):
+            return
+        lotes, self._pendientes = self._pendientes, [[] for _ in range(self.particiones)]
+        self._pedir([("aristas", (lote,)) for lote in lotes])
+    
+    # ---------- API del grafo ----------
+    
+    def agregar_arista(self, u, v, peso=1):
+        """
+        Añade una arista entre u y v (se envía en lotes a las particiones).
+        
+        Args:
+            u: Nodo origen
+            v: Nodo destino
+            peso: Peso de la arista (default: 1)
+        """
+        self._encolar(u, v, peso, _SALIDA)
+        # En dirigidos el dueño de v guarda la arista entrante: registra el
+        # nodo y permite calcular componentes débilmente conexas
+        self._encolar(v, u, peso, _ENTRADA if self.dirigido else _SALIDA)
+    
+    def obtener_vecinos(self, nodo):
+        """Retorna los vecinos de un nodo como lista de (vecino, peso)"""
+        self._vaciar()
+        conexion = self._conexiones[self._dueño(nodo)]
+        conexion.send(("vecinos", (nodo,)))
+        estado, valor = conexion.recv()
+        if estado == "error":
+            raise RuntimeError(f"Error en una partición: {valor}")
+        return valor
+    
+    def num_nodos(self):
+        """Número total de nodos"""
+        self._vaciar()
+        return sum(self._todas("num_nodos"))
+    
+    def num_nodos_por_particion(self):
+        """Número de nodos de cada partición (para ver el equilibrio)"""
+        self._vaciar()
+        return self._todas("num_nodos")
+    
+    def distancias_bfs(self, inicio):
+        """
+        BFS distribuido por niveles
+        
+        Cada ronda procesa un nivel completo: O(excentricidad de inicio)
+        rondas y O(V + E) trabajo repartido. Los nodos descubiertos pasan
+        directamente a su partición dueña; el coordinador solo recibe
+        cuántos quedan por expandir.
+        
+        Args:
+            inicio: Nodo de inicio
+        
+        Returns:
+            Diccionario {nodo: número de saltos desde inicio}
+        """
+        self._vaciar()
+        pendientes = sum(self._todas("bfs_inicio", inicio))
+        nivel = 0
+        while pendientes:
+            pendientes = sum(self._todas("bfs_expandir", nivel))
+            nivel += 1
+        
+        distancias = {}
+        for parcial in self._todas("bfs_resultado"):
+            distancias.update(parcial)
+        return distancias
+    
+    def bfs(self, inicio):
+        """
+        Búsqueda en Amplitud distribuida
+        
+        Returns:
+            Lista de nodos visitados, nivel por nivel
+        """
+        distancias = self.distancias_bfs(inicio)
+        return sorted(distancias, key=distancias.__getitem__)
+    
+    def componentes_conexas(self):
+        """
+        Componentes conexas por propagación de etiquetas (la menor gana)
+        
+        Necesita O(diámetro) rondas. En grafos dirigidos devuelve las
+        componentes débilmente conexas.
+        
+        Returns:
+            Lista de listas, cada una conteniendo nodos de una componente
+        """
+        self._vaciar()
+        pendientes = sum(self._todas("cc_inicio"))
+        while pendientes:
+            pendientes = sum(self._todas("cc_ronda"))
+        
+        grupos = defaultdict(list)
+        for etiquetas in self._todas("cc_resultado"):
+            for nodo, etiqueta in etiquetas.items():
+                grupos[etiqueta].append(nodo)
+        return list(grupos.values())
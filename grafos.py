@@ -3,61 +3,613 @@ Implementaciones de Estructura de Datos: Grafos
 Incluye: Grafo con Lista de Adyacencia, Matriz de Adyacencia, BFS y DFS
 """
 
-from collections import deque, defaultdict
-from typing import List, Dict, Set, Tuple
+import _thread
+import heapq
+import math
+from array import array
+from collections import OrderedDict, deque, defaultdict
+from functools import wraps
+from itertools import chain, repeat
+
+from _numpy_opcional import cargar_numpy
+from metricas import medido
+
+
+def _memoizado(metodo):
+    """
+    Decorador para consultas costosas del grafo (BFS, componentes, caminos...).
+    
+    Guarda los resultados en una caché LRU por instancia (tam_cache entradas)
+    que se vacía automáticamente cuando cambia la versión del grafo.
+    """
+    nombre = metodo.__name__
+    
+    @wraps(metodo)
+    def envoltura(self, *args, **kwargs):
+        if self.tam_cache <= 0:
+            return metodo(self, *args, **kwargs)
+        
+        cache = self._cache
+        if self._version_cache != self.version:
+            cache.clear()
+            self._version_cache = self.version
+        
+        clave = (nombre, args, tuple(sorted(kwargs.items())))
+        try:
+            resultado = cache[clave]
+            cache.move_to_end(clave)
+            if self._metricas is not None:
+                self._metricas.sumar("cache_aciertos")
+        except KeyError:
+            if self._metricas is not None:
+                self._metricas.sumar("cache_fallos")
+            resultado = metodo(self, *args, **kwargs)
+            cache[clave] = resultado
+            if len(cache) > self.tam_cache:
+                cache.popitem(last=False)
+        
+        # Copia de los contenedores para que el llamador no altere la caché
+        return _copiar(resultado)
+    
+    return envoltura
+
+
+def _copiar(valor):
+    """Copia listas, diccionarios y tuplas anidadas (no los nodos)"""
+    if isinstance(valor, tuple):
+        return tuple(_copiar(v) for v in valor)
+    if isinstance(valor, list):
+        if valor and isinstance(valor[0], (list, dict)):
+            return [_copiar(v) for v in valor]
+        return valor.copy()
+    if isinstance(valor, dict):
+        if valor and isinstance(next(iter(valor.values())), (list, dict)):
+            return {k: _copiar(v) for k, v in valor.items()}
+        return valor.copy()
+    return valor
+
+
+def _contar_recorrido(metricas, nodos, aristas, nombre_max, tam_max):
+    """Suma los contadores de un BFS/DFS si el grafo tiene métricas activas"""
+    if metricas is not None:
+        metricas.sumar("nodos_expandidos", nodos)
+        metricas.sumar("aristas_examinadas", aristas)
+        metricas.maximo(nombre_max, tam_max)
 
 
 # ==================== LISTA DE ADYACENCIA ====================
 
+# Qué hace agregar_arista con una arista que ya existe (ver GrafoListaAdyacencia)
+DUPLICADAS = ("mantener", "ignorar", "sumar", "minimo")
+
+
+def _array_pesos():
+    """Fábrica de los buffers de pesos (función para que sea serializable)"""
+    return array('d')
+
+
+def _primeras_posiciones(vecinos):
+    """{vecino: posición de su primera aparición en la lista}"""
+    posiciones = {}
+    for i, v in enumerate(vecinos):
+        posiciones.setdefault(v, i)
+    return posiciones
+
+
+def _buffer(datos, protocolo):
+    """
+    Envuelve un array para pickle: con el protocolo 5 se serializa como
+    un bloque contiguo que puede viajar fuera de banda (sin copia).
+    """
+    if protocolo >= 5:
+        import pickle
+        
+        return pickle.PickleBuffer(datos)
+    return datos
+
+
+def _vista(datos, tipo):
+    """Vista sin copia de un buffer deserializado con el tipo de array dado"""
+    return memoryview(datos).cast('B').cast(tipo)
+
+
+def _reconstruir_lista(dirigido, ponderado, tam_cache, nodos, indptr, indices, pesos,
+                       duplicadas="mantener"):
+    """Reconstruye un GrafoListaAdyacencia serializado con __reduce_ex__"""
+    grafo = GrafoListaAdyacencia(dirigido, ponderado, tam_cache, duplicadas)
+    indptr = _vista(indptr, 'q').tolist()
+    indices = _vista(indices, 'q').tolist()
+    if ponderado:
+        buffer_pesos, pesos = pesos, array('d')
+        pesos.frombytes(_vista(buffer_pesos, 'B'))
+    
+    for i, nodo in enumerate(nodos):
+        inicio, fin = indptr[i], indptr[i + 1]
+        grafo.grafo[nodo] = [nodos[j] for j in indices[inicio:fin]]
+        if ponderado:
+            grafo.pesos[nodo] = pesos[inicio:fin]
+    return grafo
+
+
+def _reconstruir_instantanea(*argumentos):
+    """Reconstruye una InstantaneaGrafo serializada con __reduce_ex__"""
+    vista = InstantaneaGrafo._desde(_reconstruir_lista(*argumentos))
+    vista._materializar()
+    return vista
+
+
 class GrafoListaAdyacencia:
     """
     Implementación de un Grafo usando Lista de Adyacencia.
     Eficiente para grafos dispersos (pocas aristas).
     
+    self.grafo[nodo] es la lista de vecinos (sin tuplas). Si el grafo es
+    ponderado, los pesos van en un array('d') paralelo: self.pesos[nodo].
+    Por eso los pesos se guardan como float: agregar_arista(u, v, 3) hace
+    que obtener_peso(u, v) devuelva 3.0, y los enteros mayores que 2**53
+    pierden precisión.
+    
+    Por defecto las aristas repetidas se guardan tantas veces como se
+    añaden (multigrafo); con duplicadas="ignorar", "sumar" o "minimo" el
+    grafo mantiene un índice {u: {v: posición}} y una arista repetida
+    actualiza el peso de la existente en O(1). compactar() fusiona en
+    bloque las repetidas que ya haya.
+    
     Complejidad espacial: O(V + E)
     """
     
-    def __init__(self, dirigido=False):
+    # Métricas de instrumentación (ver metricas.instrumentar)
+    _metricas = None
+    
+    def __init__(self, dirigido=False, ponderado=True, tam_cache=128, duplicadas="mantener"):
         """
         Args:
             dirigido: True si es grafo dirigido, False si no dirigido
+            ponderado: False para no guardar pesos (todas las aristas pesan 1)
+            tam_cache: Máximo de consultas cacheadas (0 desactiva la caché)
+            duplicadas: Qué hacer al añadir una arista que ya existe:
+                "mantener" (guardarla otra vez), "ignorar" (conservar el
+                peso anterior), "sumar" los pesos o quedarse con el "minimo"
+        
+        Raises:
+            ValueError: Si duplicadas no es una de las políticas de DUPLICADAS
         """
+        if duplicadas not in DUPLICADAS:
+            raise ValueError(f"Política de aristas duplicadas desconocida: {duplicadas!r}")
+        
         self.grafo = defaultdict(list)
+        self.pesos = defaultdict(_array_pesos) if ponderado else None
         self.dirigido = dirigido
+        self.ponderado = ponderado
+        
+        # La versión aumenta con cada modificación e invalida la caché
+        self.version = 0
+        self.tam_cache = tam_cache
+        self._cache = OrderedDict()
+        self._version_cache = 0
+        
+        # Índice de aristas entrantes (solo dirigidos): se construye al
+        # primer uso y después se mantiene en cada inserción
+        self._inverso = None
+        
+        # Estructuras derivadas que se actualizan con cada cambio
+        # (por ejemplo distancias.DistanciasBFS); el WeakSet se crea con
+        # el primer observador para no importar weakref al cargar el módulo
+        self._observadores = None
+        
+        # Copia en escritura (ver snapshot): _instantaneas son las vistas
+        # vivas (WeakSet creado con la primera) y _propias guarda los nodos
+        # cuya lista ya se copió después de la última instantánea.
+        # _thread en lugar de threading para no alargar la importación
+        self._instantaneas = None
+        self._propias = None
+        self._cerrojo = _thread.allocate_lock()
+        
+        # Posición de cada vecino en su lista, solo si no se mantienen las
+        # aristas repetidas; se construye al primer uso
+        self.duplicadas = duplicadas
+        self._posiciones = None
     
     def agregar_arista(self, u, v, peso=1):
         """
         Añade una arista entre los nodos u y v.
         
+        Si la arista ya existe se aplica la política duplicadas del grafo.
+        
         Args:
             u: Nodo origen
             v: Nodo destino
-            peso: Peso de la arista (default: 1)
+            peso: Peso de la arista (default: 1); se guarda como float
         """
-        self.grafo[u].append((v, peso))
+        if self.pesos is None and peso != 1:
+            raise ValueError(f"Grafo no ponderado: la arista {u}-{v} no puede pesar {peso}")
+        
+        with self._cerrojo:
+            protegido = self._hay_instantaneas()
+            if protegido:
+                self._propia(u)
+                if not self.dirigido:
+                    self._propia(v)
+            
+            posiciones = None
+            if self.duplicadas != "mantener":
+                posiciones = self._indice_posiciones()
+                i = posiciones.get(u, {}).get(v)
+                if i is not None:
+                    self._fusionar_peso(u, v, i, peso)
+                    return
+            
+            self.version += 1
+            vecinos = self.grafo[u]
+            vecinos.append(v)
+            if self.pesos is not None:
+                self.pesos[u].append(peso)
+            if posiciones is not None:
+                posiciones.setdefault(u, {})[v] = len(vecinos) - 1
+            
+            # Para grafos no dirigidos, añadir también la arista inversa
+            if not self.dirigido:
+                vecinos = self.grafo[v]
+                vecinos.append(u)
+                if self.pesos is not None:
+                    self.pesos[v].append(peso)
+                if posiciones is not None:
+                    posiciones.setdefault(v, {}).setdefault(u, len(vecinos) - 1)
+            else:
+                # Registrar el destino como nodo aunque no tenga aristas de salida
+                if v not in self.grafo:
+                    if protegido:
+                        self._guardar_anterior(v)
+                    self.grafo[v] = []
+                if self._inverso is not None:
+                    self._inverso[v].append(u)
+                    self._inverso.setdefault(u, [])
+        
+        if self._observadores:
+            for observador in list(self._observadores):
+                observador._arista_agregada(u, v)
+    
+    def _indice_posiciones(self):
+        """Índice {u: {v: posición de la primera v en la lista de u}}"""
+        if self._posiciones is None:
+            self._posiciones = {u: _primeras_posiciones(vecinos)
+                                for u, vecinos in self.grafo.items()}
+        return self._posiciones
+    
+    def _fusionar_peso(self, u, v, i, peso):
+        """Aplica la política duplicadas a la arista existente u-v (posición i)"""
+        if self.pesos is None or self.duplicadas == "ignorar":
+            return
         
-        # Para grafos no dirigidos, añadir también la arista inversa
+        anterior = self.pesos[u][i]
+        nuevo = anterior + peso if self.duplicadas == "sumar" else min(anterior, peso)
+        if nuevo == anterior:
+            return
+        
+        self.version += 1
+        self.pesos[u][i] = nuevo
         if not self.dirigido:
-            self.grafo[v].append((u, peso))
+            if u == v:
+                # Un lazo no dirigido ocupa dos posiciones seguidas
+                self.pesos[u][i + 1] = nuevo
+            else:
+                self.pesos[v][self._posiciones[v][u]] = nuevo
+    
+    def compactar(self, duplicadas=None):
+        """
+        Fusiona las aristas repetidas y ordena las listas de vecinos
+        
+        Reescribe cada lista una sola vez, así que es mucho más rápido que
+        eliminar y volver a añadir aristas. Sin orden posible entre los
+        vecinos (tipos mezclados) se conserva el orden de inserción.
+        
+        Complejidad: O(E log d) con d el grado máximo
+        
+        Args:
+            duplicadas: "ignorar" (peso de la primera copia), "sumar" o
+                "minimo"; por defecto la política del grafo, o "ignorar"
+                si esta es "mantener"
+        
+        Returns:
+            Número de aristas repetidas eliminadas
+        """
+        if duplicadas is None:
+            duplicadas = "ignorar" if self.duplicadas == "mantener" else self.duplicadas
+        if duplicadas not in DUPLICADAS[1:]:
+            raise ValueError(f"Política de compactación desconocida: {duplicadas!r}")
+        
+        with self._cerrojo:
+            # Todas las listas se sustituyen por otras nuevas: solo hay que
+            # guardar las actuales en las instantáneas pendientes
+            if self._hay_instantaneas():
+                for u in self.grafo:
+                    self._guardar_anterior(u)
+            
+            eliminadas = 0
+            for u in list(self.grafo):
+                vecinos = self.grafo[u]
+                pesos = self.pesos[u] if self.pesos is not None else repeat(1)
+                fusion = {}
+                lazos = 0
+                for v, peso in zip(vecinos, pesos):
+                    if v == u and not self.dirigido:
+                        # Cada lazo no dirigido aparece dos veces: se usa una
+                        lazos += 1
+                        if lazos % 2 == 0:
+                            continue
+                    if v not in fusion:
+                        fusion[v] = peso
+                    elif duplicadas == "sumar":
+                        fusion[v] += peso
+                    elif duplicadas == "minimo":
+                        fusion[v] = min(fusion[v], peso)
+                
+                try:
+                    orden = sorted(fusion)
+                except TypeError:
+                    orden = list(fusion)
+                nuevos = []
+                for v in orden:
+                    nuevos.append(v)
+                    if v == u and not self.dirigido:
+                        nuevos.append(v)
+                eliminadas += len(vecinos) - len(nuevos)
+                self.grafo[u] = nuevos
+                if self.pesos is not None:
+                    self.pesos[u] = array('d', [fusion[v] for v in nuevos])
+            
+            self.version += 1
+            self._inverso = None
+            self._posiciones = None
+        
+        return eliminadas if self.dirigido else eliminadas // 2
+    
+    def _agregar_observador(self, observador):
+        """Registra un observador (referencia débil) de los cambios de aristas"""
+        if self._observadores is None:
+            import weakref
+            
+            self._observadores = weakref.WeakSet()
+        self._observadores.add(observador)
+    
+    def _quitar_observador(self, observador):
+        """Deja de notificar cambios al observador"""
+        if self._observadores is not None:
+            self._observadores.discard(observador)
+    
+    def eliminar_arista(self, u, v):
+        """
+        Elimina la arista entre u y v (todas sus copias si está repetida).
+        
+        Complejidad: O(grado de u + grado de v)
+        
+        Returns:
+            True si la arista existía
+        """
+        if v not in self.grafo.get(u, ()):
+            return False
+        
+        with self._cerrojo:
+            # _quitar_vecino crea listas nuevas: solo hay que guardar las
+            # actuales en las instantáneas pendientes
+            if self._hay_instantaneas():
+                self._guardar_anterior(u)
+                if not self.dirigido:
+                    self._guardar_anterior(v)
+            
+            self.version += 1
+            self._quitar_vecino(u, v)
+            if not self.dirigido:
+                self._quitar_vecino(v, u)
+            elif self._inverso is not None:
+                self._inverso[v] = [x for x in self._inverso[v] if x != u]
+        
+        if self._observadores:
+            for observador in list(self._observadores):
+                observador._arista_eliminada(u, v)
+        return True
+    
+    def _quitar_vecino(self, u, v):
+        """Elimina v de la lista de u (y sus pesos paralelos)"""
+        vecinos = self.grafo[u]
+        if self.pesos is not None:
+            self.pesos[u] = array('d', (p for x, p in zip(vecinos, self.pesos[u]) if x != v))
+        self.grafo[u] = [x for x in vecinos if x != v]
+        if self._posiciones is not None:
+            self._posiciones[u] = _primeras_posiciones(self.grafo[u])
+    
+    def invalidar_cache(self):
+        """
+        Marca el grafo como modificado. Necesario solo si se altera
+        self.grafo directamente en lugar de usar agregar_arista.
+        """
+        self.version += 1
+        self._inverso = None
+        self._posiciones = None
+    
+    # ---------- Instantáneas (copia en escritura) ----------
+    
+    def snapshot(self):
+        """
+        Retorna una vista inmutable del grafo en su estado actual - O(1)
+        
+        La vista comparte las listas de adyacencia con el grafo. Cada
+        escritura posterior copia solo la lista del nodo que toca, la
+        primera vez, y deja la anterior en las instantáneas que aún no
+        han copiado el diccionario de nodos; una instantánea lo copia (solo
+        referencias) en su primera consulta. Así las instantáneas nunca ven
+        cambios posteriores y el escritor no paga por los nodos que no
+        modifica. Las modificaciones directas de self.grafo no pasan por
+        este mecanismo.
+        
+        Se puede llamar desde otro hilo mientras se añaden aristas.
+        
+        Returns:
+            InstantaneaGrafo con toda la API de consulta
+        """
+        with self._cerrojo:
+            if self._instantaneas is None:
+                import weakref
+                
+                self._instantaneas = weakref.WeakSet()
+            vista = InstantaneaGrafo._desde(self)
+            self._instantaneas.add(vista)
+            self._propias = set()
+            return vista
+    
+    def _hay_instantaneas(self):
+        """True si alguna instantánea viva puede compartir listas con el grafo"""
+        if self._propias is None:
+            return False
+        if not self._instantaneas:
+            # Ya no queda ninguna: no hace falta copiar nada más
+            self._propias = None
+            return False
+        return True
+    
+    def _guardar_anterior(self, nodo):
+        """
+        Antes de la primera modificación de nodo desde la última
+        instantánea, deja su lista y sus pesos actuales (None si aún no
+        existe) en las instantáneas que no han copiado el diccionario
+        
+        Returns:
+            True si era la primera modificación
+        """
+        if nodo in self._propias:
+            return False
+        self._propias.add(nodo)
+        anterior = (self.grafo.get(nodo), self.pesos.get(nodo) if self.pesos is not None else None)
+        for vista in self._instantaneas:
+            if vista._anteriores is not None:
+                vista._anteriores.setdefault(nodo, anterior)
+        return True
+    
+    def _propia(self, nodo):
+        """Garantiza que la lista de nodo no es de ninguna instantánea"""
+        if self._guardar_anterior(nodo):
+            vecinos = self.grafo.get(nodo)
+            if vecinos is not None:
+                self.grafo[nodo] = list(vecinos)
+                if self.pesos is not None:
+                    self.pesos[nodo] = array('d', self.pesos.get(nodo, ()))
+    
+    def _indice_inverso(self):
+        """Aristas entrantes de cada nodo: {v: [u, ...]}"""
+        if not self.dirigido:
+            return self.grafo
+        
+        if self._inverso is None:
+            inverso = defaultdict(list)
+            for u, vecinos in self.grafo.items():
+                inverso.setdefault(u, [])
+                for v in vecinos:
+                    inverso[v].append(u)
+            self._inverso = inverso
+        return self._inverso
+    
+    def predecesores(self, nodo):
+        """
+        Retorna los nodos con una arista hacia nodo
+        
+        Complejidad: O(grado de entrada); la primera llamada en un grafo
+        dirigido construye el índice inverso en O(V + E)
+        """
+        return list(self._indice_inverso().get(nodo, ()))
+    
+    def grado_entrada(self, nodo):
+        """Número de aristas que llegan a nodo"""
+        return len(self._indice_inverso().get(nodo, ()))
     
     def obtener_vecinos(self, nodo):
-        """Retorna los vecinos de un nodo"""
-        return self.grafo.get(nodo, [])
+        """
+        Retorna las aristas de salida de un nodo como lista de (vecino, peso)
+        
+        Se mantiene el formato de cuando self.grafo guardaba tuplas; para
+        solo los vecinos, sin copiar, usar self.grafo[nodo].
+        """
+        return self.aristas_de(nodo)
+    
+    def aristas_de(self, nodo):
+        """Retorna las aristas de salida de un nodo como lista de (vecino, peso)"""
+        vecinos = self.grafo.get(nodo, [])
+        if self.pesos is None:
+            return [(v, 1) for v in vecinos]
+        return list(zip(vecinos, self.pesos.get(nodo, ())))
+    
+    def obtener_peso(self, u, v):
+        """Obtiene el peso de la arista entre u y v (None si no existe)"""
+        vecinos = self.grafo.get(u, [])
+        if v not in vecinos:
+            return None
+        if self.pesos is None:
+            return 1
+        return self.pesos[u][vecinos.index(v)]
     
     def existe_arista(self, u, v):
         """Verifica si existe una arista entre u y v"""
-        for vecino, _ in self.grafo[u]:
-            if vecino == v:
-                return True
-        return False
+        return v in self.grafo.get(u, ())
     
-    def mostrar(self):
-        """Muestra la lista de adyacencia"""
-        print("\nLista de Adyacencia:")
-        for nodo in sorted(self.grafo.keys()):
-            vecinos = ", ".join([f"{v}({p})" for v, p in self.grafo[nodo]])
-            print(f"  {nodo}: [{vecinos}]")
+    def exportar_csr(self):
+        """
+        Exporta el grafo en formato CSR (Compressed Sparse Row)
+        
+        Los vecinos del nodo nodos[i] son indices[indptr[i]:indptr[i + 1]],
+        con sus pesos en la misma posición de pesos. Los arrays se pueden
+        envolver sin copia con numpy.frombuffer.
+        
+        Returns:
+            Tupla (nodos, indptr, indices, pesos): lista de nodos,
+            array('q') de V + 1 posiciones, array('q') y array('d') de E
+        """
+        nodos = list(self.grafo)
+        posicion = {nodo: i for i, nodo in enumerate(nodos)}
+        indptr = array('q', [0])
+        indices = array('q')
+        pesos = array('d')
+        
+        for nodo in nodos:
+            indices.extend(map(posicion.__getitem__, self.grafo[nodo]))
+            if self.pesos is not None:
+                pesos.extend(self.pesos.get(nodo, ()))
+            indptr.append(len(indices))
+        
+        if self.pesos is None:
+            pesos = array('d', [1.0]) * len(indices)
+        return nodos, indptr, indices, pesos
     
+    def __reduce_ex__(self, protocolo):
+        """
+        Serializa el grafo como arrays CSR contiguos en lugar de un
+        diccionario de listas: con pickle.dumps(g, protocol=5,
+        buffer_callback=...) los arrays viajan fuera de banda sin copia.
+        
+        No se guardan la caché, el índice inverso, las métricas ni los
+        observadores. Los buffers usan el orden de bytes de la máquina.
+        """
+        nodos, indptr, indices, pesos = self.exportar_csr()
+        pesos = _buffer(pesos, protocolo) if self.pesos is not None else None
+        return (_reconstruir_lista,
+                (self.dirigido, self.ponderado, self.tam_cache, nodos,
+                 _buffer(indptr, protocolo), _buffer(indices, protocolo), pesos,
+                 self.duplicadas))
+    
+    def mostrar(self, salida=None, limite=None, desde=0, final=0):
+        """
+        Muestra la lista de adyacencia
+        
+        Args:
+            salida: Objeto tipo archivo o ruta (por defecto la consola)
+            limite: Máximo de nodos mostrados desde la posición desde
+            desde: Primer nodo mostrado, en orden (para paginar)
+            final: Nodos del final que se muestran además
+        """
+        from exportar import mostrar_lista
+        
+        mostrar_lista(self, salida, limite, desde, final)
+    
+    @medido
+    @_memoizado
     def bfs(self, inicio):
         """
         Búsqueda en Amplitud (BFS) - Breadth-First Search
@@ -66,26 +618,56 @@ class GrafoListaAdyacencia:
         
         Args:
             inicio: Nodo de inicio
-            
+        
         Returns:
             Lista de nodos visitados en orden BFS
         """
-        visitados = set()
+        return self._bfs(inicio)
+    
+    @medido
+    @_memoizado
+    def bfs_inverso(self, inicio):
+        """
+        BFS siguiendo las aristas en sentido contrario: nodos desde los
+        que se puede llegar a inicio, ordenados por distancia
+        
+        Args:
+            inicio: Nodo de llegada
+        
+        Returns:
+            Lista de nodos visitados en orden BFS
+        """
+        return self._bfs(inicio, self._indice_inverso())
+    
+    def _bfs(self, inicio, adyacencia=None):
+        """BFS sobre adyacencia; con métricas, cuenta nodos, aristas y frontera"""
+        if adyacencia is None:
+            adyacencia = self.grafo
+        
+        visitados = {inicio}
         cola = deque([inicio])
-        visitados.add(inicio)
         resultado = []
+        aristas = 0
+        frontera_max = 1
         
         while cola:
             nodo = cola.popleft()
             resultado.append(nodo)
             
-            for vecino, _ in self.grafo[nodo]:
+            vecinos = adyacencia.get(nodo, ())
+            aristas += len(vecinos)
+            for vecino in vecinos:
                 if vecino not in visitados:
                     visitados.add(vecino)
                     cola.append(vecino)
+            if len(cola) > frontera_max:
+                frontera_max = len(cola)
         
+        _contar_recorrido(self._metricas, len(resultado), aristas, "frontera_max", frontera_max)
         return resultado
     
+    @medido
+    @_memoizado
     def dfs_iterativo(self, inicio):
         """
         Búsqueda en Profundidad Iterativa (DFS)
@@ -94,13 +676,33 @@ class GrafoListaAdyacencia:
         
         Args:
             inicio: Nodo de inicio
-            
+        
+        Returns:
+            Lista de nodos visitados en orden DFS
+        """
+        return self._dfs(inicio, self.grafo)
+    
+    @medido
+    @_memoizado
+    def dfs_inverso(self, inicio):
+        """
+        DFS siguiendo las aristas en sentido contrario
+        
+        Args:
+            inicio: Nodo de llegada
+        
         Returns:
             Lista de nodos visitados en orden DFS
         """
+        return self._dfs(inicio, self._indice_inverso())
+    
+    def _dfs(self, inicio, adyacencia):
+        """DFS sobre adyacencia; con métricas, cuenta nodos, aristas y pila"""
         visitados = set()
         pila = [inicio]
         resultado = []
+        aristas = 0
+        pila_max = 1
         
         while pila:
             nodo = pila.pop()
@@ -110,10 +712,15 @@ class GrafoListaAdyacencia:
                 resultado.append(nodo)
                 
                 # Agregar vecinos a la pila (en orden inverso)
-                for vecino, _ in reversed(self.grafo[nodo]):
+                vecinos = adyacencia.get(nodo, ())
+                aristas += len(vecinos)
+                for vecino in reversed(vecinos):
                     if vecino not in visitados:
                         pila.append(vecino)
+                if len(pila) > pila_max:
+                    pila_max = len(pila)
         
+        _contar_recorrido(self._metricas, len(resultado), aristas, "pila_max", pila_max)
         return resultado
     
     def dfs_recursivo(self, inicio, visitados=None, resultado=None):
@@ -124,7 +731,7 @@ class GrafoListaAdyacencia:
             inicio: Nodo de inicio
             visitados: Conjunto de nodos visitados
             resultado: Lista de nodos visitados
-            
+        
         Returns:
             Lista de nodos visitados en orden DFS
         """
@@ -136,22 +743,27 @@ class GrafoListaAdyacencia:
         visitados.add(inicio)
         resultado.append(inicio)
         
-        for vecino, _ in self.grafo[inicio]:
+        for vecino in self.grafo.get(inicio, ()):
             if vecino not in visitados:
                 self.dfs_recursivo(vecino, visitados, resultado)
         
         return resultado
     
+    @medido
+    @_memoizado
     def tiene_ciclo(self):
         """
         Detecta si el grafo tiene ciclos (solo para grafos no dirigidos)
+        
+        Las aristas paralelas no cuentan como ciclo; un lazo sí.
         """
         visitados = set()
         
         def dfs(nodo, padre=None):
             visitados.add(nodo)
             
-            for vecino, _ in self.grafo[nodo]:
+            # Sin repetidos: una arista paralela al padre no es un ciclo
+            for vecino in dict.fromkeys(self.grafo.get(nodo, ())):
                 if vecino not in visitados:
                     if dfs(vecino, nodo):
                         return True
@@ -167,55 +779,753 @@ class GrafoListaAdyacencia:
         
         return False
     
+    @medido
+    @_memoizado
     def componentes_conexas(self):
         """
         Encuentra todas las componentes conexas del grafo
         
+        En grafos dirigidos devuelve las componentes débilmente conexas
+        (ver componentes_fuertemente_conexas para la versión fuerte).
+        
         Returns:
             Lista de listas, cada una conteniendo nodos de una componente
         """
+        if self.dirigido:
+            return self._componentes_debiles()
+        
         visitados = set()
         componentes = []
         
         for nodo in self.grafo:
             if nodo not in visitados:
-                componente = self.bfs(nodo)
+                componente = self._bfs(nodo)
                 for n in componente:
                     visitados.add(n)
                 componentes.append(componente)
         
         return componentes
+    
+    @medido
+    @_memoizado
+    def componentes_fuertemente_conexas(self):
+        """
+        Componentes fuertemente conexas (algoritmo de Tarjan iterativo)
+        
+        Complejidad: O(V + E), sin recursión (apto para millones de nodos).
+        En grafos no dirigidos coincide con las componentes conexas.
+        
+        Returns:
+            Lista de componentes (listas de nodos) en orden topológico:
+            ninguna arista va de una componente a otra anterior
+        """
+        indice = {}
+        bajo = {}
+        en_pila = set()
+        pila = []
+        componentes = []
+        contador = 0
+        
+        for raiz in self.grafo:
+            if raiz in indice:
+                continue
+            
+            indice[raiz] = bajo[raiz] = contador
+            contador += 1
+            pila.append(raiz)
+            en_pila.add(raiz)
+            # Cada marco guarda el nodo y el iterador de sus vecinos pendientes
+            trabajo = [(raiz, iter(self.grafo.get(raiz, ())))]
+            
+            while trabajo:
+                nodo, vecinos = trabajo[-1]
+                for vecino in vecinos:
+                    if vecino not in indice:
+                        indice[vecino] = bajo[vecino] = contador
+                        contador += 1
+                        pila.append(vecino)
+                        en_pila.add(vecino)
+                        trabajo.append((vecino, iter(self.grafo.get(vecino, ()))))
+                        break
+                    elif vecino in en_pila and indice[vecino] < bajo[nodo]:
+                        bajo[nodo] = indice[vecino]
+                else:
+                    # Todos los vecinos procesados: retroceder
+                    trabajo.pop()
+                    if trabajo:
+                        padre = trabajo[-1][0]
+                        if bajo[nodo] < bajo[padre]:
+                            bajo[padre] = bajo[nodo]
+                    
+                    if bajo[nodo] == indice[nodo]:
+                        componente = []
+                        while True:
+                            miembro = pila.pop()
+                            en_pila.discard(miembro)
+                            componente.append(miembro)
+                            if miembro == nodo:
+                                break
+                        componentes.append(componente)
+        
+        # Tarjan emite las componentes en orden topológico inverso
+        componentes.reverse()
+        return componentes
+    
+    @medido
+    @_memoizado
+    def componentes_debilmente_conexas(self):
+        """
+        Componentes débilmente conexas (ignorando el sentido de las aristas)
+        
+        Complejidad: O(V + E) con unión-búsqueda
+        
+        Returns:
+            Lista de listas, cada una conteniendo nodos de una componente
+        """
+        return self._componentes_debiles()
+    
+    def _componentes_debiles(self):
+        padre = {nodo: nodo for nodo in self.grafo}
+        
+        def raiz(nodo):
+            while padre[nodo] != nodo:
+                padre[nodo] = padre[padre[nodo]]
+                nodo = padre[nodo]
+            return nodo
+        
+        for u, vecinos in self.grafo.items():
+            for v in vecinos:
+                ru, rv = raiz(u), raiz(v)
+                if ru != rv:
+                    padre[rv] = ru
+        
+        grupos = {}
+        for nodo in self.grafo:
+            grupos.setdefault(raiz(nodo), []).append(nodo)
+        return list(grupos.values())
+    
+    def grafo_condensado(self):
+        """
+        Construye el DAG de componentes fuertemente conexas
+        
+        Returns:
+            Tupla (dag, componente_de): dag es un GrafoListaAdyacencia dirigido
+            cuyos nodos son los índices de componentes_fuertemente_conexas(),
+            y componente_de asigna a cada nodo el índice de su componente
+        """
+        componentes = self.componentes_fuertemente_conexas()
+        componente_de = {}
+        for i, componente in enumerate(componentes):
+            for nodo in componente:
+                componente_de[nodo] = i
+        
+        dag = GrafoListaAdyacencia(dirigido=True, ponderado=False)
+        for i in range(len(componentes)):
+            dag.grafo.setdefault(i, [])
+        
+        aristas = set()
+        for u, vecinos in self.grafo.items():
+            cu = componente_de[u]
+            for v in vecinos:
+                cv = componente_de[v]
+                if cu != cv and (cu, cv) not in aristas:
+                    aristas.add((cu, cv))
+                    dag.agregar_arista(cu, cv)
+        
+        return dag, componente_de
+    
+    @medido
+    @_memoizado
+    def dijkstra(self, origen):
+        """
+        Caminos mínimos desde un origen (Dijkstra con heap binario)
+        
+        Complejidad: O((V + E) log V). Los pesos deben ser no negativos.
+        
+        Args:
+            origen: Nodo de inicio
+        
+        Returns:
+            Tupla (distancias, predecesores): diccionarios indexados por nodo
+            que solo incluyen los nodos alcanzables desde el origen
+        """
+        return _dijkstra(self.grafo, self.pesos, origen)
+    
+    @medido
+    @_memoizado
+    def distancias_todos_pares(self, con_predecesores=False, procesos=None):
+        """
+        Caminos mínimos entre todos los pares (Dijkstra repetido)
+        
+        Para grafos dispersos es mucho más rápido que Floyd-Warshall:
+        O(V (V + E) log V). Con procesos > 1 los orígenes se reparten
+        entre un pool de procesos.
+        
+        Args:
+            con_predecesores: True para devolver también los predecesores
+            procesos: Número de procesos (None o 1: secuencial)
+        
+        Returns:
+            Diccionario {origen: {destino: distancia}}, o la tupla
+            (distancias, predecesores) si con_predecesores es True
+        """
+        nodos = list(self.grafo)
+        
+        if procesos is None or procesos <= 1 or len(nodos) < 2:
+            resultados = [_dijkstra(self.grafo, self.pesos, nodo) for nodo in nodos]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            
+            trozo = max(1, len(nodos) // (procesos * 4))
+            with ProcessPoolExecutor(max_workers=procesos,
+                                     initializer=_iniciar_trabajador,
+                                     initargs=(dict(self.grafo), self.pesos)) as pool:
+                resultados = list(pool.map(_dijkstra_trabajador, nodos,
+                                           chunksize=trozo))
+        
+        distancias = {}
+        predecesores = {}
+        for nodo, (dist, pred) in zip(nodos, resultados):
+            distancias[nodo] = dist
+            predecesores[nodo] = pred
+        
+        if con_predecesores:
+            return distancias, predecesores
+        return distancias
+    
+    @medido
+    @_memoizado
+    def camino_mas_corto(self, origen, destino):
+        """
+        Camino con menos saltos entre dos nodos (BFS bidireccional)
+        
+        Avanza un nivel completo desde el extremo cuya frontera es más
+        pequeña hasta que ambas búsquedas se encuentran. En grafos
+        dirigidos la búsqueda desde el destino usa el índice inverso.
+        
+        Args:
+            origen: Nodo de inicio
+            destino: Nodo de llegada
+        
+        Returns:
+            Tupla (camino, saltos); (None, float('inf')) si no hay camino
+        """
+        if origen == destino:
+            return [origen], 0
+        
+        adelante = self.grafo
+        atras = self._indice_inverso()
+        padres_origen = {origen: None}
+        padres_destino = {destino: None}
+        frontera_origen = [origen]
+        frontera_destino = [destino]
+        
+        while frontera_origen and frontera_destino:
+            if len(frontera_origen) <= len(frontera_destino):
+                frontera_origen, encuentro = _expandir_nivel(
+                    frontera_origen, adelante, padres_origen, padres_destino)
+            else:
+                frontera_destino, encuentro = _expandir_nivel(
+                    frontera_destino, atras, padres_destino, padres_origen)
+            
+            if encuentro is not None:
+                camino = []
+                nodo = encuentro
+                while nodo is not None:
+                    camino.append(nodo)
+                    nodo = padres_origen[nodo]
+                camino.reverse()
+                nodo = padres_destino[encuentro]
+                while nodo is not None:
+                    camino.append(nodo)
+                    nodo = padres_destino[nodo]
+                return camino, len(camino) - 1
+        
+        return None, float('inf')
+    
+    @medido
+    def vecindario(self, nodo, k, max_por_nivel=None):
+        """
+        Nodos a k saltos o menos de nodo (BFS con profundidad limitada)
+        
+        Complejidad: O(nodos y aristas dentro del radio k); el resto del
+        grafo no se visita.
+        
+        Args:
+            nodo: Nodo central
+            k: Número máximo de saltos
+            max_por_nivel: Tope de nodos nuevos por nivel: un entero o una
+                lista con el tope de cada nivel (1, 2, ...). None: sin tope
+        
+        Returns:
+            Diccionario {nodo: distancia}
+        """
+        return self.vecindario_multiple([nodo], k, max_por_nivel)
+    
+    @medido
+    def vecindario_multiple(self, nodos, k, max_por_nivel=None):
+        """
+        Vecindario de varios nodos a la vez en una sola pasada por niveles
+        
+        Args:
+            nodos: Nodos semilla (todos a distancia 0)
+            k: Número máximo de saltos
+            max_por_nivel: Igual que en vecindario
+        
+        Returns:
+            Diccionario {nodo: distancia a la semilla más cercana}
+        """
+        distancias = {nodo: 0 for nodo in nodos}
+        frontera = list(distancias)
+        
+        for nivel in range(1, k + 1):
+            if not frontera:
+                break
+            if max_por_nivel is None:
+                tope = None
+            elif isinstance(max_por_nivel, int):
+                tope = max_por_nivel
+            else:
+                tope = max_por_nivel[nivel - 1] if nivel <= len(max_por_nivel) else None
+            
+            siguiente = []
+            for actual in frontera:
+                if tope is not None and len(siguiente) >= tope:
+                    break
+                for vecino in self.grafo.get(actual, ()):
+                    if vecino not in distancias:
+                        distancias[vecino] = nivel
+                        siguiente.append(vecino)
+                        if tope is not None and len(siguiente) >= tope:
+                            break
+            frontera = siguiente
+        
+        return distancias
+    
+    def subgrafo(self, nodos):
+        """
+        Subgrafo inducido por un conjunto de nodos
+        
+        Args:
+            nodos: Nodos a conservar
+        
+        Returns:
+            Nuevo grafo (mismo tipo) con esos nodos y las aristas entre
+            ellos, con los nodos en el orden en que se dieron
+        """
+        # dict y no set: sin repetidos pero con un orden que no depende
+        # de la aleatorización del hash de las cadenas
+        conjunto = dict.fromkeys(nodos)
+        sub = GrafoListaAdyacencia(dirigido=self.dirigido, ponderado=self.ponderado,
+                                   tam_cache=self.tam_cache, duplicadas=self.duplicadas)
+        
+        for u in conjunto:
+            vecinos = self.grafo.get(u, [])
+            if self.pesos is None:
+                sub.grafo[u] = [v for v in vecinos if v in conjunto]
+            else:
+                pares = [(v, p) for v, p in zip(vecinos, self.pesos.get(u, ())) if v in conjunto]
+                sub.grafo[u] = [v for v, _ in pares]
+                sub.pesos[u] = array('d', (p for _, p in pares))
+        
+        return sub
+    
+    def subgrafo_ego(self, nodo, k, max_por_nivel=None):
+        """
+        Red ego: subgrafo inducido por los nodos a k saltos o menos
+        
+        Args:
+            nodo: Nodo central, o lista de nodos semilla
+            k: Número máximo de saltos
+            max_por_nivel: Igual que en vecindario
+        
+        Returns:
+            Nuevo GrafoListaAdyacencia
+        """
+        semillas = nodo if isinstance(nodo, list) else [nodo]
+        return self.subgrafo(self.vecindario_multiple(semillas, k, max_por_nivel))
+    
+    @medido
+    @_memoizado
+    def sugerencias(self, usuario, k=5, metrica="comunes"):
+        """
+        Recomienda nodos a distancia 2 (amigos de amigos) que aún no son vecinos
+        
+        Complejidad: O(suma de los grados de los vecinos del usuario)
+        
+        Args:
+            usuario: Nodo para el que se buscan sugerencias
+            k: Número máximo de sugerencias (None: todas)
+            metrica: "comunes" (amigos en común), "jaccard" o "adamic_adar"
+        
+        Returns:
+            Lista de tuplas (candidato, puntuación) de mayor a menor
+            puntuación; a igual puntuación, por orden de candidato
+        """
+        return _sugerencias(self.grafo, usuario, k, metrica)
+    
+    def sugerencias_todos(self, k=5, metrica="comunes", procesos=None):
+        """
+        Calcula las sugerencias de todos los nodos del grafo
+        
+        Args:
+            k: Número máximo de sugerencias por nodo
+            metrica: "comunes", "jaccard" o "adamic_adar"
+            procesos: Número de procesos (None o 1: secuencial)
+        
+        Returns:
+            Diccionario {nodo: [(candidato, puntuación), ...]}
+        """
+        if metrica not in _METRICAS_SUGERENCIAS:
+            raise ValueError(f"Métrica desconocida: {metrica}")
+        
+        nodos = list(self.grafo)
+        if procesos is None or procesos <= 1 or len(nodos) < 2:
+            return {nodo: _sugerencias(self.grafo, nodo, k, metrica) for nodo in nodos}
+        
+        from concurrent.futures import ProcessPoolExecutor
+        from functools import partial
+        
+        trozo = max(1, len(nodos) // (procesos * 4))
+        tarea = partial(_sugerencias_trabajador, k=k, metrica=metrica)
+        with ProcessPoolExecutor(max_workers=procesos,
+                                 initializer=_iniciar_trabajador,
+                                 initargs=(dict(self.grafo),)) as pool:
+            return dict(zip(nodos, pool.map(tarea, nodos, chunksize=trozo)))
+
+
+class InstantaneaGrafo(GrafoListaAdyacencia):
+    """
+    Versión inmutable de un GrafoListaAdyacencia (ver snapshot).
+    
+    Admite todas las consultas (BFS, componentes, caminos...) con su
+    propia caché; los métodos que modifican el grafo lanzan TypeError.
+    """
+    
+    @classmethod
+    def _desde(cls, grafo):
+        vista = cls.__new__(cls)
+        # Los diccionarios se copian en la primera consulta (_materializar);
+        # hasta entonces el grafo deja en _anteriores lo que modifica
+        vista._origen = grafo
+        vista._anteriores = {}
+        vista._grafo = vista._pesos = None
+        vista.dirigido = grafo.dirigido
+        vista.ponderado = grafo.ponderado
+        vista.version = grafo.version
+        vista.tam_cache = grafo.tam_cache
+        vista._cache = OrderedDict()
+        vista._version_cache = grafo.version
+        vista._inverso = None
+        vista._observadores = None
+        vista._instantaneas = None
+        vista._propias = None
+        vista._cerrojo = None
+        vista.duplicadas = grafo.duplicadas
+        vista._posiciones = None
+        return vista
+    
+    @property
+    def grafo(self):
+        if self._origen is not None:
+            self._materializar()
+        return self._grafo
+    
+    @property
+    def pesos(self):
+        if self._origen is not None:
+            self._materializar()
+        return self._pesos
+    
+    def _materializar(self):
+        """
+        Copia los diccionarios de nodos del grafo de origen (solo
+        referencias, O(V) en C) y restaura las listas que el grafo ha
+        modificado desde la instantánea
+        """
+        origen = self._origen
+        if origen is None:
+            return
+        
+        with origen._cerrojo:
+            if self._origen is None:
+                # Otro hilo la materializó mientras se esperaba el cerrojo
+                return
+            grafo = defaultdict(list, origen.grafo)
+            pesos = defaultdict(_array_pesos, origen.pesos) if origen.pesos is not None else None
+            for nodo, (vecinos, pesos_nodo) in self._anteriores.items():
+                if vecinos is None:
+                    del grafo[nodo]
+                else:
+                    grafo[nodo] = vecinos
+                if pesos is not None:
+                    if pesos_nodo is None:
+                        pesos.pop(nodo, None)
+                    else:
+                        pesos[nodo] = pesos_nodo
+            self._grafo, self._pesos = grafo, pesos
+            self._anteriores = None
+            self._origen = None
+    
+    def _solo_lectura(self, *args, **kwargs):
+        raise TypeError("Una instantánea del grafo es de solo lectura")
+    
+    agregar_arista = _solo_lectura
+    eliminar_arista = _solo_lectura
+    compactar = _solo_lectura
+    invalidar_cache = _solo_lectura
+    _agregar_observador = _solo_lectura
+    
+    def snapshot(self):
+        """Una instantánea ya es inmutable: se devuelve a sí misma"""
+        return self
+    
+    def __reduce_ex__(self, protocolo):
+        """Se serializa como el grafo, pero se reconstruye como instantánea"""
+        _, argumentos = super().__reduce_ex__(protocolo)
+        return _reconstruir_instantanea, argumentos
+
+
+def _expandir_nivel(frontera, adyacencia, padres, padres_otro):
+    """
+    Expande un nivel de un BFS bidireccional
+    
+    Returns:
+        Tupla (nueva frontera, nodo de encuentro o None)
+    """
+    siguiente = []
+    for nodo in frontera:
+        for vecino in adyacencia.get(nodo, ()):
+            if vecino not in padres:
+                padres[vecino] = nodo
+                if vecino in padres_otro:
+                    return siguiente, vecino
+                siguiente.append(vecino)
+    return siguiente, None
+
+
+def _dijkstra(adyacencia, pesos, origen):
+    """
+    Dijkstra sobre {nodo: [vecino, ...]} con pesos paralelos
+    {nodo: array de pesos}, o pesos None si todas las aristas pesan 1
+    """
+    distancias = {origen: 0}
+    predecesores = {origen: None}
+    terminados = set()
+    # El contador desempata sin comparar nodos (pueden no ser ordenables)
+    heap = [(0, 0, origen)]
+    contador = 1
+    
+    while heap:
+        dist, _, nodo = heapq.heappop(heap)
+        if nodo in terminados:
+            continue
+        terminados.add(nodo)
+        
+        vecinos = adyacencia.get(nodo, ())
+        pesos_nodo = repeat(1) if pesos is None else pesos.get(nodo, ())
+        for vecino, peso in zip(vecinos, pesos_nodo):
+            if peso < 0:
+                raise ValueError(f"Dijkstra no admite pesos negativos ({nodo}-{vecino}: {peso})")
+            nueva = dist + peso
+            if vecino not in distancias or nueva < distancias[vecino]:
+                distancias[vecino] = nueva
+                predecesores[vecino] = nodo
+                heapq.heappush(heap, (nueva, contador, vecino))
+                contador += 1
+    
+    return distancias, predecesores
+
+
+_METRICAS_SUGERENCIAS = ("comunes", "jaccard", "adamic_adar")
+
+
+def _sugerencias(adyacencia, usuario, k, metrica):
+    """Puntúa los candidatos a distancia 2 sobre {nodo: [vecino, ...]}"""
+    if metrica not in _METRICAS_SUGERENCIAS:
+        raise ValueError(f"Métrica desconocida: {metrica}")
+    
+    vecinos = set(adyacencia.get(usuario, ()))
+    puntuaciones = defaultdict(float if metrica == "adamic_adar" else int)
+    
+    # En el orden de la lista (no del conjunto) para que las sumas no
+    # dependan del hash de los nodos
+    for amigo in dict.fromkeys(adyacencia.get(usuario, ())):
+        vecinos_amigo = set(adyacencia.get(amigo, ()))
+        if metrica == "adamic_adar":
+            # Un amigo en común con pocos contactos aporta más que un "hub"
+            if len(vecinos_amigo) < 2:
+                continue
+            aporte = 1 / math.log(len(vecinos_amigo))
+        else:
+            aporte = 1
+        
+        for candidato in vecinos_amigo:
+            if candidato != usuario and candidato not in vecinos:
+                puntuaciones[candidato] += aporte
+    
+    if metrica == "jaccard":
+        for candidato, comunes in puntuaciones.items():
+            grado = len(set(adyacencia.get(candidato, ())))
+            puntuaciones[candidato] = comunes / (len(vecinos) + grado - comunes)
+    
+    if k is None:
+        return sorted(puntuaciones.items(), key=_orden_sugerencia)
+    return heapq.nsmallest(k, puntuaciones.items(), key=_orden_sugerencia)
+
+
+def _orden_sugerencia(par):
+    """Mayor puntuación primero; los empates, por el nombre del nodo"""
+    candidato, puntuacion = par
+    return -puntuacion, candidato
+
+
+_adyacencia_trabajador = None
+_pesos_trabajador = None
+
+
+def _iniciar_trabajador(adyacencia, pesos=None):
+    """Inicializador de los pools: cada proceso recibe el grafo una sola vez"""
+    global _adyacencia_trabajador, _pesos_trabajador
+    _adyacencia_trabajador = adyacencia
+    _pesos_trabajador = pesos
+
+
+def _dijkstra_trabajador(origen):
+    return _dijkstra(_adyacencia_trabajador, _pesos_trabajador, origen)
+
+
+def _sugerencias_trabajador(usuario, k, metrica):
+    return _sugerencias(_adyacencia_trabajador, usuario, k, metrica)
+
+
+def reconstruir_camino(predecesores, origen, destino):
+    """
+    Reconstruye el camino origen → destino a partir de los predecesores
+    devueltos por floyd_warshall o distancias_todos_pares.
+    
+    Returns:
+        Lista de nodos del camino, o None si destino no es alcanzable
+    """
+    fila = predecesores[origen]
+    if origen == destino:
+        return [origen]
+    try:
+        if fila[destino] is None:
+            return None
+    except (KeyError, IndexError):
+        return None
+    
+    camino = [destino]
+    while destino != origen:
+        destino = fila[destino]
+        camino.append(destino)
+    camino.reverse()
+    return camino
 
 
 # ==================== MATRIZ DE ADYACENCIA ====================
 
+def _reconstruir_matriz(vertices, dirigido, ponderado, tam_cache, densidad_maxima,
+                        tipo, datos):
+    """Reconstruye un GrafoMatrizAdyacencia densa serializada con __reduce_ex__"""
+    grafo = GrafoMatrizAdyacencia(vertices, dirigido, ponderado, tam_cache, densidad_maxima)
+    datos = _vista(datos, tipo)
+    grafo.grafo = [datos[i * vertices:(i + 1) * vertices].tolist() for i in range(vertices)]
+    return grafo
+
+
+def _reconstruir_matriz_dispersa(vertices, dirigido, ponderado, tam_cache, densidad_maxima,
+                                 origenes, destinos, pesos):
+    """Reconstruye un GrafoMatrizAdyacencia dispersa serializada con __reduce_ex__"""
+    grafo = GrafoMatrizAdyacencia(vertices, dirigido, ponderado, tam_cache, densidad_maxima)
+    destinos = _vista(destinos, 'q').tolist()
+    pesos = _vista(pesos, 'd').tolist() if ponderado else repeat(1)
+    for u, v, peso in zip(_vista(origenes, 'q').tolist(), destinos, pesos):
+        grafo._filas[u][v] = peso
+    grafo._entradas = len(destinos)
+    return grafo
+
+
 class GrafoMatrizAdyacencia:
     """
     Implementación de un Grafo usando Matriz de Adyacencia.
     Eficiente para grafos densos (muchas aristas).
     
-    Complejidad espacial: O(V²)
+    Empieza con una representación dispersa (diccionario de filas
+    {u: {v: peso}}) y pasa a la matriz V × V cuando la fracción de celdas
+    con arista supera densidad_maxima, o al acceder a self.grafo.
+    
+    Complejidad espacial: O(V + E) mientras es dispersa, O(V²) densa
     """
     
-    def __init__(self, vertices, dirigido=False, ponderado=False):
+    # Métricas de instrumentación (ver metricas.instrumentar)
+    _metricas = None
+    
+    def __init__(self, vertices, dirigido=False, ponderado=False, tam_cache=128,
+                 densidad_maxima=0.25):
         """
         Args:
             vertices: Número de vértices
             dirigido: True si es grafo dirigido
             ponderado: True si es grafo ponderado
+            tam_cache: Máximo de consultas cacheadas (0 desactiva la caché)
+            densidad_maxima: Fracción de celdas ocupadas a partir de la cual
+                se reserva la matriz completa (0: densa desde el principio)
         """
         self.V = vertices
         self.dirigido = dirigido
         self.ponderado = ponderado
+        self.densidad_maxima = densidad_maxima
         
-        # Inicializar matriz
-        if ponderado:
-            self.grafo = [[float('inf')] * vertices for _ in range(vertices)]
+        # La versión aumenta con cada modificación e invalida la caché
+        self.version = 0
+        self.tam_cache = tam_cache
+        self._cache = OrderedDict()
+        self._version_cache = 0
+        
+        # Valor de una celda sin arista
+        self._vacio = float('inf') if ponderado else 0
+        
+        # Representación dispersa: solo las celdas con arista
+        self._filas = defaultdict(dict)
+        self._entradas = 0
+        self._densa = None
+        if densidad_maxima <= 0:
+            self._densificar()
+    
+    @property
+    def grafo(self):
+        """Matriz V × V (lista de listas); la reserva si aún es dispersa"""
+        if self._densa is None:
+            self._densificar()
+        return self._densa
+    
+    @grafo.setter
+    def grafo(self, matriz):
+        self._densa = matriz
+        self._filas = None
+        self.version += 1
+    
+    def es_densa(self):
+        """True si el grafo ya usa la matriz completa"""
+        return self._densa is not None
+    
+    def _densificar(self):
+        """Pasa de la representación dispersa a la matriz V × V"""
+        if self.ponderado:
+            matriz = [[self._vacio] * self.V for _ in range(self.V)]
             # Diagonal con 0
-            for i in range(vertices):
-                self.grafo[i][i] = 0
+            for i in range(self.V):
+                matriz[i][i] = 0
         else:
-            self.grafo = [[0] * vertices for _ in range(vertices)]
+            matriz = [[0] * self.V for _ in range(self.V)]
+        
+        for u, fila in self._filas.items():
+            for v, peso in fila.items():
+                matriz[u][v] = peso
+        self._densa = matriz
+        self._filas = None
     
     def agregar_arista(self, u, v, peso=1):
         """
@@ -226,67 +1536,146 @@ class GrafoMatrizAdyacencia:
             v: Índice del nodo destino
             peso: Peso de la arista
         """
-        if self.ponderado:
-            self.grafo[u][v] = peso
-            if not self.dirigido:
-                self.grafo[v][u] = peso
-        else:
-            self.grafo[u][v] = 1
+        self.version += 1
+        if not self.ponderado:
+            peso = 1
+        
+        if self._densa is not None:
+            self._densa[u][v] = peso
             if not self.dirigido:
-                self.grafo[v][u] = 1
+                self._densa[v][u] = peso
+            return
+        
+        if not (0 <= u < self.V and 0 <= v < self.V):
+            raise IndexError(f"Vértice fuera de rango: {u}-{v}")
+        self._poner(u, v, peso)
+        if not self.dirigido:
+            self._poner(v, u, peso)
+        if self._entradas > self.densidad_maxima * self.V * self.V:
+            self._densificar()
+    
+    def _poner(self, u, v, peso):
+        fila = self._filas[u]
+        if v not in fila:
+            self._entradas += 1
+        fila[v] = peso
+    
+    def invalidar_cache(self):
+        """
+        Marca el grafo como modificado. Necesario solo si se altera
+        self.grafo directamente en lugar de usar agregar_arista.
+        """
+        self.version += 1
     
     def existe_arista(self, u, v):
         """Verifica si existe una arista entre u y v - O(1)"""
         if self.ponderado:
-            return self.grafo[u][v] != float('inf')
+            return self.obtener_peso(u, v) != float('inf')
         else:
-            return self.grafo[u][v] == 1
+            return self.obtener_peso(u, v) == 1
     
     def obtener_peso(self, u, v):
         """Obtiene el peso de la arista entre u y v"""
-        return self.grafo[u][v]
+        if self._densa is not None:
+            return self._densa[u][v]
+        
+        fila = self._filas.get(u)
+        if fila is not None and v in fila:
+            return fila[v]
+        if self.ponderado and u == v:
+            return 0
+        return self._vacio
     
-    def mostrar(self):
-        """Muestra la matriz de adyacencia"""
-        print("\nMatriz de Adyacencia:")
-        print("   ", end="")
-        for i in range(self.V):
-            print(f"{i:4}", end="")
-        print()
+    def _vecinos(self, nodo):
+        """
+        Índices con arista desde nodo, en orden creciente
         
-        for i in range(self.V):
-            print(f"{i}  ", end="")
-            for j in range(self.V):
-                val = self.grafo[i][j]
-                if self.ponderado and val == float('inf'):
-                    print("  ∞ ", end="")
-                else:
-                    print(f"{int(val):4}", end="")
-            print()
+        En una matriz ponderada la diagonal vale 0 sin que haya lazo, así
+        que un 0 en la diagonal no cuenta como arista (ni densa ni dispersa).
+        """
+        if self._densa is not None:
+            fila = self._densa[nodo]
+            if self.ponderado:
+                return [v for v, val in enumerate(fila)
+                        if val != float('inf') and (val or v != nodo)]
+            return [v for v, val in enumerate(fila) if val == 1]
+        
+        fila = self._filas.get(nodo, {})
+        return sorted(v for v, val in fila.items() if val != self._vacio and (val or v != nodo))
+    
+    def __reduce_ex__(self, protocolo):
+        """
+        Serializa la matriz aplanada en un único array contiguo (double si
+        es ponderada, bytes 0/1 si no), o en arrays de coordenadas
+        (origen, destino, peso) si aún es dispersa. Con el protocolo 5
+        pueden viajar fuera de banda. No se guardan la caché ni las métricas.
+        """
+        config = (self.V, self.dirigido, self.ponderado, self.tam_cache, self.densidad_maxima)
+        if self._densa is not None:
+            tipo = 'd' if self.ponderado else 'B'
+            datos = array(tipo, chain.from_iterable(self._densa))
+            return _reconstruir_matriz, config + (tipo, _buffer(datos, protocolo))
+        
+        origenes, destinos, pesos = array('q'), array('q'), array('d')
+        for u, fila in self._filas.items():
+            origenes.extend(repeat(u, len(fila)))
+            destinos.extend(fila)
+            if self.ponderado:
+                pesos.extend(fila.values())
+        return (_reconstruir_matriz_dispersa,
+                config + (_buffer(origenes, protocolo), _buffer(destinos, protocolo),
+                          _buffer(pesos, protocolo)))
+    
+    def mostrar(self, salida=None, limite=None, desde=0, final=0):
+        """
+        Muestra la matriz de adyacencia
+        
+        Args:
+            salida: Objeto tipo archivo o ruta (por defecto la consola)
+            limite: Máximo de filas y columnas mostradas desde desde
+            desde: Primera fila y columna mostrada (para paginar)
+            final: Filas y columnas del final que se muestran además
+        """
+        from exportar import mostrar_matriz
+        
+        mostrar_matriz(self, salida, limite, desde, final)
     
+    @medido
+    @_memoizado
     def bfs(self, inicio):
         """Búsqueda en Amplitud"""
         visitados = [False] * self.V
         cola = deque([inicio])
         visitados[inicio] = True
         resultado = []
+        aristas = 0
+        frontera_max = 1
         
         while cola:
             nodo = cola.popleft()
             resultado.append(nodo)
             
-            for vecino in range(self.V):
-                if self.existe_arista(nodo, vecino) and not visitados[vecino]:
+            vecinos = self._vecinos(nodo)
+            aristas += len(vecinos)
+            for vecino in vecinos:
+                if not visitados[vecino]:
                     visitados[vecino] = True
                     cola.append(vecino)
+            if len(cola) > frontera_max:
+                frontera_max = len(cola)
         
+        _contar_recorrido(self._metricas, len(resultado), aristas, "frontera_max", frontera_max)
         return resultado
     
+    @medido
+    @_memoizado
     def dfs(self, inicio):
         """Búsqueda en Profundidad"""
         visitados = [False] * self.V
         pila = [inicio]
         resultado = []
+        aristas = 0
+        pila_max = 1
         
         while pila:
             nodo = pila.pop()
@@ -295,143 +1684,181 @@ class GrafoMatrizAdyacencia:
                 visitados[nodo] = True
                 resultado.append(nodo)
                 
-                for vecino in range(self.V - 1, -1, -1):
-                    if self.existe_arista(nodo, vecino) and not visitados[vecino]:
+                vecinos = self._vecinos(nodo)
+                aristas += len(vecinos)
+                for vecino in reversed(vecinos):
+                    if not visitados[vecino]:
                         pila.append(vecino)
+                if len(pila) > pila_max:
+                    pila_max = len(pila)
         
+        _contar_recorrido(self._metricas, len(resultado), aristas, "pila_max", pila_max)
         return resultado
-
-
-# ==================== EJEMPLOS DE USO ====================
-
-def ejemplo_lista_adyacencia():
-    """Ejemplo de uso: Lista de Adyacencia"""
-    print("=" * 60)
-    print("EJEMPLO 1: Lista de Adyacencia")
-    print("=" * 60)
-    
-    # Crear grafo no dirigido
-    g = GrafoListaAdyacencia(dirigido=False)
-    
-    # Agregar aristas
-    g.agregar_arista('A', 'B')
-    g.agregar_arista('A', 'D')
-    g.agregar_arista('B', 'C')
-    g.agregar_arista('B', 'D')
-    g.agregar_arista('C', 'D')
-    g.agregar_arista('C', 'E')
-    
-    # Mostrar
-    g.mostrar()
     
-    # BFS
-    print("\nBFS desde A:", g.bfs('A'))
+    @medido
+    @_memoizado
+    def floyd_warshall(self, con_predecesores=False, bloque=64):
+        """
+        Caminos mínimos entre todos los pares (Floyd-Warshall)
+        
+        Complejidad: O(V³). Si NumPy está instalado se usa la variante por
+        bloques vectorizada (cada bloque cabe en caché); si no, la clásica.
+        
+        Args:
+            con_predecesores: True para devolver también los predecesores
+            bloque: Tamaño del bloque de la variante con NumPy
+        
+        Returns:
+            Matriz de distancias (lista de listas), o la tupla
+            (distancias, predecesores) si con_predecesores es True.
+            predecesores[i][j] es el vértice anterior a j en el camino
+            i → j, o None si no existe camino.
+        
+        Raises:
+            ValueError: Si el grafo tiene un ciclo negativo
+        """
+        np = cargar_numpy()
+        if np is not None:
+            distancias, predecesores = self._floyd_warshall_bloques(np, con_predecesores, bloque)
+        else:
+            distancias, predecesores = self._floyd_warshall_clasico(con_predecesores)
+        
+        if any(distancias[i][i] < 0 for i in range(self.V)):
+            raise ValueError("El grafo tiene un ciclo de peso negativo")
+        
+        if con_predecesores:
+            return distancias, predecesores
+        return distancias
     
-    # DFS
-    print("DFS desde A (iterativo):", g.dfs_iterativo('A'))
-    print("DFS desde A (recursivo):", g.dfs_recursivo('A'))
+    def _matriz_distancias(self):
+        """Copia de la matriz con ∞ donde no hay arista y 0 en la diagonal"""
+        inf = float('inf')
+        if self._densa is None:
+            # Sin reservar la matriz propia: solo la copia de trabajo
+            distancias = [[inf] * self.V for _ in range(self.V)]
+            for u, fila in self._filas.items():
+                for v, val in fila.items():
+                    distancias[u][v] = val if self.ponderado else (1 if val == 1 else inf)
+        elif self.ponderado:
+            distancias = [list(fila) for fila in self._densa]
+        else:
+            distancias = [[1 if val == 1 else inf for val in fila] for fila in self._densa]
+        
+        # Un lazo de peso positivo no acorta el camino de un nodo a sí mismo
+        for i in range(self.V):
+            distancias[i][i] = min(distancias[i][i], 0)
+        return distancias
     
-    # Detectar ciclo
-    print(f"¿Tiene ciclo?: {g.tiene_ciclo()}")
+    def _floyd_warshall_clasico(self, con_predecesores):
+        n = self.V
+        inf = float('inf')
+        dist = self._matriz_distancias()
+        pred = None
+        if con_predecesores:
+            pred = [[i if i != j and dist[i][j] != inf else None for j in range(n)]
+                    for i in range(n)]
+        
+        for k in range(n):
+            fila_k = dist[k]
+            pred_k = pred[k] if pred else None
+            for i in range(n):
+                dik = dist[i][k]
+                if dik == inf:
+                    continue
+                fila_i = dist[i]
+                for j in range(n):
+                    nueva = dik + fila_k[j]
+                    if nueva < fila_i[j]:
+                        fila_i[j] = nueva
+                        if pred:
+                            pred[i][j] = pred_k[j]
+        
+        return dist, pred
     
-    # Componentes conexas
-    print("Componentes conexas:", g.componentes_conexas())
-    print()
+    def _floyd_warshall_bloques(self, np, con_predecesores, bloque):
+        n = self.V
+        inf = float('inf')
+        matriz = self._matriz_distancias()
+        # Con pesos enteros se devuelven enteros, igual que la variante clásica
+        enteros = all(type(x) is int for fila in matriz for x in fila if x != inf)
+        W = np.array(matriz, dtype=float).reshape(n, n)
+        D = W.copy()
+        
+        bloques = [slice(i, min(i + bloque, n)) for i in range(0, n, bloque)]
+        
+        for K in bloques:
+            # Fase 1: cerrar el bloque diagonal
+            _fw_secuencial(np, D, K, K, K)
+            # Fase 2: fila y columna del bloque K (dependen solo de la fase 1)
+            for B in bloques:
+                if B != K:
+                    _fw_secuencial(np, D, K, B, K)
+                    _fw_secuencial(np, D, B, K, K)
+            # Fase 3: resto de bloques, independientes entre sí
+            for I in bloques:
+                if I == K:
+                    continue
+                for J in bloques:
+                    if J != K:
+                        _fw_min_plus(np, D, I, J, K)
+        
+        predecesores = None
+        if con_predecesores:
+            predecesores = [[None if p < 0 else p for p in fila]
+                            for fila in _fw_predecesores(np, D, W).tolist()]
+        distancias = D.tolist()
+        if enteros:
+            distancias = [[x if x == inf else int(x) for x in fila] for fila in distancias]
+        return distancias, predecesores
 
 
-def ejemplo_matriz_adyacencia():
-    """Ejemplo de uso: Matriz de Adyacencia"""
-    print("=" * 60)
-    print("EJEMPLO 2: Matriz de Adyacencia")
-    print("=" * 60)
-    
-    # Crear grafo no dirigido
-    g = GrafoMatrizAdyacencia(5, dirigido=False)
-    
-    # Agregar aristas (usando índices 0-4)
-    g.agregar_arista(0, 1)  # A-B
-    g.agregar_arista(0, 3)  # A-D
-    g.agregar_arista(1, 2)  # B-C
-    g.agregar_arista(1, 3)  # B-D
-    g.agregar_arista(2, 3)  # C-D
-    g.agregar_arista(2, 4)  # C-E
-    
-    # Mostrar
-    g.mostrar()
-    
-    # Verificar aristas
-    print(f"\n¿Existe arista 0-1? {g.existe_arista(0, 1)}")
-    print(f"¿Existe arista 0-4? {g.existe_arista(0, 4)}")
-    
-    # BFS
-    print("\nBFS desde 0:", g.bfs(0))
-    
-    # DFS
-    print("DFS desde 0:", g.dfs(0))
-    print()
+def _fw_secuencial(np, D, I, J, K):
+    """Relaja el bloque D[I, J] pasando por cada k de K en orden"""
+    sub = D[I, J]
+    for k in range(K.start, K.stop):
+        np.minimum(sub, D[I, k][:, None] + D[k, J][None, :], out=sub)
 
 
-def ejemplo_grafo_ponderado():
-    """Ejemplo de uso: Grafo Ponderado"""
-    print("=" * 60)
-    print("EJEMPLO 3: Grafo Ponderado (Matriz)")
-    print("=" * 60)
-    
-    # Crear grafo ponderado
-    g = GrafoMatrizAdyacencia(5, dirigido=False, ponderado=True)
-    
-    # Agregar aristas con pesos
-    g.agregar_arista(0, 1, 5)   # A-B: 5
-    g.agregar_arista(0, 3, 3)   # A-D: 3
-    g.agregar_arista(1, 2, 8)   # B-C: 8
-    g.agregar_arista(1, 3, 2)   # B-D: 2
-    g.agregar_arista(2, 3, 1)   # C-D: 1
-    g.agregar_arista(2, 4, 4)   # C-E: 4
-    
-    # Mostrar
-    g.mostrar()
-    
-    # Obtener pesos
-    print(f"\nPeso de arista 0-1: {g.obtener_peso(0, 1)}")
-    print(f"Peso de arista 0-2: {g.obtener_peso(0, 2)}")
-    print()
+def _fw_min_plus(np, D, I, J, K):
+    """D[I, J] = min(D[I, J], D[I, K] ⊗ D[K, J]) en un solo producto min-plus"""
+    candidatos = D[I, K][:, :, None] + D[K, J][None, :, :]
+    np.minimum(D[I, J], candidatos.min(axis=1), out=D[I, J])
 
 
-def ejemplo_grafo_dirigido():
-    """Ejemplo de uso: Grafo Dirigido"""
-    print("=" * 60)
-    print("EJEMPLO 4: Grafo Dirigido (Lista Adyacencia)")
-    print("=" * 60)
-    
-    # Crear grafo dirigido
-    g = GrafoListaAdyacencia(dirigido=True)
-    
-    # Agregar aristas dirigidas
-    g.agregar_arista('A', 'B')
-    g.agregar_arista('A', 'C')
-    g.agregar_arista('B', 'C')
-    g.agregar_arista('B', 'D')
-    g.agregar_arista('C', 'D')
-    g.agregar_arista('D', 'E')
-    
-    # Mostrar
-    g.mostrar()
+def _fw_predecesores(np, D, W):
+    """
+    Predecesores a partir de las distancias finales D y los pesos W
     
-    # BFS
-    print("\nBFS desde A:", g.bfs('A'))
+    Los predecesores que deja el orden por bloques pueden formar ciclos
+    cuando hay aristas de peso 0, así que se reconstruyen al final: desde
+    cada origen se recorren por niveles las aristas ajustadas
+    (D[i, u] + W[u, v] == D[i, v]) y cada vértice toma como predecesor el
+    primero que lo alcanza. Así cada camino es un árbol, sin ciclos.
     
-    # DFS
-    print("DFS desde A:", g.dfs_iterativo('A'))
-    print()
+    Returns:
+        Matriz de predecesores con -1 donde no hay
+    """
+    n = len(D)
+    P = np.full((n, n), -1)
+    aristas = np.isfinite(W)
+    np.fill_diagonal(aristas, False)
+    for i in range(n):
+        d = D[i]
+        visitados = np.zeros(n, dtype=bool)
+        visitados[i] = True
+        frontera = np.array([i])
+        while len(frontera):
+            candidatos = d[frontera][:, None] + W[frontera]
+            ajustadas = (aristas[frontera] & ~visitados[None, :]
+                         & np.isclose(candidatos, d[None, :], rtol=1e-9, atol=1e-12))
+            nuevos = ajustadas.any(axis=0)
+            P[i, nuevos] = frontera[ajustadas.argmax(axis=0)[nuevos]]
+            visitados |= nuevos
+            frontera = np.flatnonzero(nuevos)
+    return P
 
 
 if __name__ == "__main__":
-    # Ejecutar ejemplos
-    ejemplo_lista_adyacencia()
-    ejemplo_matriz_adyacencia()
-    ejemplo_grafo_ponderado()
-    ejemplo_grafo_dirigido()
-    
-    print("=" * 60)
-    print("Ejemplos completados exitosamente")
-    print("=" * 60)
+    from ejemplos_grafos import main
+    
+    main()
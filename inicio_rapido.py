@@ -8,11 +8,25 @@ BLOG TÉCNICO: ESTRUCTURA DE DATOS GRAFOS
 Este script te ayuda a explorar el proyecto desde la línea de comandos.
 """
 
-import os
+import json
 import sys
+import time
 from pathlib import Path
 
 
+RAIZ = Path(__file__).resolve().parent
+
+# Estadísticas por archivo y medidas de los ejemplos, invalidadas por mtime
+ARCHIVO_CACHE = RAIZ / ".inicio_rapido_cache.json"
+
+# Ejemplos que se ejecutan en este mismo proceso: clave -> (descripción, módulo, función)
+EJEMPLOS = {
+    "cola": ("Ejemplos de Cola", "ejemplos_cola", "main"),
+    "grafos": ("Ejemplos de Grafos", "ejemplos_grafos", "main"),
+    "practicos": ("Ejemplos prácticos", "ejemplos_practicos", "main"),
+}
+
+
 def mostrar_banner():
     """Mostrar banner principal"""
     print("""
@@ -68,41 +82,296 @@ def mostrar_menu():
     print("─" * 60)
     
     opciones = [
-        ("1", "Ejecutar ejemplos de Cola", "python cola.py"),
-        ("2", "Ejecutar ejemplos de Grafos", "python grafos.py"),
-        ("3", "Ejecutar ejemplos prácticos", "python ejemplos_practicos.py"),
-        ("4", "Abrir página principal (navegador)", "start index.html"),
-        ("5", "Ver documentación", "cat README.md"),
-        ("6", "Ver guía GitHub Pages", "cat GITHUB_PAGES.md"),
-        ("7", "Listar archivos Python", "dir *.py"),
-        ("8", "Listar posts HTML", "dir posts/*.html"),
-        ("9", "Mostrar este menú", ""),
-        ("0", "Salir", ""),
+        ("1", "Ejecutar ejemplos de Cola"),
+        ("2", "Ejecutar ejemplos de Grafos"),
+        ("3", "Ejecutar ejemplos prácticos"),
+        ("4", "Ejecutar y medir todos los ejemplos (en paralelo)"),
+        ("5", "Abrir página principal (navegador)"),
+        ("6", "Ver documentación"),
+        ("7", "Ver guía GitHub Pages"),
+        ("8", "Listar archivos Python"),
+        ("9", "Listar posts HTML"),
+        ("e", "Mostrar estadísticas"),
+        ("m", "Mostrar este menú"),
+        ("0", "Salir"),
     ]
     
-    for num, descripcion, comando in opciones:
+    for num, descripcion in opciones:
         print(f"  {num} - {descripcion}")
 
 
 def ejecutar_comando(opcion):
-    """Ejecutar comando según opción seleccionada"""
+    """
+    Ejecutar comando según opción seleccionada
+    
+    Returns:
+        False si la opción es salir, True en otro caso
+    """
     comandos = {
-        "1": lambda: os.system("python cola.py"),
-        "2": lambda: os.system("python grafos.py"),
-        "3": lambda: os.system("python ejemplos_practicos.py"),
-        "4": lambda: os.system("start index.html"),
-        "5": lambda: os.system("type README.md | more"),
-        "6": lambda: os.system("type GITHUB_PAGES.md | more"),
-        "7": lambda: os.system("dir *.py"),
-        "8": lambda: os.system("dir posts\\*.html"),
-        "9": lambda: mostrar_menu(),
-        "0": lambda: (print("\n👋 ¡Hasta luego!"), exit(0)),
+        "1": lambda: ejecutar_ejemplos(["cola"]),
+        "2": lambda: ejecutar_ejemplos(["grafos"]),
+        "3": lambda: ejecutar_ejemplos(["practicos"]),
+        "4": lambda: ejecutar_ejemplos(list(EJEMPLOS), paralelo=True),
+        "5": lambda: abrir_navegador("index.html"),
+        "6": lambda: ver_documento("README.md"),
+        "7": lambda: ver_documento("GITHUB_PAGES.md"),
+        "8": lambda: listar("*.py"),
+        "9": lambda: listar("posts/*.html"),
+        "e": lambda: mostrar_estadisticas(),
+        "m": lambda: mostrar_menu(),
     }
     
+    if opcion == "0":
+        print("\n👋 ¡Hasta luego!")
+        return False
     if opcion in comandos:
         comandos[opcion]()
     else:
         print("❌ Opción inválida")
+    return True
+
+
+def abrir_navegador(archivo):
+    """Abre un archivo del proyecto en el navegador predeterminado"""
+    import webbrowser
+    
+    if not webbrowser.open((RAIZ / archivo).as_uri()):
+        print(f"❌ No se encontró un navegador; abre {RAIZ / archivo} manualmente")
+
+
+def ver_documento(archivo):
+    """Muestra un documento con el paginador del sistema (less, more...)"""
+    import pydoc
+    
+    pydoc.pager((RAIZ / archivo).read_text(encoding="utf-8"))
+
+
+def listar(patron):
+    """Lista los archivos del proyecto que cumplen un patrón glob"""
+    for ruta in sorted(RAIZ.glob(patron)):
+        print(f"  {ruta.relative_to(RAIZ)!s:40s} {ruta.stat().st_size / 1024:6.1f} KB")
+
+
+# ==================== EJECUCIÓN DE EJEMPLOS ====================
+
+def _medir_ejemplo(clave, capturar):
+    """
+    Importa y ejecuta un ejemplo midiendo tiempo y pico de memoria
+    
+    El tiempo incluye el coste de tracemalloc, que sigue cada reserva.
+    
+    Args:
+        clave: Clave de EJEMPLOS
+        capturar: True para devolver la salida en lugar de imprimirla
+    
+    Returns:
+        Diccionario {"salida", "segundos", "pico", "error"}
+    """
+    import importlib
+    import io
+    import tracemalloc
+    from contextlib import redirect_stdout
+    
+    _, modulo, funcion = EJEMPLOS[clave]
+    salida = io.StringIO() if capturar else sys.stdout
+    error = None
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    try:
+        with redirect_stdout(salida):
+            getattr(importlib.import_module(modulo), funcion)()
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    segundos = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return {
+        "salida": salida.getvalue() if capturar else "",
+        "segundos": segundos,
+        "pico": pico,
+        "error": error,
+    }
+
+
+def ejecutar_ejemplos(claves, paralelo=False):
+    """
+    Ejecuta ejemplos sin lanzar otro intérprete y guarda sus medidas
+    
+    Args:
+        claves: Claves de EJEMPLOS, en el orden en que se muestran
+        paralelo: True para ejecutar cada ejemplo en un proceso distinto;
+            la salida se captura y se imprime en orden al terminar
+    """
+    if paralelo and len(claves) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(max_workers=len(claves)) as pool:
+            medidas = list(pool.map(_medir_ejemplo, claves, [True] * len(claves)))
+    else:
+        medidas = [_medir_ejemplo(clave, capturar=False) for clave in claves]
+    
+    cache = _cargar_cache()
+    for clave, medida in zip(claves, medidas):
+        print(medida["salida"], end="")
+        descripcion, modulo, _ = EJEMPLOS[clave]
+        if medida["error"] is not None:
+            print(f"❌ {descripcion}: {medida['error']}")
+            continue
+        print(f"⏱  {descripcion}: {medida['segundos']:.3f} s, "
+              f"pico de memoria {medida['pico'] / 1024:.0f} KB")
+        cache["ejemplos"][clave] = {
+            "dependencias": _modulos_locales(modulo, cache["archivos"]),
+            "segundos": medida["segundos"],
+            "pico": medida["pico"],
+        }
+    _guardar_cache(cache)
+
+
+# ==================== ESTADÍSTICAS ====================
+
+def _mtime(ruta):
+    try:
+        return ruta.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _cargar_cache():
+    try:
+        cache = json.loads(ARCHIVO_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = {}
+    cache.setdefault("archivos", {})
+    cache.setdefault("ejemplos", {})
+    return cache
+
+
+def _guardar_cache(cache):
+    try:
+        ARCHIVO_CACHE.write_text(json.dumps(cache, indent=1), encoding="utf-8")
+    except OSError:
+        # Directorio de solo lectura: las estadísticas se recalcularán
+        pass
+
+
+def _analizar_archivo(ruta):
+    """Líneas del archivo y elementos que cuentan las estadísticas"""
+    texto = ruta.read_text(encoding="utf-8", errors="replace")
+    lineas = texto.splitlines()
+    datos = {
+        "lineas": len(lineas),
+        "codigo": texto.count("<pre"),
+        "diagramas": texto.count('class="diagram"'),
+        "tablas": texto.count("<table"),
+        "ejemplos": sum(linea.startswith("def ejemplo_") for linea in lineas),
+    }
+    if ruta.suffix == ".py":
+        datos["importa"] = _importaciones(texto)
+    return datos
+
+
+def _importaciones(texto):
+    """Módulos de primer nivel que importa un archivo Python"""
+    import ast
+    
+    try:
+        arbol = ast.parse(texto)
+    except SyntaxError:
+        return []
+    nombres = set()
+    for nodo in ast.walk(arbol):
+        if isinstance(nodo, ast.Import):
+            nombres.update(alias.name.split(".")[0] for alias in nodo.names)
+        elif isinstance(nodo, ast.ImportFrom) and nodo.module and not nodo.level:
+            nombres.add(nodo.module.split(".")[0])
+    return sorted(nombres)
+
+
+def _modulos_locales(modulo, archivos):
+    """
+    mtime de los archivos del proyecto de los que depende un módulo: el
+    suyo y los de los módulos locales que importa, directa o indirectamente
+    
+    Args:
+        modulo: Nombre del módulo
+        archivos: Estadísticas por archivo de la caché; se actualizan las
+            de los archivos que cambiaron
+    
+    Returns:
+        Diccionario {archivo: mtime}
+    """
+    pendientes = [modulo]
+    mtimes = {}
+    while pendientes:
+        nombre = f"{pendientes.pop()}.py"
+        ruta = RAIZ / nombre
+        if nombre in mtimes or not ruta.exists():
+            continue
+        mtime = mtimes[nombre] = _mtime(ruta)
+        datos = archivos.get(nombre)
+        if datos is None or datos["mtime"] != mtime or "importa" not in datos:
+            datos = archivos[nombre] = dict(_analizar_archivo(ruta), mtime=mtime)
+        pendientes.extend(datos["importa"])
+    return mtimes
+
+
+def calcular_estadisticas():
+    """
+    Estadísticas reales del proyecto
+    
+    Solo se vuelven a leer los archivos cuyo mtime cambió desde la última
+    vez; el resto sale de ARCHIVO_CACHE. Las medidas de un ejemplo siguen
+    vigentes mientras no cambie el mtime de su módulo ni el de los módulos
+    locales que importa.
+    
+    Returns:
+        Tupla (estadísticas, ejemplos): diccionario {métrica: valor} y
+        medidas vigentes {clave: {"segundos", "pico"}} de los ejemplos
+    """
+    cache = _cargar_cache()
+    anteriores = cache["archivos"]
+    archivos = {}
+    for patron in ("*.py", "*.html", "posts/*.html", "css/*.css"):
+        for ruta in RAIZ.glob(patron):
+            nombre = ruta.relative_to(RAIZ).as_posix()
+            mtime = _mtime(ruta)
+            datos = anteriores.get(nombre)
+            vigente = datos is not None and datos["mtime"] == mtime
+            if not vigente or (ruta.suffix == ".py" and "importa" not in datos):
+                datos = dict(_analizar_archivo(ruta), mtime=mtime)
+            archivos[nombre] = datos
+    
+    cambiado = archivos != anteriores
+    cache["archivos"] = archivos
+    
+    # Las medidas de un ejemplo caducan si se modifica su módulo o
+    # cualquier módulo local que importe (grafos.py, cola.py...)
+    ejemplos = {}
+    for clave, medida in list(cache["ejemplos"].items()):
+        if (clave in EJEMPLOS and
+                medida.get("dependencias") == _modulos_locales(EJEMPLOS[clave][1], archivos)):
+            ejemplos[clave] = medida
+        else:
+            del cache["ejemplos"][clave]
+            cambiado = True
+    if cambiado:
+        _guardar_cache(cache)
+    
+    python = [datos for nombre, datos in archivos.items() if nombre.endswith(".py")]
+    web = [datos for nombre, datos in archivos.items() if not nombre.endswith(".py")]
+    posts = [datos for nombre, datos in archivos.items() if nombre.startswith("posts/")]
+    estadisticas = {
+        "Artículos HTML": len(posts),
+        "Archivos Python": len(python),
+        "Líneas de código Python": sum(d["lineas"] for d in python),
+        "Líneas de HTML/CSS": sum(d["lineas"] for d in web),
+        "Ejemplos de código": sum(d["codigo"] for d in posts),
+        "Diagramas visuales": sum(d["diagramas"] for d in posts),
+        "Tablas comparativas": sum(d["tablas"] for d in posts),
+        "Aplicaciones demostradas": sum(d["ejemplos"] for d in python),
+    }
+    return estadisticas, ejemplos
 
 
 def mostrar_estadisticas():
@@ -110,19 +379,18 @@ def mostrar_estadisticas():
     print("\n📊 ESTADÍSTICAS DEL PROYECTO")
     print("─" * 60)
     
-    stats = {
-        "Artículos HTML": 4,
-        "Archivos Python": 3,
-        "Líneas de código Python": "~500",
-        "Líneas de HTML/CSS": "~1500",
-        "Ejemplos de código": "15+",
-        "Diagramas visuales": "10+",
-        "Tablas comparativas": "5+",
-        "Aplicaciones demostradas": 6,
-    }
-    
+    stats, ejemplos = calcular_estadisticas()
     for metrica, valor in stats.items():
         print(f"  • {metrica:.<40s} {str(valor):>15s}")
+    
+    print("\n  Última ejecución de los ejemplos:")
+    for clave, (descripcion, _, _) in EJEMPLOS.items():
+        medida = ejemplos.get(clave)
+        if medida is None:
+            valor = "sin medir (opción 4)"
+        else:
+            valor = f"{medida['segundos']:.3f} s, {medida['pico'] / 1024:.0f} KB"
+        print(f"  • {descripcion:.<40s} {valor:>15s}")
 
 
 def mostrar_contenido():
@@ -165,8 +433,6 @@ def mostrar_contenido():
 
 def main():
     """Función principal"""
-    os.chdir(os.path.dirname(os.path.abspath(__file__)))
-    
     mostrar_banner()
     listar_archivos()
     mostrar_estadisticas()
@@ -179,13 +445,13 @@ def main():
      - Lee la documentación en README.md
      - Ejecuta los ejemplos de Python
      - Abre el blog en tu navegador
-
+  
   2. Publica en GitHub Pages:
      - Lee GITHUB_PAGES.md
      - Crea un repositorio en GitHub
      - Sube el código
      - ¡Tu blog estará online!
-
+  
   3. Aprende:
      - Estudia los conceptos en el blog
      - Lee el código Python
@@ -200,10 +466,10 @@ def main():
     
     while True:
         try:
-            opcion = input("\n➜ ").strip()
-            if opcion:
-                ejecutar_comando(opcion)
-        except KeyboardInterrupt:
+            opcion = input("\n➜ ").strip().lower()
+            if opcion and not ejecutar_comando(opcion):
+                break
+        except (KeyboardInterrupt, EOFError):
             print("\n\n👋 ¡Hasta luego!")
             break
         except Exception as e:
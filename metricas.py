@@ -0,0 +1,168 @@
+"""
+Instrumentación Opcional de Grafos y Colas
+Cuenta nodos expandidos, aristas examinadas, tamaños máximos de frontera,
+pila y cola, y mide el tiempo de cada llamada. Desactivada no añade
+trabajo a los recorridos: los métodos medidos se sustituyen en el propio
+objeto solo mientras dura instrumentar(), y fuera se llama a la función
+original sin ninguna envoltura.
+"""
+
+import time
+from collections import defaultdict
+from functools import wraps
+
+
+class Metricas:
+    """
+    Acumulador de contadores, máximos y tiempos por método.
+    
+    Uso:
+        with instrumentar(grafo) as m:
+            grafo.bfs('A')
+        print(m.snapshot())
+    """
+    
+    def __init__(self):
+        self.contadores = defaultdict(int)
+        self.maximos = defaultdict(int)
+        self.llamadas = defaultdict(int)
+        self.segundos = defaultdict(float)
+        self.segundos_max = defaultdict(float)
+    
+    def sumar(self, clave, cantidad=1):
+        """Suma cantidad al contador clave"""
+        self.contadores[clave] += cantidad
+    
+    def maximo(self, clave, valor):
+        """Guarda valor si supera el máximo registrado para clave"""
+        if valor > self.maximos[clave]:
+            self.maximos[clave] = valor
+    
+    def registrar_llamada(self, nombre, segundos):
+        """Registra la duración de una llamada al método nombre"""
+        self.llamadas[nombre] += 1
+        self.segundos[nombre] += segundos
+        if segundos > self.segundos_max[nombre]:
+            self.segundos_max[nombre] = segundos
+    
+    def snapshot(self):
+        """
+        Retorna una copia de las métricas como diccionario
+        
+        Returns:
+            {"contadores": {...}, "maximos": {...},
+             "llamadas": {metodo: {"veces", "segundos", "segundos_max"}}}
+        """
+        return {
+            "contadores": dict(self.contadores),
+            "maximos": dict(self.maximos),
+            "llamadas": {
+                nombre: {
+                    "veces": veces,
+                    "segundos": self.segundos[nombre],
+                    "segundos_max": self.segundos_max[nombre],
+                }
+                for nombre, veces in self.llamadas.items()
+            },
+        }
+    
+    def reiniciar(self):
+        """Pone todas las métricas a cero"""
+        self.__init__()
+
+
+def instrumentar(*objetos, metricas=None):
+    """
+    Activa la instrumentación de grafos y colas dentro de un bloque with
+    
+    Args:
+        objetos: Grafos o colas a instrumentar
+        metricas: Metricas donde acumular (por defecto, una nueva)
+    
+    Returns:
+        Gestor de contexto cuyo with ... as entrega el objeto Metricas
+        compartido por todos los objetos
+    """
+    if metricas is None:
+        metricas = Metricas()
+    return _Instrumentacion(objetos, metricas)
+
+
+class _Instrumentacion:
+    """Gestor de contexto de instrumentar (sin contextlib, que es lento de importar)"""
+    
+    def __init__(self, objetos, metricas):
+        self.objetos = objetos
+        self.metricas = metricas
+        self.anteriores = None
+    
+    def __enter__(self):
+        # Por objeto: métricas anteriores y {método: atributo propio previo}
+        self.anteriores = []
+        for obj in self.objetos:
+            propios = vars(obj)
+            previos = {}
+            for nombre in _metodos_medidos(type(obj)):
+                previos[nombre] = propios.get(nombre, _SIN_ATRIBUTO)
+                setattr(obj, nombre, _version_medida(obj, getattr(type(obj), nombre)))
+            self.anteriores.append((obj._metricas, previos))
+            obj._metricas = self.metricas
+        return self.metricas
+    
+    def __exit__(self, *exc):
+        for obj, (anterior, previos) in zip(self.objetos, self.anteriores):
+            obj._metricas = anterior
+            for nombre, previo in previos.items():
+                if previo is _SIN_ATRIBUTO:
+                    delattr(obj, nombre)
+                else:
+                    setattr(obj, nombre, previo)
+
+
+# Marca de "el objeto no tenía el atributo" al instrumentar
+_SIN_ATRIBUTO = object()
+
+# Nombres de los métodos medidos de cada clase
+_medidos_por_clase = {}
+
+
+def medido(metodo):
+    """
+    Decorador: mide el tiempo de cada llamada mientras el objeto está
+    instrumentado
+    
+    Solo marca el método. instrumentar() pone en el objeto una versión
+    medida y la quita al salir, así que sin instrumentar se ejecuta la
+    función original sin un marco de más.
+    """
+    metodo._medido = True
+    return metodo
+
+
+def _metodos_medidos(clase):
+    """Nombres de los métodos marcados con medido (incluidos los heredados)"""
+    if clase not in _medidos_por_clase:
+        _medidos_por_clase[clase] = [
+            nombre for nombre in dir(clase)
+            if getattr(getattr(clase, nombre, None), "_medido", False)
+        ]
+    return _medidos_por_clase[clase]
+
+
+def _version_medida(obj, metodo):
+    """Método metodo ligado a obj que registra la duración de cada llamada"""
+    nombre = metodo.__qualname__
+    
+    @wraps(metodo)
+    def envoltura(*args, **kwargs):
+        metricas = obj._metricas
+        if metricas is None:
+            return metodo(obj, *args, **kwargs)
+        
+        inicio = time.perf_counter()
+        try:
+            return metodo(obj, *args, **kwargs)
+        finally:
+            metricas.registrar_llamada(nombre, time.perf_counter() - inicio)
+    
+    return envoltura
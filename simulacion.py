@@ -0,0 +1,345 @@
+"""
+Simulación de Colas por Eventos Discretos
+Varios servidores atienden una Cola (o una ColaConPrioridad si hay clases
+de clientes). Los eventos (llegadas y fines de servicio) se procesan en
+orden de tiempo con un montículo. Incluye una vía rápida para el caso
+M/M/c que usa NumPy si está instalado.
+"""
+
+import heapq
+import math
+import random
+
+from _numpy_opcional import cargar_numpy
+from cola import Cola, ColaConPrioridad
+
+
+# Tipos de evento; en un empate de tiempos se procesa antes el fin de servicio
+_FIN = 0
+_LLEGADA = 1
+
+
+# ==================== DISTRIBUCIONES ====================
+
+def exponencial(tasa):
+    """Tiempos exponenciales de media 1 / tasa (llegadas de Poisson)"""
+    return lambda rng: rng.expovariate(tasa)
+
+
+def constante(valor):
+    """Siempre el mismo tiempo"""
+    return lambda rng: valor
+
+
+def uniforme(minimo, maximo):
+    """Tiempos uniformes entre minimo y maximo"""
+    return lambda rng: rng.uniform(minimo, maximo)
+
+
+# ==================== INFORME ====================
+
+def _percentil(ordenados, p):
+    """Percentil p (0-100) con interpolación lineal, como numpy.percentile"""
+    if not ordenados:
+        return float('nan')
+    posicion = (len(ordenados) - 1) * p / 100
+    i = math.floor(posicion)
+    if i + 1 >= len(ordenados):
+        return ordenados[-1]
+    return ordenados[i] + (ordenados[i + 1] - ordenados[i]) * (posicion - i)
+
+
+class Informe:
+    """
+    Resultados de una simulación: esperas en cola, tiempo en el sistema,
+    utilización de los servidores y longitud máxima de la cola.
+    """
+    
+    def __init__(self, esperas, en_sistema, ocupado, duracion, servidores,
+                 max_cola=None, clases=None):
+        """
+        Args:
+            esperas: Espera en cola de cada cliente (lista o array de NumPy)
+            en_sistema: Espera más servicio de cada cliente
+            ocupado: Tiempo total de servicio sumado entre servidores
+            duracion: Instante en que termina el último servicio
+            servidores: Número de servidores
+            max_cola: Máximo de clientes esperando (None si no se midió)
+            clases: Prioridad de cada cliente (None si hay una sola clase)
+        """
+        self.esperas = esperas
+        self.en_sistema = en_sistema
+        self.clientes = len(esperas)
+        self.duracion = duracion
+        self.servidores = servidores
+        self.utilizacion = ocupado / (servidores * duracion) if duracion > 0 else 0.0
+        self.max_cola = max_cola
+        self.clases = clases
+    
+    def percentiles(self, ps=(50, 90, 99), medida="espera"):
+        """
+        Percentiles de la espera en cola o del tiempo en el sistema
+        
+        Args:
+            ps: Percentiles a calcular (0-100)
+            medida: "espera" o "sistema"
+        
+        Returns:
+            Diccionario {p: valor}
+        """
+        valores = self.esperas if medida == "espera" else self.en_sistema
+        return _percentiles(valores, ps)
+    
+    def resumen(self, ps=(50, 90, 99)):
+        """Diccionario con las medidas principales del informe"""
+        return {
+            "clientes": self.clientes,
+            "espera_media": _media(self.esperas),
+            "espera_percentiles": self.percentiles(ps),
+            "sistema_medio": _media(self.en_sistema),
+            "sistema_percentiles": self.percentiles(ps, "sistema"),
+            "utilizacion": self.utilizacion,
+            "max_cola": self.max_cola,
+            "duracion": self.duracion,
+        }
+    
+    def por_clase(self, ps=(50, 90, 99)):
+        """
+        Espera media y percentiles de cada clase de prioridad
+        
+        Returns:
+            Diccionario {prioridad: {"clientes", "espera_media", "espera_percentiles"}}
+        """
+        if self.clases is None:
+            return {}
+        grupos = {}
+        for clase, espera in zip(self.clases, self.esperas):
+            grupos.setdefault(clase, []).append(espera)
+        return {
+            clase: {
+                "clientes": len(esperas),
+                "espera_media": _media(esperas),
+                "espera_percentiles": _percentiles(esperas, ps),
+            }
+            for clase, esperas in sorted(grupos.items())
+        }
+    
+    def mostrar(self):
+        """Imprime el informe"""
+        resumen = self.resumen()
+        print(f"Clientes atendidos: {resumen['clientes']}")
+        print(f"Servidores: {self.servidores} (utilización {resumen['utilizacion']:.1%})")
+        print(f"Espera media en cola: {resumen['espera_media']:.3f}")
+        for p, valor in resumen["espera_percentiles"].items():
+            print(f"  p{p}: {valor:.3f}")
+        print(f"Tiempo medio en el sistema: {resumen['sistema_medio']:.3f}")
+        if self.max_cola is not None:
+            print(f"Máximo de clientes en cola: {self.max_cola}")
+        for clase, datos in self.por_clase().items():
+            print(f"  Prioridad {clase}: {datos['clientes']} clientes, "
+                  f"espera media {datos['espera_media']:.3f}")
+
+
+def _media(valores):
+    return sum(valores) / len(valores) if len(valores) else float('nan')
+
+
+def _percentiles(valores, ps):
+    np = cargar_numpy()
+    if np is not None and len(valores):
+        calculados = np.percentile(np.asarray(valores, dtype=float), ps)
+        return dict(zip(ps, calculados.tolist()))
+    ordenados = sorted(valores)
+    return {p: _percentil(ordenados, p) for p in ps}
+
+
+# ==================== SIMULADOR GENERAL ====================
+
+class Simulacion:
+    """
+    Simulación por eventos discretos de una cola con varios servidores.
+    
+    Los clientes llegan según la distribución de llegadas; si hay un
+    servidor libre se atienden en el acto y si no esperan en la cola
+    (FIFO, o por prioridad si se definen clases).
+    
+    Uso:
+        sim = Simulacion(exponencial(0.9), exponencial(1.0), servidores=2)
+        sim.ejecutar(100000).mostrar()
+    """
+    
+    def __init__(self, llegadas, servicio, servidores=1, prioridades=None, semilla=None):
+        """
+        Args:
+            llegadas: Distribución del tiempo entre llegadas (función rng -> tiempo)
+            servicio: Distribución del tiempo de servicio, o diccionario
+                {prioridad: distribución} si cada clase tiene la suya
+            servidores: Número de servidores que atienden la cola
+            prioridades: Diccionario {prioridad: proporción de clientes};
+                None para una sola clase FIFO
+            semilla: Semilla del generador aleatorio (reproducible)
+        
+        Raises:
+            ValueError: Si no hay servidores, o si servicio es un
+                diccionario y falta una distribución para alguna prioridad
+        """
+        if servidores < 1:
+            raise ValueError("Se necesita al menos un servidor")
+        if isinstance(servicio, dict):
+            if prioridades is None:
+                raise ValueError("Un servicio por clase (diccionario) necesita prioridades")
+            faltan = [p for p in prioridades if p not in servicio]
+            if faltan:
+                raise ValueError(f"Prioridades sin distribución de servicio: {faltan}")
+        self.llegadas = llegadas
+        self.servicio = servicio
+        self.servidores = servidores
+        self.prioridades = prioridades
+        self.semilla = semilla
+    
+    def ejecutar(self, clientes):
+        """
+        Simula la llegada y atención de un número de clientes
+        
+        Complejidad: O(n log n) con n clientes
+        
+        Returns:
+            Informe con esperas, tiempos en el sistema y utilización
+        """
+        rng = random.Random(self.semilla)
+        if self.prioridades is None:
+            cola = Cola(verboso=False)
+            clases = None
+        else:
+            cola = ColaConPrioridad(verboso=False)
+            niveles = list(self.prioridades)
+            proporciones = list(self.prioridades.values())
+            clases = rng.choices(niveles, proporciones, k=clientes)
+        
+        servicio = self.servicio
+        llegada = [0.0] * clientes
+        esperas = [0.0] * clientes
+        en_sistema = [0.0] * clientes
+        eventos = []
+        secuencia = 0
+        libres = self.servidores
+        ocupado = 0.0
+        max_cola = 0
+        ahora = 0.0
+        
+        def atender(cliente, ahora):
+            nonlocal ocupado, secuencia
+            distribucion = servicio[clases[cliente]] if isinstance(servicio, dict) else servicio
+            duracion = distribucion(rng)
+            esperas[cliente] = ahora - llegada[cliente]
+            en_sistema[cliente] = esperas[cliente] + duracion
+            ocupado += duracion
+            heapq.heappush(eventos, (ahora + duracion, _FIN, secuencia, cliente))
+            secuencia += 1
+        
+        if clientes:
+            heapq.heappush(eventos, (self.llegadas(rng), _LLEGADA, secuencia, 0))
+            secuencia += 1
+        
+        while eventos:
+            ahora, tipo, _, cliente = heapq.heappop(eventos)
+            if tipo == _LLEGADA:
+                llegada[cliente] = ahora
+                if cliente + 1 < clientes:
+                    heapq.heappush(eventos, (ahora + self.llegadas(rng), _LLEGADA,
+                                             secuencia, cliente + 1))
+                    secuencia += 1
+                
+                if libres:
+                    libres -= 1
+                    atender(cliente, ahora)
+                else:
+                    if clases is None:
+                        cola.enqueue(cliente)
+                    else:
+                        cola.enqueue(cliente, clases[cliente])
+                    max_cola = max(max_cola, cola.tamaño())
+            elif cola.esta_vacia():
+                libres += 1
+            else:
+                siguiente = cola.dequeue()
+                atender(siguiente if clases is None else siguiente[0], ahora)
+        
+        return Informe(esperas, en_sistema, ocupado, ahora, self.servidores,
+                       max_cola=max_cola, clases=clases)
+
+
+# ==================== VÍA RÁPIDA M/M/c ====================
+
+def mmc(tasa_llegada, tasa_servicio, servidores=1, clientes=1000000, semilla=None):
+    """
+    Simula una cola M/M/c FIFO (llegadas de Poisson, servicio exponencial)
+    
+    No necesita eventos: cada cliente empieza cuando llega o cuando queda
+    libre el primer servidor, lo que ocurra después. Con NumPy las
+    muestras se generan en bloque y, con un servidor, las esperas salen
+    de la recursión de Lindley con una suma y un máximo acumulados.
+    
+    Complejidad: O(n log c); O(n) vectorizado si c = 1
+    
+    Args:
+        tasa_llegada: Clientes que llegan por unidad de tiempo (λ)
+        tasa_servicio: Clientes que atiende cada servidor por unidad de tiempo (μ)
+        servidores: Número de servidores (c)
+        clientes: Número de clientes simulados
+        semilla: Semilla del generador aleatorio (reproducible)
+    
+    Returns:
+        Informe (sin longitud máxima de cola)
+    """
+    if servidores < 1:
+        raise ValueError("Se necesita al menos un servidor")
+    if clientes == 0:
+        return Informe([], [], 0.0, 0.0, servidores)
+    
+    np = cargar_numpy()
+    if np is None:
+        rng = random.Random(semilla)
+        entre = [rng.expovariate(tasa_llegada) for _ in range(clientes)]
+        servicio = [rng.expovariate(tasa_servicio) for _ in range(clientes)]
+        llegadas = []
+        ahora = 0.0
+        for intervalo in entre:
+            ahora += intervalo
+            llegadas.append(ahora)
+        esperas, duracion = _esperas_servidores(llegadas, servicio, servidores)
+        en_sistema = [w + s for w, s in zip(esperas, servicio)]
+        return Informe(esperas, en_sistema, math.fsum(servicio), duracion, servidores)
+    
+    rng = np.random.default_rng(semilla)
+    llegadas = np.cumsum(rng.exponential(1 / tasa_llegada, clientes))
+    servicio = rng.exponential(1 / tasa_servicio, clientes)
+    
+    if servidores == 1:
+        # Lindley: fin_n = max(llegada_n, fin_{n-1}) + s_n. Restando la suma
+        # de servicios S_n queda fin_n - S_n = max(llegada_n - S_{n-1}, ...),
+        # un máximo acumulado
+        acumulado = np.cumsum(servicio)
+        fines = np.maximum.accumulate(llegadas - (acumulado - servicio)) + acumulado
+        esperas = fines - servicio - llegadas
+        duracion = float(fines[-1])
+    else:
+        esperas, duracion = _esperas_servidores(llegadas.tolist(), servicio.tolist(),
+                                                servidores)
+        esperas = np.array(esperas)
+    
+    return Informe(esperas, esperas + servicio, float(servicio.sum()), duracion, servidores)
+
+
+def _esperas_servidores(llegadas, servicio, servidores):
+    """Esperas FIFO con c servidores usando un montículo de instantes libres"""
+    libres = [0.0] * servidores
+    esperas = []
+    anotar = esperas.append
+    reemplazar = heapq.heapreplace
+    for llegada, duracion in zip(llegadas, servicio):
+        libre = libres[0]
+        inicio = llegada if llegada > libre else libre
+        reemplazar(libres, inicio + duracion)
+        anotar(inicio - llegada)
+    return esperas, max(libres)
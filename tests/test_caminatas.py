@@ -0,0 +1,77 @@
+"""
+Pruebas de caminatas.py: las frecuencias observadas deben acercarse a las
+probabilidades de transición exactas, con NumPy y en Python puro
+"""
+
+import os
+import sys
+from collections import Counter
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import caminatas
+from caminatas import CaminatasAleatorias
+from grafos import GrafoListaAdyacencia
+
+
+@pytest.fixture(params=["numpy", "python"])
+def motor(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(caminatas, "cargar_numpy", lambda: None)
+    return request.param
+
+
+def _frecuencias(valores):
+    contador = Counter(valores)
+    total = sum(contador.values())
+    return {valor: n / total for valor, n in contador.items()}
+
+
+def test_muestreo_ponderado(motor):
+    grafo = GrafoListaAdyacencia(dirigido=True)
+    for v, peso in [('a', 1), ('b', 2), ('c', 3), ('d', 4)]:
+        grafo.agregar_arista('s', v, peso)
+    
+    generador = CaminatasAleatorias(grafo, ponderado=True, semilla=1)
+    muestras = generador.muestrear_vecinos(['s', 'a'], 20000)
+    assert muestras[1] == []
+    observadas = _frecuencias(muestras[0])
+    for v, peso in [('a', 1), ('b', 2), ('c', 3), ('d', 4)]:
+        assert abs(observadas[v] - peso / 10) < 0.02
+
+
+def test_caminatas_siguen_aristas(motor):
+    grafo = GrafoListaAdyacencia(dirigido=True)
+    for u, v in [(0, 1), (1, 2), (2, 0), (2, 3), (1, 3)]:
+        grafo.agregar_arista(u, v)
+    
+    for caminata in CaminatasAleatorias(grafo, semilla=2).generar([0] * 200, longitud=8):
+        assert caminata[0] == 0 and len(caminata) <= 9
+        assert all(grafo.existe_arista(u, v) for u, v in zip(caminata, caminata[1:]))
+        # Solo se detiene antes en el nodo sin salida
+        assert len(caminata) == 9 or caminata[-1] == 3
+    
+    # Con reinicio: cada paso sigue una arista o vuelve al inicio
+    for caminata in CaminatasAleatorias(grafo, reinicio=0.3, semilla=3).generar([0] * 200, longitud=8):
+        assert len(caminata) == 9
+        assert all(v == 0 or grafo.existe_arista(u, v) for u, v in zip(caminata, caminata[1:]))
+
+
+def test_sesgo_node2vec(motor):
+    grafo = GrafoListaAdyacencia(ponderado=False)
+    for u, v in [(0, 1), (0, 2), (1, 2), (1, 3)]:
+        grafo.agregar_arista(u, v)
+    p, q = 0.5, 4.0
+    
+    generador = CaminatasAleatorias(grafo, p=p, q=q, semilla=4)
+    segundos = [c[2] for c in generador.generar([0] * 30000, longitud=2) if c[1] == 1]
+    observadas = _frecuencias(segundos)
+    # Desde 1 habiendo llegado de 0: volver (1/p), vecino de 0 (1) o alejarse (1/q)
+    pesos = {0: 1 / p, 2: 1.0, 3: 1 / q}
+    total = sum(pesos.values())
+    for x, peso in pesos.items():
+        assert abs(observadas[x] - peso / total) < 0.02
@@ -0,0 +1,45 @@
+"""
+Pruebas de distancias.py: las distancias reparadas tras cada cambio deben
+coincidir con un BFS completo
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from distancias import DistanciasBFS
+from grafos import GrafoListaAdyacencia
+
+
+def test_reparacion_incremental_igual_que_bfs():
+    for dirigido in (False, True):
+        rng = random.Random(5)
+        grafo = GrafoListaAdyacencia(dirigido=dirigido)
+        grafo.agregar_arista(0, 1)
+        seguidas = DistanciasBFS(grafo, 0)
+        
+        # Solo inserciones: se reparan sin recalcular
+        for _ in range(150):
+            grafo.agregar_arista(rng.randrange(60), rng.randrange(60))
+            assert seguidas.alcanzables() == grafo.vecindario(0, len(grafo.grafo))
+        assert seguidas.recalculos == 1
+        
+        # Con eliminaciones
+        for _ in range(100):
+            u = rng.choice(list(grafo.grafo))
+            if grafo.grafo[u] and rng.random() < 0.4:
+                grafo.eliminar_arista(u, rng.choice(grafo.grafo[u]))
+            else:
+                grafo.agregar_arista(u, rng.randrange(60))
+            esperadas = grafo.vecindario(0, len(grafo.grafo))
+            assert seguidas.alcanzables() == esperadas
+            assert seguidas.distancia(59) == esperadas.get(59, float('inf'))
+        
+        seguidas.desconectar()
+
+
+if __name__ == "__main__":
+    test_reparacion_incremental_igual_que_bfs()
+    print("OK")
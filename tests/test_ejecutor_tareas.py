@@ -0,0 +1,104 @@
+"""
+Pruebas de ejecutor_tareas.py: orden topológico, camino crítico y
+ejecución respetando las dependencias
+"""
+
+import functools
+import os
+import random
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from ejecutor_tareas import caminos_criticos, ejecutar_tareas, orden_topologico
+from grafos import GrafoListaAdyacencia
+
+
+def _dag(nodos=30, aristas=60, semilla=4):
+    """DAG aleatorio: las aristas siguen una permutación de los nodos"""
+    rng = random.Random(semilla)
+    orden = list(range(nodos))
+    rng.shuffle(orden)
+    grafo = GrafoListaAdyacencia(dirigido=True, ponderado=False)
+    for nodo in orden:
+        grafo.grafo.setdefault(nodo, [])
+    for _ in range(aristas):
+        i, j = sorted(rng.sample(range(nodos), 2))
+        grafo.agregar_arista(orden[i], orden[j])
+    return grafo
+
+
+def _aristas(grafo):
+    return [(u, v) for u, vecinos in grafo.grafo.items() for v in vecinos]
+
+
+def test_orden_topologico():
+    grafo = _dag()
+    orden = orden_topologico(grafo)
+    posicion = {nodo: i for i, nodo in enumerate(orden)}
+    assert sorted(orden) == sorted(grafo.grafo)
+    assert all(posicion[u] < posicion[v] for u, v in _aristas(grafo))
+    
+    grafo.agregar_arista(orden[-1], orden[0])
+    with pytest.raises(ValueError):
+        orden_topologico(grafo)
+    with pytest.raises(ValueError):
+        orden_topologico(GrafoListaAdyacencia(dirigido=False))
+
+
+def test_caminos_criticos_como_el_camino_mas_largo():
+    grafo = _dag(nodos=15, aristas=30)
+    duraciones = {nodo: nodo % 4 + 1 for nodo in grafo.grafo}
+    
+    @functools.lru_cache(maxsize=None)
+    def mas_largo(nodo):
+        # Todos los caminos desde nodo, por fuerza bruta recursiva
+        return duraciones[nodo] + max((mas_largo(v) for v in grafo.grafo[nodo]), default=0)
+    
+    assert caminos_criticos(grafo, duraciones) == {nodo: mas_largo(nodo) for nodo in grafo.grafo}
+
+
+def test_ejecutar_tareas_respeta_dependencias():
+    grafo = _dag()
+    terminadas = set()
+    cerrojo = threading.Lock()
+    
+    def tarea(nodo):
+        with cerrojo:
+            # Todas sus dependencias ya terminaron
+            assert all(u in terminadas for u, v in _aristas(grafo) if v == nodo)
+            terminadas.add(nodo)
+        return nodo * 10
+    
+    informe = ejecutar_tareas(grafo, {n: functools.partial(tarea, n) for n in grafo.grafo},
+                              trabajadores=3)
+    assert informe["resultados"] == {n: n * 10 for n in grafo.grafo}
+    tiempos = informe["tareas"]
+    assert all(tiempos[u]["fin"] <= tiempos[v]["inicio"] for u, v in _aristas(grafo))
+    
+    ruta = informe["ruta_critica"]
+    assert all(grafo.existe_arista(u, v) for u, v in zip(ruta, ruta[1:]))
+    criticos = caminos_criticos(grafo)
+    assert len(ruta) == max(criticos.values())
+
+
+def test_ejecutar_tareas_en_procesos_y_errores():
+    grafo = _dag(nodos=8, aristas=10)
+    tareas = {n: functools.partial(pow, 2, n) for n in grafo.grafo}
+    informe = ejecutar_tareas(grafo, tareas, trabajadores=2, procesos=True)
+    assert informe["resultados"] == {n: 2 ** n for n in grafo.grafo}
+    
+    tareas[orden_topologico(grafo)[0]] = functools.partial(int, "no es un número")
+    with pytest.raises(ValueError, match="invalid literal"):
+        ejecutar_tareas(grafo, tareas, trabajadores=2)
+
+
+if __name__ == "__main__":
+    test_orden_topologico()
+    test_caminos_criticos_como_el_camino_mas_largo()
+    test_ejecutar_tareas_respeta_dependencias()
+    test_ejecutar_tareas_en_procesos_y_errores()
+    print("OK")
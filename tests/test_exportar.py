@@ -0,0 +1,83 @@
+"""
+Pruebas de exportar.py: una matriz dispersa y la misma matriz densa deben
+exportarse igual, y los pesos se escriben sin perder precisión
+"""
+
+import io
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from exportar import exportar_dot, exportar_graphml, exportar_json
+from grafos import GrafoListaAdyacencia, GrafoMatrizAdyacencia
+
+
+ARISTAS = [(0, 1, 4), (0, 2, 1), (1, 3, 2), (2, 3, 5), (3, 3, 7), (4, 0, 0)]
+
+
+def _matriz(dirigido, ponderado, densa):
+    grafo = GrafoMatrizAdyacencia(5, dirigido=dirigido, ponderado=ponderado,
+                                  densidad_maxima=0 if densa else 1.0)
+    for u, v, peso in ARISTAS:
+        grafo.agregar_arista(u, v, peso)
+    assert grafo.es_densa() == densa
+    return grafo
+
+
+def _exportado(exportar, grafo):
+    salida = io.StringIO()
+    exportar(grafo, salida)
+    return salida.getvalue()
+
+
+def test_dispersa_y_densa_exportan_igual():
+    for dirigido in (False, True):
+        for ponderado in (False, True):
+            dispersa = _matriz(dirigido, ponderado, densa=False)
+            densa = _matriz(dirigido, ponderado, densa=True)
+            for exportar in (exportar_dot, exportar_graphml, exportar_json):
+                assert _exportado(exportar, dispersa) == _exportado(exportar, densa), \
+                    (exportar.__name__, dirigido, ponderado)
+
+
+def test_diagonal_ponderada_no_es_lazo():
+    densa = _matriz(False, True, densa=True)
+    texto = _exportado(exportar_dot, densa)
+    assert '"0" -- "0"' not in texto
+    assert '"3" -- "3" [weight=7]' in texto
+
+
+def test_pesos_sin_perdida():
+    grafo = GrafoListaAdyacencia()
+    grafo.agregar_arista('a', 'b', 1234567)
+    grafo.agregar_arista('a', 'c', 0.1 + 0.2)
+    
+    mostrado = io.StringIO()
+    grafo.mostrar(mostrado)
+    mostrado = mostrado.getvalue()
+    assert "b(1234567)" in mostrado
+    assert "c(0.30000000000000004)" in mostrado
+    
+    dot = _exportado(exportar_dot, grafo)
+    for v in ('b', 'c'):
+        escrito = re.search(rf'"a" -- "{v}" \[weight=([^\]]+)\]', dot).group(1)
+        assert float(escrito) == grafo.obtener_peso('a', v)
+    assert '[weight=1234567]' in dot
+
+    matriz = GrafoMatrizAdyacencia(3, ponderado=True)
+    matriz.agregar_arista(0, 1, 2.5)
+    matriz.agregar_arista(1, 2, 3)
+    mostrado = io.StringIO()
+    matriz.mostrar(mostrado)
+    filas = mostrado.getvalue().splitlines()[3:]
+    assert filas[0].split() == ["0", "0", "2.5", "∞"]
+    assert filas[1].split() == ["1", "2.5", "0", "3"]
+
+
+if __name__ == "__main__":
+    test_dispersa_y_densa_exportan_igual()
+    test_diagonal_ponderada_no_es_lazo()
+    test_pesos_sin_perdida()
+    print("OK")
@@ -0,0 +1,88 @@
+"""
+Pruebas de flujo.py: el flujo máximo de Dinic debe coincidir con un
+Edmonds-Karp sencillo sobre una matriz de capacidades
+"""
+
+import os
+import random
+import sys
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from flujo import flujo_maximo
+from grafos import GrafoListaAdyacencia
+
+
+def _capacidades(grafo):
+    """{(u, v): capacidad total de las aristas u -> v}"""
+    capacidades = {}
+    for u in grafo.grafo:
+        for v, peso in grafo.aristas_de(u):
+            capacidades[u, v] = capacidades.get((u, v), 0) + peso
+    return capacidades
+
+
+def _edmonds_karp(capacidades, origen, destino):
+    residual = dict(capacidades)
+    valor = 0
+    while True:
+        padres = {origen: None}
+        cola = deque([origen])
+        while cola and destino not in padres:
+            u = cola.popleft()
+            for (a, b), c in residual.items():
+                if a == u and c > 0 and b not in padres:
+                    padres[b] = u
+                    cola.append(b)
+        if destino not in padres:
+            return valor
+        camino = []
+        v = destino
+        while padres[v] is not None:
+            camino.append((padres[v], v))
+            v = padres[v]
+        enviado = min(residual[arco] for arco in camino)
+        for u, v in camino:
+            residual[u, v] -= enviado
+            residual[v, u] = residual.get((v, u), 0) + enviado
+        valor += enviado
+
+
+def test_dinic_como_edmonds_karp():
+    rng = random.Random(8)
+    for dirigido in (True, False):
+        for _ in range(10):
+            grafo = GrafoListaAdyacencia(dirigido=dirigido)
+            for _ in range(30):
+                u, v = rng.sample(range(12), 2)
+                grafo.agregar_arista(u, v, rng.randint(0, 9))
+            capacidades = _capacidades(grafo)
+            
+            valor, flujos, corte = flujo_maximo(grafo, 0, 11)
+            assert valor == _edmonds_karp(capacidades, 0, 11)
+            
+            # Flujo válido: capacidades y conservación en los nodos internos
+            assert all(0 < f <= capacidades[arco] for arco, f in flujos.items())
+            balance = {}
+            for (u, v), f in flujos.items():
+                balance[u] = balance.get(u, 0) - f
+                balance[v] = balance.get(v, 0) + f
+            assert all(b == 0 for nodo, b in balance.items() if nodo not in (0, 11))
+            assert balance.get(11, 0) == valor
+            
+            # Corte mínimo: sus capacidades suman el flujo máximo
+            assert sum(capacidades[arco] for arco in set(corte)) == valor
+
+
+def test_casos_limite():
+    grafo = GrafoListaAdyacencia(dirigido=True)
+    grafo.agregar_arista('s', 'a', 3)
+    assert flujo_maximo(grafo, 's', 'z') == (0, {}, [])
+    assert flujo_maximo(grafo, 's', 'a') == (3, {('s', 'a'): 3}, [('s', 'a')])
+
+
+if __name__ == "__main__":
+    test_dinic_como_edmonds_karp()
+    test_casos_limite()
+    print("OK")
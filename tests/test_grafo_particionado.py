@@ -0,0 +1,57 @@
+"""
+Pruebas de grafo_particionado.py: con varios procesos, BFS y componentes
+deben coincidir con los de GrafoListaAdyacencia
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from grafo_particionado import GrafoParticionado
+from grafos import GrafoListaAdyacencia
+
+
+def _aleatorio(dirigido, nodos=120, aristas=150, semilla=3):
+    rng = random.Random(semilla)
+    grafo = GrafoListaAdyacencia(dirigido=dirigido)
+    for _ in range(aristas):
+        grafo.agregar_arista(f"n{rng.randrange(nodos)}", f"n{rng.randrange(nodos)}")
+    return grafo
+
+
+def _componentes(listas):
+    return {frozenset(componente) for componente in listas}
+
+
+def test_bfs_y_componentes_como_un_solo_proceso():
+    for dirigido in (False, True):
+        grafo = _aleatorio(dirigido)
+        with GrafoParticionado.desde_grafo(grafo, particiones=3, tam_lote=50) as particionado:
+            assert len(particionado._procesos) == 3
+            assert particionado.num_nodos() == len(grafo.grafo)
+            
+            for inicio in list(grafo.grafo)[:5]:
+                esperadas = grafo.vecindario(inicio, len(grafo.grafo))
+                assert particionado.distancias_bfs(inicio) == esperadas
+            
+            esperadas = (grafo.componentes_debilmente_conexas() if dirigido
+                         else grafo.componentes_conexas())
+            assert _componentes(particionado.componentes_conexas()) == _componentes(esperadas)
+
+
+def test_agregar_aristas_en_lotes():
+    with GrafoParticionado(particiones=2, tam_lote=2) as particionado:
+        for u, v in [('A', 'B'), ('B', 'C'), ('D', 'E'), ('C', 'A')]:
+            particionado.agregar_arista(u, v)
+        assert particionado.distancias_bfs('A') == {'A': 0, 'B': 1, 'C': 1}
+        assert _componentes(particionado.componentes_conexas()) == {
+            frozenset('ABC'), frozenset('DE')}
+        assert sorted(particionado.obtener_vecinos('B')) == [('A', 1), ('C', 1)]
+
+
+if __name__ == "__main__":
+    test_bfs_y_componentes_como_un_solo_proceso()
+    test_agregar_aristas_en_lotes()
+    print("OK")
@@ -0,0 +1,214 @@
+"""
+Pruebas de grafos.py: comportamiento de GrafoListaAdyacencia que no se ve
+en las demostraciones
+"""
+
+import os
+import pickle
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from grafos import GrafoListaAdyacencia, GrafoMatrizAdyacencia, InstantaneaGrafo
+
+
+def test_pesos_se_guardan_como_float():
+    grafo = GrafoListaAdyacencia()
+    grafo.agregar_arista('a', 'b', 1234567)
+    peso = grafo.obtener_peso('a', 'b')
+    assert peso == 1234567 and type(peso) is float
+    assert grafo.aristas_de('b') == [('a', 1234567.0)]
+    # obtener_vecinos conserva el formato (vecino, peso); grafo[nodo] son solo vecinos
+    assert grafo.obtener_vecinos('a') == [('b', 1234567.0)]
+    assert grafo.grafo['a'] == ['b']
+    
+    # Por encima de 2**53 el entero se redondea al double más cercano
+    grafo.agregar_arista('a', 'c', 2**53 + 1)
+    assert grafo.obtener_peso('a', 'c') == float(2**53)
+    
+    # Sin pesos, todas las aristas pesan el entero 1
+    grafo = GrafoListaAdyacencia(ponderado=False)
+    grafo.agregar_arista('a', 'b')
+    assert grafo.obtener_peso('a', 'b') == 1 and type(grafo.obtener_peso('a', 'b')) is int
+
+
+def test_subgrafo_conserva_el_orden_de_los_nodos():
+    grafo = GrafoListaAdyacencia()
+    for u, v in [('m', 'b'), ('m', 'x'), ('b', 'k'), ('x', 'a'), ('k', 'z')]:
+        grafo.agregar_arista(u, v)
+    
+    sub = grafo.subgrafo(['x', 'm', 'a', 'x', 'b'])
+    assert list(sub.grafo) == ['x', 'm', 'a', 'b']
+    assert sub.grafo['m'] == ['b', 'x']
+    
+    # La red ego sigue el orden del BFS, no el del hash de las cadenas
+    ego = grafo.subgrafo_ego('m', 2)
+    assert list(ego.grafo) == ['m', 'b', 'x', 'k', 'a']
+
+
+def test_instantanea_serializada_sigue_siendo_de_solo_lectura():
+    grafo = GrafoListaAdyacencia()
+    grafo.agregar_arista('a', 'b', 2.5)
+    instantanea = grafo.snapshot()
+    grafo.agregar_arista('a', 'c')
+    
+    for protocolo in (2, pickle.HIGHEST_PROTOCOL):
+        copia = pickle.loads(pickle.dumps(instantanea, protocol=protocolo))
+        assert type(copia) is InstantaneaGrafo
+        assert dict(copia.grafo) == {'a': ['b'], 'b': ['a']}
+        assert copia.obtener_peso('a', 'b') == 2.5
+        with pytest.raises(TypeError):
+            copia.agregar_arista('x', 'y')
+
+
+def _peso_camino(grafo, predecesores, origen, destino):
+    """Peso del camino que dan los predecesores (falla si forman un ciclo)"""
+    peso, actual = 0, destino
+    for _ in range(grafo.V):
+        if actual == origen:
+            return peso
+        anterior = predecesores[origen][actual]
+        peso += grafo.obtener_peso(anterior, actual)
+        actual = anterior
+    raise AssertionError(f"Ciclo en los predecesores de {origen} → {destino}")
+
+
+def test_floyd_warshall_bloques_con_pesos_cero():
+    np = pytest.importorskip("numpy")
+    
+    pequeño = GrafoMatrizAdyacencia(4, ponderado=True)
+    for u, v, peso in [(1, 3, 1), (3, 0, 0), (2, 1, 0)]:
+        pequeño.agregar_arista(u, v, peso)
+    
+    rng = random.Random(7)
+    grafos = [(pequeño, 2)]
+    for dirigido in (False, True):
+        grafo = GrafoMatrizAdyacencia(60, dirigido=dirigido, ponderado=True)
+        for _ in range(240):
+            grafo.agregar_arista(rng.randrange(60), rng.randrange(60), rng.randint(0, 5))
+        grafos.append((grafo, 16))
+    
+    for grafo, bloque in grafos:
+        esperadas, _ = grafo._floyd_warshall_clasico(True)
+        distancias, predecesores = grafo._floyd_warshall_bloques(np, True, bloque)
+        assert distancias == esperadas
+        assert all(type(d) is int for fila in distancias for d in fila if d != float('inf'))
+        for i in range(grafo.V):
+            for j in range(grafo.V):
+                if esperadas[i][j] == float('inf'):
+                    assert predecesores[i][j] is None
+                else:
+                    assert _peso_camino(grafo, predecesores, i, j) == esperadas[i][j]
+
+
+def _alcanzables(grafo, nodo):
+    return set(grafo.bfs(nodo))
+
+
+def test_componentes_fuertemente_conexas_y_condensado():
+    rng = random.Random(11)
+    grafo = GrafoListaAdyacencia(dirigido=True)
+    for _ in range(90):
+        grafo.agregar_arista(rng.randrange(50), rng.randrange(50))
+    
+    componentes = grafo.componentes_fuertemente_conexas()
+    alcanzables = {u: _alcanzables(grafo, u) for u in grafo.grafo}
+    esperadas = {frozenset(v for v in alcanzables[u] if u in alcanzables[v]) for u in grafo.grafo}
+    assert {frozenset(c) for c in componentes} == esperadas
+    assert sum(map(len, componentes)) == len(grafo.grafo)
+    
+    dag, componente_de = grafo.grafo_condensado()
+    esperadas = {(componente_de[u], componente_de[v]) for u in grafo.grafo
+                 for v in grafo.grafo[u] if componente_de[u] != componente_de[v]}
+    assert {(u, v) for u in dag.grafo for v in dag.grafo[u]} == esperadas
+    # Orden topológico: ninguna arista vuelve a una componente anterior
+    assert all(u < v for u, v in esperadas)
+    
+    # Sin recursión: un ciclo largo es una sola componente
+    ciclo = GrafoListaAdyacencia(dirigido=True)
+    for i in range(5000):
+        ciclo.agregar_arista(i, (i + 1) % 5000)
+    assert len(ciclo.componentes_fuertemente_conexas()) == 1
+
+
+def test_camino_mas_corto_bidireccional():
+    for dirigido in (False, True):
+        rng = random.Random(2)
+        grafo = GrafoListaAdyacencia(dirigido=dirigido)
+        for _ in range(70):
+            grafo.agregar_arista(rng.randrange(40), rng.randrange(40))
+        
+        for origen in list(grafo.grafo)[:10]:
+            esperadas = grafo.vecindario(origen, len(grafo.grafo))
+            for destino in grafo.grafo:
+                camino, saltos = grafo.camino_mas_corto(origen, destino)
+                if destino not in esperadas:
+                    assert (camino, saltos) == (None, float('inf'))
+                    continue
+                assert saltos == esperadas[destino] == len(camino) - 1
+                assert camino[0] == origen and camino[-1] == destino
+                assert all(grafo.existe_arista(u, v) for u, v in zip(camino, camino[1:]))
+
+
+def _esperado(aristas, dirigido, politica):
+    """{(u, v): peso} aplicando la política a las aristas repetidas"""
+    pesos = {}
+    for u, v, peso in aristas:
+        clave = (u, v) if dirigido else (min(u, v), max(u, v))
+        if clave not in pesos:
+            pesos[clave] = peso
+        elif politica == "sumar":
+            pesos[clave] += peso
+        elif politica == "minimo":
+            pesos[clave] = min(pesos[clave], peso)
+    return pesos
+
+
+def _pesos_del_grafo(grafo):
+    pesos = {}
+    for u in grafo.grafo:
+        for v, peso in grafo.aristas_de(u):
+            clave = (u, v) if grafo.dirigido else (min(u, v), max(u, v))
+            assert pesos.get(clave, peso) == peso
+            pesos[clave] = peso
+    return pesos
+
+
+def test_politicas_de_duplicadas_y_compactar():
+    rng = random.Random(6)
+    for dirigido in (False, True):
+        aristas = [(rng.randrange(8), rng.randrange(8), rng.randint(1, 9)) for _ in range(80)]
+        for politica in ("ignorar", "sumar", "minimo"):
+            esperado = _esperado(aristas, dirigido, politica)
+            
+            al_insertar = GrafoListaAdyacencia(dirigido=dirigido, duplicadas=politica)
+            multigrafo = GrafoListaAdyacencia(dirigido=dirigido)
+            for u, v, peso in aristas:
+                al_insertar.agregar_arista(u, v, peso)
+                multigrafo.agregar_arista(u, v, peso)
+            
+            assert _pesos_del_grafo(al_insertar) == esperado
+            for u, vecinos in al_insertar.grafo.items():
+                # Sin repetidas (un lazo no dirigido ocupa dos posiciones)
+                lazos = 0 if dirigido else vecinos.count(u) // 2
+                assert len(vecinos) == len(set(vecinos)) + lazos
+            
+            assert multigrafo.compactar(politica) == len(aristas) - len(esperado)
+            assert _pesos_del_grafo(multigrafo) == esperado
+            ordenados = {u: sorted(vecinos) for u, vecinos in al_insertar.grafo.items()}
+            assert ordenados == dict(multigrafo.grafo)
+            assert multigrafo.compactar() == 0
+
+
+if __name__ == "__main__":
+    test_pesos_se_guardan_como_float()
+    test_subgrafo_conserva_el_orden_de_los_nodos()
+    test_instantanea_serializada_sigue_siendo_de_solo_lectura()
+    test_floyd_warshall_bloques_con_pesos_cero()
+    test_componentes_fuertemente_conexas_y_condensado()
+    test_camino_mas_corto_bidireccional()
+    test_politicas_de_duplicadas_y_compactar()
+    print("OK")
@@ -0,0 +1,75 @@
+"""
+Presupuesto de tiempo de importación: `import grafos` y `import cola` se
+ejecutan en un intérprete nuevo, como en los procesos de corta vida que
+los usan, y deben quedar por debajo de unos pocos milisegundos.
+
+Se mide con -X importtime (tiempo acumulado del módulo, sin el arranque
+del intérprete) y se toma el mejor de varios intentos para no depender
+de la carga de la máquina. El presupuesto se puede cambiar con la
+variable de entorno PRESUPUESTO_IMPORTACION_MS.
+"""
+
+import os
+import subprocess
+import sys
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+PRESUPUESTO_MS = float(os.environ.get("PRESUPUESTO_IMPORTACION_MS", 15))
+INTENTOS = 5
+
+# Módulos que no deben cargarse al importar las estructuras de datos
+PESADOS = ("numpy", "typing", "concurrent.futures", "mmap", "ejemplos_grafos", "ejemplos_cola")
+
+
+def _entorno():
+    entorno = dict(os.environ)
+    # Con el bytecode en caché, como en un despliegue normal
+    entorno.pop("PYTHONDONTWRITEBYTECODE", None)
+    return entorno
+
+
+def _tiempo_importacion(modulo):
+    """Mejor tiempo acumulado (ms) de import modulo en un intérprete nuevo"""
+    mejor = float("inf")
+    for _ in range(INTENTOS + 1):
+        proceso = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+            cwd=RAIZ, env=_entorno(), capture_output=True, text=True, check=True,
+        )
+        for linea in proceso.stderr.splitlines():
+            campos = linea.split("|")
+            if len(campos) == 3 and campos[2].strip() == modulo and not campos[2][1:2].isspace():
+                mejor = min(mejor, int(campos[1]) / 1000)
+    return mejor
+
+
+def _cargados(modulo):
+    """Módulos presentes en sys.modules tras import modulo"""
+    codigo = f"import sys, {modulo}; print('\\n'.join(sys.modules))"
+    proceso = subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ, env=_entorno(),
+                             capture_output=True, text=True, check=True)
+    return set(proceso.stdout.split())
+
+
+def test_importar_grafos_dentro_del_presupuesto():
+    ms = _tiempo_importacion("grafos")
+    assert ms < PRESUPUESTO_MS, f"import grafos: {ms:.1f} ms (presupuesto {PRESUPUESTO_MS} ms)"
+
+
+def test_importar_cola_dentro_del_presupuesto():
+    ms = _tiempo_importacion("cola")
+    assert ms < PRESUPUESTO_MS, f"import cola: {ms:.1f} ms (presupuesto {PRESUPUESTO_MS} ms)"
+
+
+def test_importar_no_carga_modulos_pesados():
+    for modulo in ("grafos", "cola"):
+        pesados = _cargados(modulo).intersection(PESADOS)
+        assert not pesados, f"import {modulo} carga {sorted(pesados)}"
+
+
+if __name__ == "__main__":
+    for modulo in ("grafos", "cola"):
+        print(f"import {modulo}: {_tiempo_importacion(modulo):.1f} ms "
+              f"(presupuesto {PRESUPUESTO_MS} ms)")
+    test_importar_no_carga_modulos_pesados()
@@ -0,0 +1,58 @@
+"""
+Pruebas de metricas.py: sin instrumentar se llama a los métodos originales;
+dentro de instrumentar() se cuentan llamadas y recorridos
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cola import Cola
+from grafos import GrafoListaAdyacencia
+from metricas import instrumentar
+
+
+def _grafo():
+    grafo = GrafoListaAdyacencia()
+    for u, v in [('A', 'B'), ('B', 'C'), ('C', 'D')]:
+        grafo.agregar_arista(u, v)
+    return grafo
+
+
+def test_sin_instrumentar_no_hay_envoltura():
+    grafo = _grafo()
+    assert grafo.bfs.__func__ is GrafoListaAdyacencia.bfs
+    assert grafo.componentes_conexas.__func__ is GrafoListaAdyacencia.componentes_conexas
+    assert not any(callable(valor) for valor in vars(grafo).values())
+
+
+def test_instrumentar_mide_y_restaura():
+    grafo, cola = _grafo(), Cola(verboso=False)
+    with instrumentar(grafo, cola) as metricas:
+        assert grafo.dfs_iterativo('A') == ['A', 'B', 'C', 'D']
+        grafo.dfs_iterativo('D')
+        cola.enqueue(1)
+        cola.dequeue()
+        with instrumentar(grafo, metricas=metricas):
+            grafo.tiene_ciclo()
+        grafo.componentes_conexas()
+    
+    resumen = metricas.snapshot()
+    llamadas = resumen["llamadas"]
+    assert llamadas["GrafoListaAdyacencia.dfs_iterativo"]["veces"] == 2
+    assert llamadas["GrafoListaAdyacencia.tiene_ciclo"]["veces"] == 1
+    assert llamadas["GrafoListaAdyacencia.componentes_conexas"]["veces"] == 1
+    assert resumen["contadores"]["cola_encolados"] == 1
+    
+    # Al salir todo vuelve a ser como antes
+    assert grafo._metricas is None and cola._metricas is None
+    assert grafo.dfs_iterativo.__func__ is GrafoListaAdyacencia.dfs_iterativo
+    grafo.dfs_iterativo('B')
+    assert metricas.snapshot()["llamadas"]["GrafoListaAdyacencia.dfs_iterativo"]["veces"] == 2
+
+
+if __name__ == "__main__":
+    test_sin_instrumentar_no_hay_envoltura()
+    test_instrumentar_mide_y_restaura()
+    print("OK")
@@ -0,0 +1,27 @@
+"""
+Pruebas de simulacion.py: validación de las clases de servicio
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from simulacion import Simulacion, exponencial
+
+
+def test_servicio_por_clase_necesita_prioridades():
+    with pytest.raises(ValueError):
+        Simulacion(exponencial(0.9), {'a': exponencial(1.0)})
+    with pytest.raises(ValueError):
+        Simulacion(exponencial(0.9), {'a': exponencial(1.0)}, prioridades={'a': 1, 'b': 1})
+    
+    sim = Simulacion(exponencial(0.9), {'a': exponencial(1.0)}, prioridades={'a': 1}, semilla=1)
+    sim.ejecutar(100)
+
+
+if __name__ == "__main__":
+    test_servicio_por_clase_necesita_prioridades()
+    print("OK")
@@ -0,0 +1,277 @@
+"""
+Triángulos y Coeficiente de Agrupamiento
+Cuenta los triángulos de un grafo (tres nodos conectados entre sí) y
+calcula el coeficiente de agrupamiento local y global. Las aristas se
+orientan del nodo de menor grado al de mayor grado, de modo que cada
+triángulo se encuentra una sola vez y los nodos muy conectados no se
+recorren una y otra vez. Se ignoran el sentido de las aristas, los
+lazos y las aristas repetidas.
+"""
+
+from _numpy_opcional import cargar_numpy
+from grafos import GrafoMatrizAdyacencia
+
+
+# Máximo de caminos u -> v -> w que se comprueban a la vez con NumPy
+_CUÑAS_POR_BLOQUE = 1 << 21
+
+
+def triangulos_por_nodo(grafo, procesos=None):
+    """
+    Número de triángulos en los que participa cada nodo
+    
+    Complejidad: O(E · √E) con la orientación por grado
+    
+    Args:
+        grafo: GrafoListaAdyacencia o GrafoMatrizAdyacencia
+        procesos: Número de procesos (None o 1: secuencial)
+    
+    Returns:
+        Diccionario {nodo: triángulos}
+    """
+    nodos, triangulos, _ = _triangulos(grafo, procesos)
+    return dict(zip(nodos, triangulos))
+
+
+def contar_triangulos(grafo, procesos=None):
+    """Número total de triángulos del grafo"""
+    _, triangulos, _ = _triangulos(grafo, procesos)
+    # Cada triángulo se contó una vez por cada uno de sus tres nodos
+    return sum(triangulos) // 3
+
+
+def coeficientes_agrupamiento(grafo, procesos=None):
+    """
+    Coeficiente de agrupamiento local de cada nodo: fracción de pares
+    de vecinos que también son vecinos entre sí, 2T / (d (d - 1))
+    
+    Returns:
+        Diccionario {nodo: coeficiente}; 0 si el nodo tiene menos de 2 vecinos
+    """
+    nodos, triangulos, grados = _triangulos(grafo, procesos)
+    return {
+        nodo: 2 * t / (d * (d - 1)) if d > 1 else 0.0
+        for nodo, t, d in zip(nodos, triangulos, grados)
+    }
+
+
+def agrupamiento_global(grafo, procesos=None):
+    """
+    Transitividad: 3 × triángulos / caminos de longitud 2
+    
+    Returns:
+        Probabilidad de que dos vecinos de un nodo estén conectados
+    """
+    _, triangulos, grados = _triangulos(grafo, procesos)
+    cuñas = sum(d * (d - 1) // 2 for d in grados)
+    return sum(triangulos) / cuñas if cuñas else 0.0
+
+
+def _triangulos(grafo, procesos):
+    """
+    Returns:
+        Tupla (nodos, triángulos por nodo, grado simple por nodo)
+    """
+    if isinstance(grafo, GrafoMatrizAdyacencia):
+        return _triangulos_bits(grafo)
+    
+    nodos, grados, csr = _orientar(grafo)
+    return nodos, _contar(csr, procesos), grados
+
+
+# ==================== ORIENTACIÓN POR GRADO ====================
+
+def _orientar(grafo):
+    """
+    Orienta el grafo simple no dirigido de menor a mayor (grado, índice)
+    
+    Returns:
+        Tupla (nodos, grados, csr). Con NumPy csr es (n, indptr, destinos,
+        claves) de las aristas orientadas, con claves = u * n + v
+        ordenadas; sin NumPy es (n, None, salida, None) con salida[u] el
+        conjunto de vecinos hacia arriba de u.
+    """
+    nodos, indptr, indices, _ = grafo.exportar_csr()
+    n = len(nodos)
+    np = cargar_numpy()
+    
+    if np is not None:
+        indptr = np.frombuffer(indptr, dtype=np.int64)
+        destinos = np.frombuffer(indices, dtype=np.int64)
+        origenes = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+        distintos = origenes != destinos
+        origenes, destinos = origenes[distintos], destinos[distintos]
+        # Aristas sin sentido ni repeticiones, codificadas como u * n + v
+        claves = np.concatenate([origenes * n + destinos, destinos * n + origenes])
+        claves.sort()
+        claves = claves[np.diff(claves, prepend=-1) != 0]
+        origenes, destinos = claves // n, claves % n
+        grados = np.bincount(origenes, minlength=n)
+        rango = np.empty(n, dtype=np.int64)
+        rango[np.lexsort((np.arange(n), grados))] = np.arange(n)
+        
+        subida = rango[origenes] < rango[destinos]
+        origenes, destinos, claves = origenes[subida], destinos[subida], claves[subida]
+        salida = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(origenes, minlength=n), out=salida[1:])
+        return nodos, grados.tolist(), (n, salida, destinos, claves)
+    
+    vecinos = [set() for _ in range(n)]
+    for u in range(n):
+        for v in indices[indptr[u]:indptr[u + 1]]:
+            if u != v:
+                vecinos[u].add(v)
+                vecinos[v].add(u)
+    grados = [len(s) for s in vecinos]
+    orden = sorted(range(n), key=lambda u: (grados[u], u))
+    rango = [0] * n
+    for posicion, u in enumerate(orden):
+        rango[u] = posicion
+    salida = [{v for v in vecinos[u] if rango[v] > rango[u]} for u in range(n)]
+    return nodos, grados, (n, None, salida, None)
+
+
+def _contar(csr, procesos):
+    """Triángulos por nodo (lista indexada por posición)"""
+    n, indptr, salida, _ = csr
+    if indptr is None:
+        partes = procesos if procesos and procesos > 1 else 1
+        trozos = [range(i, n, partes) for i in range(partes)]
+        contar = _contar_python
+    else:
+        trozos = _bloques_numpy(indptr, salida, procesos)
+        contar = _contar_numpy
+    
+    if procesos is None or procesos <= 1 or len(trozos) < 2:
+        parciales = [contar(csr, trozo) for trozo in trozos]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_trabajador,
+                                 initargs=(csr,)) as pool:
+            parciales = list(pool.map(_contar_trabajador, [contar] * len(trozos), trozos))
+    
+    total = [0] * n
+    for parcial in parciales:
+        if not isinstance(parcial, list):
+            parcial = parcial.tolist()
+        for i, valor in enumerate(parcial):
+            total[i] += valor
+    return total
+
+
+def _contar_python(csr, nodos_trozo):
+    """Intersección de los conjuntos de vecinos hacia arriba: u < v < w"""
+    n, _, salida, _ = csr
+    triangulos = [0] * n
+    for u in nodos_trozo:
+        arriba = salida[u]
+        for v in arriba:
+            for w in arriba & salida[v]:
+                triangulos[u] += 1
+                triangulos[v] += 1
+                triangulos[w] += 1
+    return triangulos
+
+
+def _bloques_numpy(indptr, destinos, procesos):
+    """Rangos de aristas orientadas con un número parecido de cuñas u -> v -> w"""
+    np = cargar_numpy()
+    if len(destinos) == 0:
+        return []
+    cuñas = np.cumsum(np.diff(indptr)[destinos])
+    total = int(cuñas[-1])
+    partes = max(procesos or 1, -(-total // _CUÑAS_POR_BLOQUE))
+    cortes = np.searchsorted(cuñas, np.linspace(0, total, partes + 1)[1:-1], side='right')
+    limites = [0] + cortes.tolist() + [len(destinos)]
+    return [(a, b) for a, b in zip(limites, limites[1:]) if b > a]
+
+
+def _contar_numpy(csr, rango_aristas):
+    """
+    Para cada arista orientada u -> v y cada w de salida(v) comprueba si
+    existe u -> w con una búsqueda binaria en las claves ordenadas; es
+    la intersección de las listas ordenadas de u y v, vectorizada.
+    """
+    np = cargar_numpy()
+    n, indptr, destinos, claves = csr
+    inicio, fin = rango_aristas
+    
+    u = claves[inicio:fin] // n
+    v = destinos[inicio:fin]
+    grado_v = indptr[v + 1] - indptr[v]
+    uu = np.repeat(u, grado_v)
+    vv = np.repeat(v, grado_v)
+    desplazamiento = np.arange(len(uu)) - np.repeat(np.cumsum(grado_v) - grado_v, grado_v)
+    ww = destinos[indptr[vv] + desplazamiento]
+    
+    # Buscar en orden evita saltos aleatorios por la tabla de claves
+    buscadas = uu * n + ww
+    orden = np.argsort(buscadas)
+    posiciones = np.empty_like(orden)
+    posiciones[orden] = np.searchsorted(claves, buscadas[orden])
+    posiciones = np.minimum(posiciones, len(claves) - 1)
+    cierra = claves[posiciones] == buscadas
+    
+    return (np.bincount(uu[cierra], minlength=n) + np.bincount(vv[cierra], minlength=n)
+            + np.bincount(ww[cierra], minlength=n))
+
+
+_csr_trabajador = None
+
+
+def _iniciar_trabajador(csr):
+    global _csr_trabajador
+    _csr_trabajador = csr
+
+
+def _contar_trabajador(contar, trozo):
+    return contar(_csr_trabajador, trozo)
+
+
+# ==================== MATRIZ DE ADYACENCIA ====================
+
+def _vecinos_matriz(grafo):
+    """Vecinos sin sentido ni lazos de cada vértice de la matriz"""
+    vecinos = [set() for _ in range(grafo.V)]
+    for u in range(grafo.V):
+        for v in grafo._vecinos(u):
+            if u != v:
+                vecinos[u].add(v)
+                vecinos[v].add(u)
+    return vecinos
+
+
+def _unos(bits):
+    """Bits activos de un entero (int.bit_count solo existe desde Python 3.10)"""
+    return bin(bits).count("1")
+
+
+def _triangulos_bits(grafo):
+    """
+    Cada fila como entero de Python usado como conjunto de bits: los
+    vecinos comunes de u y v son bits[u] & bits[v], y el AND y el conteo
+    de bits recorren 64 vértices por palabra de máquina.
+    """
+    bits = []
+    for vecinos in _vecinos_matriz(grafo):
+        fila = 0
+        for v in vecinos:
+            fila |= 1 << v
+        bits.append(fila)
+    
+    triangulos = []
+    for u in range(grafo.V):
+        fila = bits[u]
+        comunes = 0
+        resto = fila
+        while resto:
+            # Recorre los bits activos de la fila de menor a mayor
+            bajo = resto & -resto
+            v = bajo.bit_length() - 1
+            comunes += _unos(fila & bits[v])
+            resto ^= bajo
+        # Cada triángulo de u aparece una vez por cada uno de sus dos vecinos
+        triangulos.append(comunes // 2)
+    grados = [_unos(fila) for fila in bits]
+    return list(range(grafo.V)), triangulos, grados